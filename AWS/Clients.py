@@ -0,0 +1,88 @@
+import boto3
+from botocore.config import Config
+
+from threading import Lock
+from typing import Optional, Dict, Tuple, Hashable
+
+# botocore's own default, which is too small for the concurrent uploads and invocations made here
+DEFAULT_POOL_CONNECTIONS = 10
+
+_lock = Lock()
+_sessions: Dict[Optional[str], boto3.Session] = dict()
+_clients: Dict[Tuple, object] = dict()
+
+
+def client(service: str,
+           client_kwargs: Optional[dict] = None,
+           max_pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+           profile_name: Optional[str] = None):
+    """
+    Returns a boto3 client for the given service, shared by every caller in the process that asks for the
+    same service with the same client kwargs.  Clients are thread-safe once built, but building them is
+    not, so construction is serialized.  Asking for a larger connection pool than an existing client has
+    replaces it with one that is large enough.  Clients are only shared when their kwargs are plain values,
+    containers of them or botocore Configs, which are compared by the options they were given; clients with
+    any other kwargs are built afresh every time.
+
+    :param service: The name of the AWS service, e.g. "s3" or "lambda".
+    :param client_kwargs: Optional.  Keyword arguments for the construction of the client, as returned by
+    Configuration.get_client_args().
+    :param max_pool_connections: The minimum number of connections the client should keep open; this should
+    be at least the number of threads that will use it at once.
+    :param profile_name: Optional.  The AWS profile whose session should build the client.
+    """
+    kwargs = dict(client_kwargs) if client_kwargs else dict()
+    try:
+        key = (service, profile_name, _freeze(kwargs))
+    except TypeError:
+        key = None
+    with _lock:
+        existing = _clients.get(key) if key is not None else None
+        if existing is not None and existing.meta.config.max_pool_connections >= max_pool_connections:
+            return existing
+
+        pool = Config(max_pool_connections=max(max_pool_connections, DEFAULT_POOL_CONNECTIONS))
+        kwargs["config"] = kwargs["config"].merge(pool) if kwargs.get("config") is not None else pool
+        created = _session(profile_name).client(service, **kwargs)
+        if key is not None:
+            _clients[key] = created
+        return created
+
+
+def session(profile_name: Optional[str] = None) -> boto3.Session:
+    """
+    Returns the process-wide boto3 session for the given profile (or the default one).
+    """
+    with _lock:
+        return _session(profile_name)
+
+
+def clear():
+    """
+    Forgets every cached session and client, e.g. after the stored AWS configuration has changed.
+    """
+    with _lock:
+        _sessions.clear()
+        _clients.clear()
+
+
+#
+
+
+def _session(profile_name: Optional[str]) -> boto3.Session:
+    if profile_name not in _sessions:
+        _sessions[profile_name] = boto3.Session() if not profile_name else boto3.Session(profile_name=profile_name)
+    return _sessions[profile_name]
+
+
+def _freeze(value) -> Hashable:
+    # A hashable value that is equal for equal arguments, or a TypeError if there is no telling
+    if isinstance(value, (str, int, float, bool, type(None))):
+        return value
+    if isinstance(value, dict):
+        return dict, tuple(sorted(((k, _freeze(v)) for k, v in value.items()), key=lambda item: str(item[0])))
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(_freeze(v) for v in value)
+    if isinstance(value, Config):
+        return Config, _freeze(value._user_provided_options)
+    raise TypeError(f"Cannot compare client arguments of type {type(value).__name__}")
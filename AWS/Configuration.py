@@ -1,8 +1,12 @@
-import boto3
+from AWS import Clients
 
-from typing import Optional
+from threading import Lock
+from typing import Optional, Dict
 import os
 
+_lock = Lock()
+_configurations: Dict[Optional[str], Optional[dict]] = dict()
+
 
 def is_aws_configured(profile_name: Optional[str] = None):
     credentials = get_configuration(profile_name)
@@ -11,7 +15,19 @@ def is_aws_configured(profile_name: Optional[str] = None):
 
 
 def get_configuration(profile_name: Optional[str] = None) -> Optional[dict]:
-    session = boto3.Session() if not profile_name else boto3.Session(profile_name=profile_name)
+    """
+    Loads the stored AWS configuration for the given profile.  The lookup is made once per profile and
+    remembered for the life of the process, until set_configuration() changes it.
+    """
+    with _lock:
+        if profile_name not in _configurations:
+            _configurations[profile_name] = _load_configuration(profile_name)
+        configuration = _configurations[profile_name]
+    return dict(configuration) if configuration is not None else None
+
+
+def _load_configuration(profile_name: Optional[str]) -> Optional[dict]:
+    session = Clients.session(profile_name)
     credentials = session.get_credentials()
 
     if not credentials:
@@ -37,6 +53,9 @@ def set_configuration(access_key: str,
     result = os.system(f"aws configure%s\n{access_key}\n{secret_key}%s\n\n" %
                        (f" --profile {profile_name}" if profile_name else "",
                         region + "\n" if region else ""))
+    with _lock:
+        _configurations.clear()
+    Clients.clear()
     return result == 0
 
 
@@ -1,18 +1,23 @@
 from Interfaces import LogMethod, LogLevel
-from AWS import S3
+from AWS import S3, Package, Clients
+from Errors.AWSError import AWSError
 
 import os
-import boto3
-import zipfile
 import json
 import toml
 import base64
 import shutil
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from typing import Optional, Iterable, Tuple, Dict, Union
+from typing import Optional, Iterable, Tuple, Dict, Union, List
 
 PRE_PACKAGED_MODULES = ["boto3", "botocore", "jmespath", "python-dateutil", "urllib3",
                         "s3transfer", "Jinja2", "MarkupSafe", "wheel", "six"]
+DEPENDENCIES_STAMP = ".dependencies.sha256"
+PRECOMPILED_STAMP = ".precompiled.sha256"
+STAGING_SUFFIX = "_src"
 
 
 def publish(lambda_name: str,
@@ -31,6 +36,10 @@ def publish(lambda_name: str,
             aws_client_kwargs: Optional[dict] = None,
             skip_dependencies: bool = False,
             skip_package_upload: bool = False,
+            force_update: bool = False,
+            prune_rules: Optional[List[str]] = None,
+            precompile: bool = True,
+            python_version: Optional[str] = None,
             local_libs: Dict[str, str] = None,
             cwd: Optional[str] = None,
             logger: LogMethod = LogMethod.null):
@@ -39,27 +48,17 @@ def publish(lambda_name: str,
         os.chdir(cwd)
 
     if not skip_package_upload:
-        if not skip_dependencies:
-            logger("Packaging dependencies", heading="Lambda", level=LogLevel.VERBOSE)
-            package_dependencies(build_dir=build_dir,
-                                 requirements_file=requirements_file,
-                                 cwd=None,
-                                 delete_lock=delete_lock,
-                                 logger=logger)
-
-        if local_libs is not None and len(local_libs) > 0:
-            logger("Copying local libraries", heading="Lambda", level=LogLevel.VERBOSE)
-            copy_local_libs(build_dir=build_dir,
-                            cwd=None,
-                            local_libs=local_libs,
-                            logger=logger)
-
-        logger("Zipping package contents", heading="Lambda", level=LogLevel.VERBOSE)
-        zip_everything(package_file=package_file,
-                       build_dir=build_dir,
-                       src_dir=src_dir,
-                       cwd=None,
-                       logger=logger)
+        build_package(build_dir=build_dir,
+                      src_dir=src_dir,
+                      requirements_file=requirements_file,
+                      package_file=package_file,
+                      delete_lock=delete_lock,
+                      skip_dependencies=skip_dependencies,
+                      prune_rules=prune_rules,
+                      precompile=precompile,
+                      python_version=python_version,
+                      local_libs=local_libs,
+                      logger=logger)
 
     logger("Updating AWS function", heading="Lambda", level=LogLevel.VERBOSE)
     upload_to_lambda(lambda_name=lambda_name,
@@ -72,11 +71,166 @@ def publish(lambda_name: str,
                      publish_after=publish_after,
                      dry_run=dry_run,
                      skip_package_upload=skip_package_upload,
+                     force_update=force_update,
                      cwd=None,
                      client_kwargs=aws_client_kwargs,
                      logger=logger)
 
 
+def publish_many(manifest_file: str,
+                 handler: str = "main.handler",
+                 build_dir: str = "_build",
+                 src_dir: str = "src",
+                 requirements_file: str = "requirements.txt",
+                 environment_file: str = "local.env",
+                 tags_file: str = "tags.toml",
+                 package_file: str = "package.zip",
+                 code_bucket: str = "sprelf-lambda-zips",
+                 code_bucket_path: str = "",
+                 publish_after: bool = True,
+                 dry_run: bool = False,
+                 delete_lock: bool = False,
+                 aws_client_kwargs: Optional[dict] = None,
+                 skip_dependencies: bool = False,
+                 skip_package_upload: bool = False,
+                 force_update: bool = False,
+                 prune_rules: Optional[List[str]] = None,
+                 precompile: bool = True,
+                 python_version: Optional[str] = None,
+                 local_libs: Dict[str, str] = None,
+                 max_workers: int = 8,
+                 cwd: Optional[str] = None,
+                 logger: LogMethod = LogMethod.null) -> Dict[str, Optional[Exception]]:
+    """
+    Publishes every function listed in a TOML manifest from one shared package.  The package is built
+    once, and then every function is uploaded and updated concurrently.  The manifest holds a [defaults]
+    table and a [[functions]] array of tables; each function needs a "name" and may override "handler",
+    "environment_file", "tags_file", "code_bucket" and "code_bucket_path" from the defaults.  Any of those
+    the manifest's defaults leave out are taken from the arguments of the same names.
+
+    :return: The functions' names, mapped to the exception that failed their update, or None.
+    """
+    if cwd:
+        os.chdir(cwd)
+
+    with open(manifest_file, "r", encoding="utf-8") as f:
+        manifest = toml.load(f)
+    defaults = {"handler": handler, "environment_file": environment_file, "tags_file": tags_file,
+                "code_bucket": code_bucket, "code_bucket_path": code_bucket_path,
+                **manifest.get("defaults", dict())}
+    functions = [{**defaults, **function} for function in manifest.get("functions", [])]
+    if not functions:
+        raise AWSError(f"No functions listed in manifest '{manifest_file}'")
+
+    if not skip_package_upload:
+        build_package(build_dir=build_dir,
+                      src_dir=src_dir,
+                      requirements_file=requirements_file,
+                      package_file=package_file,
+                      delete_lock=delete_lock,
+                      skip_dependencies=skip_dependencies,
+                      prune_rules=prune_rules,
+                      precompile=precompile,
+                      python_version=python_version,
+                      local_libs=local_libs,
+                      logger=logger)
+
+    def update(function: dict):
+        upload_to_lambda(lambda_name=function["name"],
+                         handler=function["handler"],
+                         package_file=package_file,
+                         environment_file=function["environment_file"],
+                         code_bucket=function["code_bucket"],
+                         code_bucket_path=function["code_bucket_path"],
+                         tags_file=function["tags_file"],
+                         publish_after=publish_after,
+                         dry_run=dry_run,
+                         skip_package_upload=skip_package_upload,
+                         force_update=force_update,
+                         cwd=None,
+                         client_kwargs=aws_client_kwargs,
+                         logger=LogMethod.logger_with_kwargs(logger, function=function["name"]))
+
+    logger(f"Updating {len(functions)} AWS functions", heading="Lambda", level=LogLevel.VERBOSE)
+    Clients.client('lambda', aws_client_kwargs, max_pool_connections=max_workers)  # shared by every update
+    results: Dict[str, Optional[Exception]] = dict()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(update, function): function["name"] for function in functions}
+        for future in as_completed(futures):
+            name = futures[future]
+            results[name] = future.exception()
+            if results[name] is not None:
+                logger(f"Failed to update '{name}': {results[name]}", heading="Lambda", level=LogLevel.ERROR)
+            else:
+                logger(f"Updated '{name}'", heading="Lambda", level=LogLevel.INFO)
+    return results
+
+
+#
+
+
+def build_package(build_dir: str,
+                  src_dir: str,
+                  requirements_file: str,
+                  package_file: str,
+                  delete_lock: bool = False,
+                  skip_dependencies: bool = False,
+                  prune_rules: Optional[List[str]] = None,
+                  precompile: bool = True,
+                  python_version: Optional[str] = None,
+                  local_libs: Dict[str, str] = None,
+                  logger: LogMethod = LogMethod.null):
+    if not skip_dependencies:
+        logger("Packaging dependencies", heading="Lambda", level=LogLevel.VERBOSE)
+        package_dependencies(build_dir=build_dir,
+                             requirements_file=requirements_file,
+                             cwd=None,
+                             delete_lock=delete_lock,
+                             logger=logger)
+
+    if local_libs is not None and len(local_libs) > 0:
+        logger("Copying local libraries", heading="Lambda", level=LogLevel.VERBOSE)
+        copy_local_libs(build_dir=build_dir,
+                        cwd=None,
+                        local_libs=local_libs,
+                        logger=logger)
+
+    python_version = python_version if python_version else target_python_version()
+
+    if precompile:
+        # The bytecode is compiled into a staging copy of the source, never into the source tree itself: it
+        # is validated by unchecked hashes, so local runs would otherwise keep importing it after any edit.
+        staging_dir = stage_sources(src_dir, build_dir, logger=logger)
+        logger(f"Precompiling bytecode for Python {python_version}", heading="Lambda", level=LogLevel.VERBOSE)
+        # The staged sources and local libraries are copied afresh every time, but the dependencies are only
+        # recompiled when they have been reinstalled, or are compiled for a different version.
+        stamp_file = os.path.join(build_dir, PRECOMPILED_STAMP)
+        digest = precompiled_digest(build_dir, python_version)
+        if digest is not None and _read_stamp(stamp_file) == digest:
+            logger("Dependencies are already compiled, only compiling the sources", heading="Lambda",
+                   level=LogLevel.VERBOSE, log_depth=1)
+            directories = [os.path.join(build_dir, lib) for lib in (local_libs or dict())] + [staging_dir]
+        else:
+            directories = [build_dir, staging_dir]
+        if os.path.exists(stamp_file):
+            os.remove(stamp_file)
+        if not Package.precompile(directories, python_version, logger=logger):
+            raise AWSError(f"Failed to precompile the package for Python {python_version}")
+        if digest is not None:
+            with open(stamp_file, "w", encoding="utf-8") as f:
+                f.write(digest)
+        src_dir = staging_dir
+
+    logger("Zipping package contents", heading="Lambda", level=LogLevel.VERBOSE)
+    zip_everything(package_file=package_file,
+                   build_dir=build_dir,
+                   src_dir=src_dir,
+                   prune_rules=prune_rules,
+                   python_version=python_version,
+                   cwd=None,
+                   logger=logger)
+
+
 #
 
 
@@ -92,6 +246,17 @@ def package_dependencies(build_dir: str, requirements_file: str,
     except OSError:
         pass
 
+    # The installed dependencies are reused for as long as the Pipfile and its lock are unchanged.
+    stamp_file = os.path.join(build_dir, DEPENDENCIES_STAMP)
+    digest = Package.files_digest(["Pipfile", "Pipfile.lock"], *PRE_PACKAGED_MODULES)
+    if os.path.exists(stamp_file):
+        with open(stamp_file, "r", encoding="utf-8") as f:
+            if f.read().strip() == digest:
+                logger("Dependencies are unchanged, reusing the previous build", heading="Lambda",
+                       level=LogLevel.VERBOSE, log_depth=1)
+                return
+        os.remove(stamp_file)
+
     os.system(f"pipenv lock -r > \"{requirements_file}\"")
 
     with open(requirements_file, "r", encoding="utf-8") as f:
@@ -114,6 +279,18 @@ def package_dependencies(build_dir: str, requirements_file: str,
     if delete_lock and os.path.exists("Pipfile.lock"):
         os.remove("Pipfile.lock")
 
+    with open(stamp_file, "w", encoding="utf-8") as f:
+        f.write(Package.files_digest(["Pipfile", "Pipfile.lock"], *PRE_PACKAGED_MODULES))
+
+
+def precompiled_digest(build_dir: str, python_version: str) -> Optional[str]:
+    """
+    Identifies the dependencies in a build directory, as compiled for the given Python version, by the stamp
+    they were installed with.  Returns None if there is no stamp, in which case they can't be told apart.
+    """
+    stamp = _read_stamp(os.path.join(build_dir, DEPENDENCIES_STAMP))
+    return Package.files_digest([], stamp, python_version) if stamp is not None else None
+
 
 #
 
@@ -136,25 +313,57 @@ def copy_local_libs(build_dir: str,
 #
 
 
+def stage_sources(src_dir: str, build_dir: str,
+                  logger: LogMethod = LogMethod.null) -> str:
+    """
+    Copies the source directory, without any bytecode cached by local runs, to a staging directory next to the
+    build directory, replacing any previous copy.  Returns the staging directory.
+    """
+    staging_dir = os.path.normpath(build_dir) + STAGING_SUFFIX
+    logger(f"Staging {src_dir} in {staging_dir}", heading="Lambda", level=LogLevel.VERBOSE, log_depth=1)
+    if os.path.exists(staging_dir):
+        shutil.rmtree(staging_dir)
+    shutil.copytree(src_dir, staging_dir, ignore=shutil.ignore_patterns("__pycache__", "*.pyc"))
+    return staging_dir
+
+
 def zip_everything(package_file: str, build_dir: str, src_dir: str,
+                   prune_rules: Optional[List[str]] = None,
+                   python_version: Optional[str] = None,
                    cwd: Optional[str] = None,
                    logger: LogMethod = LogMethod.null):
     if cwd:
         os.chdir(cwd)
 
-    if os.path.exists(package_file):
-        os.remove(package_file)
-
-    with zipfile.ZipFile(package_file, mode="w") as zf:
-        _add_dir_to_zip(zf, build_dir)
-        _add_dir_to_zip(zf, src_dir)
-
-
-def _add_dir_to_zip(zf: zipfile.ZipFile, directory: str):
-    for root, dirs, files in os.walk(directory):
-        relative_root = root[len(directory):].strip(os.path.sep)
-        for name in files:
-            zf.write(os.path.join(root, name), arcname=os.path.join(relative_root, name))
+    entries = [(arcname, path) for arcname, path in Package.collect(build_dir, src_dir)
+               if arcname not in (DEPENDENCIES_STAMP, PRECOMPILED_STAMP)]
+    kept = Package.prune(entries,
+                         prune_rules if prune_rules is not None else Package.DEFAULT_PRUNE_RULES,
+                         python_version=python_version)
+
+    before, after = Package.summarize(entries), Package.summarize(kept)
+    logger(f"Pruned {before[0] - after[0]} of {before[0]} files "
+           f"({(before[1] - after[1]) / 1e6:.2f} of {before[1] / 1e6:.2f} MB)",
+           heading="Lambda", level=LogLevel.VERBOSE, log_depth=1)
+
+    previous_size = os.path.getsize(package_file) if os.path.exists(package_file) else None
+    Package.build_zip(package_file, kept, logger=logger)
+    size = os.path.getsize(package_file)
+    logger(f"Package is {size / 1e6:.2f} MB"
+           + (f" ({(size - previous_size) / 1e6:+.2f} MB)" if previous_size is not None else ""),
+           heading="Lambda", level=LogLevel.VERBOSE, log_depth=1)
+
+
+def target_python_version(pipfile: str = "Pipfile") -> str:
+    """
+    Reads the Python version the function runs on from the Pipfile, falling back to the current one.
+    """
+    if os.path.exists(pipfile):
+        with open(pipfile, "r", encoding="utf-8") as f:
+            version = toml.load(f).get("requires", dict()).get("python_version")
+        if version:
+            return str(version)
+    return "%d.%d" % sys.version_info[:2]
 
 
 #
@@ -170,13 +379,14 @@ def upload_to_lambda(lambda_name: str,
                      publish_after: bool = True,
                      dry_run: bool = False,
                      skip_package_upload: bool = False,
+                     force_update: bool = False,
                      cwd: Optional[str] = None,
                      client_kwargs: Optional[dict] = None,
                      logger: LogMethod = LogMethod.null):
     if cwd:
         os.chdir(cwd)
 
-    lamb = boto3.client('lambda', **(client_kwargs if client_kwargs else dict()))
+    lamb = Clients.client('lambda', client_kwargs)
 
     #
 
@@ -188,23 +398,32 @@ def upload_to_lambda(lambda_name: str,
     zip_name = lambda_name + ".zip"
     s3_key = (code_bucket_path.rstrip("/") + "/" + zip_name) if code_bucket_path else zip_name
 
-    if not skip_package_upload:
-        logger("Uploading package", heading="Lambda", level=LogLevel.VERBOSE, log_depth=1)
-
-        S3.upload(filename=package_file,
-                  bucket=code_bucket,
-                  bucket_key=s3_key,
-                  client_kwargs=client_kwargs,
-                  logger=logger)
-
-    #
-
-    logger("Updating function", heading="Lambda", level=LogLevel.VERBOSE, log_depth=1)
-    response = lamb.update_function_code(FunctionName=lambda_name,
-                                         S3Bucket=code_bucket,
-                                         S3Key=s3_key,
-                                         Publish=publish_after,
-                                         DryRun=dry_run)
+    code_unchanged = not skip_package_upload and not force_update and \
+        Package.file_digest(package_file, base64_encoded=True) == info.get("CodeSha256")
+
+    if code_unchanged:
+        logger("Deployed code is unchanged, skipping code update", heading="Lambda", level=LogLevel.VERBOSE,
+               log_depth=1)
+    else:
+        if not skip_package_upload:
+            logger("Uploading package", heading="Lambda", level=LogLevel.VERBOSE, log_depth=1)
+
+            S3.upload(filename=package_file,
+                      bucket=code_bucket,
+                      bucket_key=s3_key,
+                      client_kwargs=client_kwargs,
+                      skip_unchanged=not force_update,
+                      logger=logger)
+
+        #
+
+        wait_for_update(lamb, lambda_name, logger=logger)
+        logger("Updating function", heading="Lambda", level=LogLevel.VERBOSE, log_depth=1)
+        response = lamb.update_function_code(FunctionName=lambda_name,
+                                             S3Bucket=code_bucket,
+                                             S3Key=s3_key,
+                                             Publish=publish_after,
+                                             DryRun=dry_run)
 
     #
 
@@ -218,6 +437,7 @@ def upload_to_lambda(lambda_name: str,
                     key.strip(): value.strip()
                     for key, value in (tuple(line.split("=", maxsplit=1)) for line in f.readlines() if "=" in line)
                 }
+            wait_for_update(lamb, lambda_name, logger=logger)
             response = lamb.update_function_configuration(FunctionName=lambda_name,
                                                           Handler=handler,
                                                           Environment={
@@ -238,6 +458,31 @@ def upload_to_lambda(lambda_name: str,
                                              Tags=tags)
 
 
+def wait_for_update(lamb, lambda_name: str,
+                    timeout: float = 300.0,
+                    initial_delay: float = 0.5,
+                    max_delay: float = 8.0,
+                    logger: LogMethod = LogMethod.null) -> None:
+    """
+    Polls the function's LastUpdateStatus, backing off exponentially, until no update is in progress.
+    Lambda rejects code and configuration updates made while a previous update is still in progress.
+    """
+    deadline = time.monotonic() + timeout
+    delay = initial_delay
+    while True:
+        status = lamb.get_function_configuration(FunctionName=lambda_name).get("LastUpdateStatus")
+        if status != "InProgress":
+            if status == "Failed":
+                logger("Previous update of the function failed", heading="Lambda", level=LogLevel.WARN, log_depth=1)
+            return
+        if time.monotonic() + delay > deadline:
+            raise AWSError(f"Timed out waiting for the update of '{lambda_name}' to finish")
+        logger(f"Waiting for update in progress ({delay:.1f}s)", heading="Lambda", level=LogLevel.VERBOSE,
+               log_depth=1)
+        time.sleep(delay)
+        delay = min(delay * 2, max_delay)
+
+
 #
 
 
@@ -248,7 +493,7 @@ def run(lambda_name: str,
         logger: LogMethod = LogMethod.null,
         client_kwargs: Optional[dict] = None) -> dict:
 
-    lamb = boto3.client('lambda', **(client_kwargs if client_kwargs else dict()))
+    lamb = Clients.client('lambda', client_kwargs)
 
     payload = json.dumps(arguments).encode("utf-8")
 
@@ -275,3 +520,13 @@ def run(lambda_name: str,
         del response["ResponseMetadata"]
 
     return response
+
+
+#
+
+
+def _read_stamp(path: str) -> Optional[str]:
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read().strip()
@@ -0,0 +1,229 @@
+from Interfaces import LogMethod, LogLevel
+
+import re
+import json
+import math
+import time
+import random
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from threading import Lock
+from typing import Optional, Callable, Dict, List, Any
+
+_INIT_DURATION = re.compile(r"Init Duration:\s*([\d.]+)\s*ms")
+
+# Upper bounds, in milliseconds, of the buckets of the latency histogram
+HISTOGRAM_BOUNDS = [5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000]
+
+
+class Invocation:
+    """
+    The outcome of one invocation, as seen by the client.
+    """
+
+    def __init__(self, latency: float,
+                 status_code: Optional[int] = None,
+                 error: Optional[str] = None,
+                 cold_start: bool = False,
+                 init_duration: Optional[float] = None):
+        self.latency = latency
+        self.status_code = status_code
+        self.error = error
+        self.cold_start = cold_start
+        self.init_duration = init_duration
+
+    @property
+    def failed(self) -> bool:
+        return self.error is not None or (self.status_code is not None and self.status_code >= 400)
+
+
+Invoker = Callable[[dict], Invocation]
+
+
+class ParameterSampler:
+    """
+    Draws the query parameters of each invocation from the distributions in a load profile.  The profile
+    is a JSON object whose "parameters" map each query parameter to one of:
+
+    - a constant, which is always used
+    - a list of values, one of which is picked uniformly
+    - {"values": [...], "weights": [...]}, one of which is picked by weight
+    - {"range": [low, high]}, an integer picked uniformly from the inclusive range
+    - {"uniform": [low, high]}, a float picked uniformly from the range
+
+    A parameter whose drawn value is null is left out of the invocation.  An optional "body" object is
+    sent with every invocation as-is.
+    """
+
+    def __init__(self, profile: dict, random_seed: Optional[int] = None):
+        self._parameters: Dict[str, Any] = profile.get("parameters", dict())
+        self._body: Optional[dict] = profile.get("body")
+        self._random = random.Random(random_seed)
+        self._lock = Lock()
+
+    @staticmethod
+    def load(path: str, random_seed: Optional[int] = None) -> "ParameterSampler":
+        with open(path, "r", encoding="utf-8") as f:
+            return ParameterSampler(json.load(f), random_seed=random_seed)
+
+    def sample(self) -> dict:
+        with self._lock:
+            query = {key: self._draw(spec) for key, spec in self._parameters.items()}
+        event = {"queryStringParameters": {k: str(v).lower() if isinstance(v, bool) else str(v)
+                                           for k, v in query.items() if v is not None}}
+        if self._body is not None:
+            event["body"] = json.dumps(self._body)
+        return event
+
+    def _draw(self, spec: Any) -> Any:
+        if isinstance(spec, list):
+            return self._random.choice(spec)
+        if not isinstance(spec, dict):
+            return spec
+        if "values" in spec:
+            return self._random.choices(spec["values"], weights=spec.get("weights"))[0]
+        if "range" in spec:
+            return self._random.randint(*spec["range"])
+        if "uniform" in spec:
+            return round(self._random.uniform(*spec["uniform"]), 4)
+        raise Exception(f"Invalid parameter distribution: {json.dumps(spec)}")
+
+
+#
+
+
+def remote_invoker(lambda_name: str,
+                   client_kwargs: Optional[dict] = None,
+                   concurrency: int = 10) -> Invoker:
+    """
+    Invokes the deployed function through Lambda.run, with its tail logs, in which a cold start reports
+    its "Init Duration".
+    """
+    # Imported here, so that local runs don't need boto3
+    from AWS import Lambda, Clients
+    Clients.client('lambda', client_kwargs, max_pool_connections=concurrency)
+
+    def invoke(event: dict) -> Invocation:
+        start = time.perf_counter()
+        try:
+            response = Lambda.run(lambda_name, event, include_logs=True, client_kwargs=client_kwargs)
+        except Exception as e:
+            return Invocation(time.perf_counter() - start, error=f"{type(e).__name__}: {e}")
+        latency = time.perf_counter() - start
+
+        init_duration = None
+        for line in response.get("LogResult", []):
+            match = _INIT_DURATION.search(line)
+            if match is not None:
+                init_duration = float(match.group(1))
+        payload = response.get("Payload")
+        return Invocation(latency,
+                          status_code=payload.get("statusCode") if isinstance(payload, dict) else None,
+                          error=response.get("FunctionError"),
+                          cold_start=init_duration is not None,
+                          init_duration=init_duration)
+
+    return invoke
+
+
+def local_invoker(handler: Callable[[dict, Any], dict]) -> Invoker:
+    """
+    Calls a handler in-process, e.g. Main.main.  Only the first invocation counts as a cold start, since
+    the handler's module-level caches are shared by every invocation after it.
+    """
+    lock = Lock()
+    started: List[bool] = [False]
+
+    def invoke(event: dict) -> Invocation:
+        with lock:
+            cold_start = not started[0]
+            started[0] = True
+        start = time.perf_counter()
+        try:
+            result = handler(event, None)
+        except Exception as e:
+            return Invocation(time.perf_counter() - start, error=f"{type(e).__name__}: {e}", cold_start=cold_start)
+        return Invocation(time.perf_counter() - start,
+                          status_code=result.get("statusCode") if isinstance(result, dict) else None,
+                          cold_start=cold_start)
+
+    return invoke
+
+
+#
+
+
+def run_load_test(invoke: Invoker,
+                  sampler: ParameterSampler,
+                  count: int,
+                  concurrency: int = 8,
+                  logger: LogMethod = LogMethod.null) -> dict:
+    """
+    Makes the given number of invocations, keeping up to the given number in flight at once, and
+    summarizes them.
+
+    :return: The summary, as returned by summarize().
+    """
+    events = [sampler.sample() for _ in range(count)]
+    results: List[Invocation] = []
+    step = max(1, count // 10)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for future in as_completed([executor.submit(invoke, event) for event in events]):
+            results.append(future.result())
+            if len(results) % step == 0 or len(results) == count:
+                logger(f"Completed {len(results)}/{count} invocations", heading="LoadTest", level=LogLevel.INFO)
+    elapsed = time.perf_counter() - start
+
+    return summarize(results, elapsed, concurrency)
+
+
+def summarize(results: List[Invocation], elapsed: float, concurrency: int) -> dict:
+    latencies = sorted(r.latency * 1000 for r in results)
+    errors = [r for r in results if r.failed]
+    init_durations = [r.init_duration for r in results if r.init_duration is not None]
+
+    histogram = {f"<={bound}": 0 for bound in HISTOGRAM_BOUNDS}
+    histogram[f">{HISTOGRAM_BOUNDS[-1]}"] = 0
+    for latency in latencies:
+        bucket = next((f"<={bound}" for bound in HISTOGRAM_BOUNDS if latency <= bound), f">{HISTOGRAM_BOUNDS[-1]}")
+        histogram[bucket] += 1
+
+    error_kinds: Dict[str, int] = dict()
+    for r in errors:
+        kind = r.error if r.error is not None else f"HTTP {r.status_code}"
+        error_kinds[kind] = error_kinds.get(kind, 0) + 1
+
+    return {
+        "invocations": len(results),
+        "concurrency": concurrency,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_per_s": round(len(results) / elapsed, 2) if elapsed > 0 else None,
+        "latency_ms": {
+            "min": _round(latencies[0] if latencies else None),
+            "mean": _round(sum(latencies) / len(latencies) if latencies else None),
+            "p50": _round(percentile(latencies, 50)),
+            "p90": _round(percentile(latencies, 90)),
+            "p99": _round(percentile(latencies, 99)),
+            "max": _round(latencies[-1] if latencies else None),
+        },
+        "histogram_ms": histogram,
+        "cold_starts": sum(1 for r in results if r.cold_start),
+        "init_duration_ms": _round(sum(init_durations) / len(init_durations) if init_durations else None),
+        "errors": len(errors),
+        "error_rate": round(len(errors) / len(results), 4) if results else None,
+        "error_kinds": error_kinds,
+    }
+
+
+def percentile(ordered: List[float], p: float) -> Optional[float]:
+    """
+    The nearest-rank percentile of an already sorted list.
+    """
+    if not ordered:
+        return None
+    return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return round(value, 2) if value is not None else None
@@ -0,0 +1,262 @@
+from Interfaces import LogMethod, LogLevel
+
+import os
+import re
+import sys
+import json
+import zlib
+import struct
+import base64
+import fnmatch
+import hashlib
+import compileall
+import subprocess
+import py_compile
+from typing import Optional, Iterable, Tuple, Dict, List, BinaryIO, Sequence
+
+# Fixed metadata, so that identical inputs always produce byte-identical packages.
+ZIP_DATE = (0 << 9) | (1 << 5) | 1  # 1980-01-01, the earliest date a zip can record
+ZIP_TIME = 0
+ZIP_VERSION = 20
+ZIP_MADE_BY = (3 << 8) | ZIP_VERSION  # Unix, so that the external attributes carry file modes
+COMPRESSION_LEVEL = 9
+
+# Archive-name patterns for files that are never needed at runtime.
+DEFAULT_PRUNE_RULES = ["*.dist-info/*", "*.egg-info/*",
+                       "tests/*", "*/tests/*", "test/*", "*/test/*",
+                       "docs/*", "*/docs/*", "examples/*", "*/examples/*",
+                       "*.pyi", "*.pyx", "*.pxd", "*.c", "*.h", "*.md", "*.rst"]
+LAMBDA_TASK_ROOT = "/var/task"
+
+_PYC_TAG = re.compile(r"(?:^|/)__pycache__/[^/]+\.(\w+-\d+)(?:\.opt-\d)?\.pyc$")
+_LOCAL_HEADER = struct.Struct("<IHHHHHIIIHH")
+_CENTRAL_HEADER = struct.Struct("<IHHHHHHIIIHHHHHII")
+_END_RECORD = struct.Struct("<IHHHHIIH")
+
+
+def file_digest(path: str, base64_encoded: bool = False) -> str:
+    """
+    The SHA-256 digest of a file, in hex, or in base64 as Lambda reports it for its CodeSha256.
+    """
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return base64.b64encode(h.digest()).decode("ascii") if base64_encoded else h.hexdigest()
+
+
+def files_digest(paths: Iterable[str], *extra: str) -> str:
+    """
+    Hashes the contents of the given files (those that exist) together with any extra strings.
+    """
+    h = hashlib.sha256()
+    for path in paths:
+        if os.path.exists(path):
+            h.update(path.encode("utf-8") + b"\0" + file_digest(path).encode("ascii") + b"\0")
+    for value in extra:
+        h.update(value.encode("utf-8") + b"\0")
+    return h.hexdigest()
+
+
+#
+
+
+def collect(*directories: str) -> List[Tuple[str, str]]:
+    """
+    Lists (archive name, path) pairs for every file under the given directories, sorted by archive name.
+    Later directories win when two of them contain the same archive name.
+    """
+    entries: Dict[str, str] = dict()
+    for directory in directories:
+        for root, dirs, files in os.walk(directory):
+            relative_root = root[len(directory):].strip(os.path.sep)
+            for name in files:
+                arcname = os.path.join(relative_root, name).replace(os.path.sep, "/")
+                entries[arcname] = os.path.join(root, name)
+    return sorted(entries.items())
+
+
+def prune(entries: List[Tuple[str, str]],
+          rules: Sequence[str],
+          python_version: Optional[str] = None) -> List[Tuple[str, str]]:
+    """
+    Filters out the (archive name, path) entries matching any of the given fnmatch-style rules.  If a
+    target Python version (e.g. "3.7") is given, cached bytecode compiled for any other interpreter is
+    dropped too.
+    """
+    tag = python_tag(python_version) if python_version else None
+    kept = []
+    for arcname, path in entries:
+        if any(fnmatch.fnmatch(arcname, rule) for rule in rules):
+            continue
+        if tag is not None:
+            match = _PYC_TAG.search(arcname)
+            if match is not None and match.group(1) != tag:
+                continue
+        kept.append((arcname, path))
+    return kept
+
+
+def precompile(directories: Sequence[str], python_version: str,
+               optimize: int = 0,
+               logger: LogMethod = LogMethod.null) -> bool:
+    """
+    Compiles every module under the given directories to bytecode for the target Python version, so the
+    function doesn't have to compile them at first import.  The bytecode is validated by source hash
+    rather than timestamp, since the packaged files all carry the same fixed timestamp, and it is
+    compiled with the paths the files will have once deployed.  Existing bytecode is always rewritten,
+    since it may have been written by a local run with timestamp validation.  Since unchecked bytecode is
+    used even once its source has changed, only ever compile build or staging copies of the sources, never
+    a working tree.  Optimized bytecode (optimize > 0) is only picked up if the function runs with
+    PYTHONOPTIMIZE set to the same level.
+
+    If the current interpreter is not the target version, the compilation is run through pipenv, whose
+    environment is expected to use the target version.  Returns whether the compilation succeeded.
+    """
+    for directory in directories:
+        if "%d.%d" % sys.version_info[:2] == python_version:
+            success = compileall.compile_dir(directory, quiet=1, force=True, optimize=optimize,
+                                             ddir=LAMBDA_TASK_ROOT,
+                                             invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH)
+        else:
+            command = ["pipenv", "run", "python"] + (["-" + "O" * optimize] if optimize > 0 else []) + \
+                      ["-m", "compileall", "-q", "-f", "-d", LAMBDA_TASK_ROOT,
+                       "--invalidation-mode", "unchecked-hash", directory]
+            success = subprocess.run(command).returncode == 0
+        if not success:
+            logger(f"Failed to precompile {directory}", heading="Package", level=LogLevel.WARN)
+            return False
+    return True
+
+
+def python_tag(python_version: str) -> str:
+    return "cpython-" + python_version.replace(".", "")
+
+
+def summarize(entries: Iterable[Tuple[str, str]]) -> Tuple[int, int]:
+    """
+    Counts the files and total bytes of the given (archive name, path) entries.
+    """
+    count = 0
+    size = 0
+    for _, path in entries:
+        count += 1
+        size += os.path.getsize(path)
+    return count, size
+
+
+def build_zip(package_file: str,
+              entries: List[Tuple[str, str]],
+              manifest_file: Optional[str] = None,
+              logger: LogMethod = LogMethod.null) -> Dict[str, int]:
+    """
+    Writes a deterministic zip of the given (archive name, path) entries: entries are written in order,
+    with fixed timestamps and normalized permissions.  If a manifest from a previous build is available,
+    entries whose content hash is unchanged are copied from the previous package as already-compressed
+    bytes, and only changed files are recompressed.  A new manifest is written alongside the package.
+
+    :return: Counts of "reused" and "compressed" entries.
+    """
+    manifest_file = manifest_file if manifest_file else package_file + ".manifest.json"
+    previous = _load_manifest(manifest_file, package_file)
+    if len(entries) >= 0xFFFF:
+        raise Exception("Too many files to package without zip64 support.")
+
+    stats = {"reused": 0, "compressed": 0}
+    manifest: Dict[str, dict] = dict()
+    central: List[bytes] = []
+    temp_file = package_file + ".tmp"
+
+    with open(temp_file, "wb") as out, _open_optional(package_file if previous else None) as old:
+        for arcname, path in entries:
+            digest = file_digest(path)
+            mode = 0o755 if os.access(path, os.X_OK) else 0o644
+            entry = previous.get(arcname)
+            if entry is not None and entry["sha256"] == digest and old is not None:
+                data = _read_raw(old, entry["offset"], entry["compress_size"])
+                info = dict(entry)
+                stats["reused"] += 1
+            else:
+                with open(path, "rb") as f:
+                    content = f.read()
+                data, method = _compress(content)
+                info = {"sha256": digest, "crc": zlib.crc32(content) & 0xFFFFFFFF, "method": method,
+                        "compress_size": len(data), "file_size": len(content)}
+                stats["compressed"] += 1
+
+            info["offset"] = out.tell()
+            manifest[arcname] = info
+            name = arcname.encode("utf-8")
+            flags = 0 if name.isascii() else 0x800
+            out.write(_LOCAL_HEADER.pack(0x04034b50, ZIP_VERSION, flags, info["method"], ZIP_TIME, ZIP_DATE,
+                                         info["crc"], info["compress_size"], info["file_size"], len(name), 0))
+            out.write(name)
+            out.write(data)
+            central.append(_CENTRAL_HEADER.pack(0x02014b50, ZIP_MADE_BY, ZIP_VERSION, flags, info["method"],
+                                                ZIP_TIME, ZIP_DATE, info["crc"], info["compress_size"],
+                                                info["file_size"], len(name), 0, 0, 0, 0,
+                                                (0o100000 | mode) << 16, info["offset"]) + name)
+
+        directory_offset = out.tell()
+        for record in central:
+            out.write(record)
+        directory_size = out.tell() - directory_offset
+        out.write(_END_RECORD.pack(0x06054b50, 0, 0, len(central), len(central),
+                                   directory_size, directory_offset, 0))
+
+    os.replace(temp_file, package_file)
+    with open(manifest_file, "w", encoding="utf-8") as f:
+        json.dump({"package_size": os.path.getsize(package_file), "entries": manifest}, f, sort_keys=True)
+
+    logger(f"Packaged {len(entries)} files ({stats['reused']} reused, {stats['compressed']} compressed)",
+           heading="Package", level=LogLevel.VERBOSE)
+    return stats
+
+
+#
+
+
+def _compress(content: bytes) -> Tuple[bytes, int]:
+    compressor = zlib.compressobj(COMPRESSION_LEVEL, zlib.DEFLATED, -15)
+    data = compressor.compress(content) + compressor.flush()
+    if len(data) >= len(content):
+        return content, 0  # stored
+    return data, 8  # deflated
+
+
+def _read_raw(f: BinaryIO, offset: int, size: int) -> bytes:
+    f.seek(offset)
+    header = _LOCAL_HEADER.unpack(f.read(_LOCAL_HEADER.size))
+    f.seek(header[9] + header[10], os.SEEK_CUR)
+    return f.read(size)
+
+
+def _load_manifest(manifest_file: str, package_file: str) -> Dict[str, dict]:
+    # The manifest only describes the package it was written with; if that has since been replaced,
+    # none of its offsets can be trusted.
+    if not os.path.exists(package_file) or not os.path.exists(manifest_file):
+        return dict()
+    try:
+        with open(manifest_file, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return dict()
+    if manifest.get("package_size") != os.path.getsize(package_file):
+        return dict()
+    return manifest.get("entries", dict())
+
+
+class _open_optional:
+
+    def __init__(self, path: Optional[str]):
+        self._path = path
+        self._file: Optional[BinaryIO] = None
+
+    def __enter__(self) -> Optional[BinaryIO]:
+        if self._path is not None:
+            self._file = open(self._path, "rb")
+        return self._file
+
+    def __exit__(self, exc_type, exc_value, tb):
+        if self._file is not None:
+            self._file.close()
@@ -1,10 +1,18 @@
 from Interfaces import LogMethod, LogLevel
 
 from Errors.AWSError import AWSError
+from AWS.Package import file_digest
+from AWS import Clients
 
-import boto3
 import os
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from threading import Lock
+from typing import Optional, List
+
+DIGEST_METADATA_KEY = "sha256"
+MULTIPART_THRESHOLD = 64 * 1024 * 1024
+PART_SIZE = 16 * 1024 * 1024
+MAX_WORKERS = 8
 
 
 def upload(filename: str,
@@ -13,26 +21,110 @@ def upload(filename: str,
            acl: str = None,
            client_kwargs: Optional[dict] = None,
            logger: LogMethod = LogMethod.null,
+           skip_unchanged: bool = True,
+           multipart_threshold: int = MULTIPART_THRESHOLD,
+           part_size: int = PART_SIZE,
+           max_workers: int = MAX_WORKERS,
            **kwargs) -> dict:
+    """
+    Uploads a file to S3, recording its SHA-256 digest in the object's metadata.  If the stored object
+    already carries the same digest, the upload is skipped, and the returned dictionary has "Skipped" set.
+    Files larger than the multipart threshold are uploaded in parts, concurrently, with progress reported
+    through the given logger.  Pass an "endpoint_url" in the client kwargs to target a local S3 stand-in.
+
+    :param filename: The path of the file to upload.
+    :param bucket: The bucket to upload to.
+    :param bucket_key: The key to upload the file as.
+    :param acl: Optional.  A canned ACL to apply to the object.
+    :param client_kwargs: Optional.  Keyword arguments for the construction of the boto3 client.
+    :param logger: Optional.  The method to log progress through.
+    :param skip_unchanged: Whether to skip the upload if the stored object has the same digest.
+    :param multipart_threshold: The file size, in bytes, from which the upload is done in parts.
+    :param part_size: The size, in bytes, of each part of a multipart upload.
+    :param max_workers: The number of parts to upload concurrently.
+    :param kwargs: Additional arguments for the put_object (or create_multipart_upload) call.
+    :return: The response of the final S3 call.
+    """
 
     try:
-        s3 = boto3.client('s3', **_client_kwargs(client_kwargs))
+        s3 = Clients.client('s3', client_kwargs, max_pool_connections=max_workers)
+        digest = file_digest(filename)
+
+        if skip_unchanged and stored_digest(s3, bucket, bucket_key) == digest:
+            logger("Stored object is unchanged, skipping upload", heading="S3", level=LogLevel.VERBOSE)
+            return {"Skipped": True, "Bucket": bucket, "Key": bucket_key}
+
+        options = {
+            "Bucket": bucket,
+            "Key": bucket_key,
+            "Metadata": {**kwargs.pop("Metadata", dict()), DIGEST_METADATA_KEY: digest}
+        }
+        if acl:
+            options["ACL"] = acl
+        for k, v in kwargs.items():
+            options[k] = v
+
+        if os.path.getsize(filename) >= multipart_threshold:
+            return _multipart_upload(s3, filename, options, part_size, max_workers, logger)
+
         with open(filename, "rb") as f:
-            options = {
-                "Bucket": bucket,
-                "Key": bucket_key,
-                "Body": f
-            }
-            if acl:
-                options["ACL"] = acl
-            for k, v in kwargs.items():
-                options[k] = v
-            return s3.put_object(**options)
+            return s3.put_object(Body=f, **options)
     except IOError:
         raise
     except Exception as e:
         raise AWSError("Failed to upload file to S3", e)
 
 
-def _client_kwargs(client_kwargs: Optional[dict]) -> dict:
-    return client_kwargs if client_kwargs is not None else dict()
+def stored_digest(s3, bucket: str, bucket_key: str) -> Optional[str]:
+    """
+    Returns the digest recorded in the metadata of the stored object, or None if there is no such object
+    or it has no digest.
+    """
+    try:
+        head = s3.head_object(Bucket=bucket, Key=bucket_key)
+    except Exception as e:
+        if _error_code(e) in ("404", "NoSuchKey", "NotFound"):
+            return None
+        raise
+    return head.get("Metadata", dict()).get(DIGEST_METADATA_KEY)
+
+
+#
+
+
+def _multipart_upload(s3, filename: str, options: dict, part_size: int, max_workers: int,
+                      logger: LogMethod) -> dict:
+    size = os.path.getsize(filename)
+    count = max(1, -(-size // part_size))
+    upload_id = s3.create_multipart_upload(**options)["UploadId"]
+    target = {"Bucket": options["Bucket"], "Key": options["Key"], "UploadId": upload_id}
+
+    lock = Lock()
+    done: List[int] = [0]
+
+    def upload_part(number: int) -> dict:
+        with open(filename, "rb") as f:
+            f.seek((number - 1) * part_size)
+            body = f.read(part_size)
+        response = s3.upload_part(PartNumber=number, Body=body, **target)
+        with lock:
+            done[0] += 1
+            logger(f"Uploaded part {done[0]}/{count} ({100 * done[0] // count}%)", heading="S3",
+                   level=LogLevel.VERBOSE, log_depth=1)
+        return {"PartNumber": number, "ETag": response["ETag"]}
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(upload_part, n) for n in range(1, count + 1)]
+            parts = [future.result() for future in as_completed(futures)]
+        return s3.complete_multipart_upload(MultipartUpload={"Parts": sorted(parts, key=lambda p: p["PartNumber"])},
+                                            **target)
+    except Exception:
+        s3.abort_multipart_upload(**target)
+        raise
+
+
+def _error_code(e: Exception) -> Optional[str]:
+    response = getattr(e, "response", None)
+    return response.get("Error", dict()).get("Code") if isinstance(response, dict) else None
+
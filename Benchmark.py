@@ -0,0 +1,278 @@
+
+from Data import *
+from Game.Rules import Rules, ChainState
+from Game.PathFind import PathFinder
+from Game.Puzzle import PuzzleGenerator, SolutionCounter
+from Game.TypingGraph import TypingGraph
+from Game.Generate import Generator, NoSequenceError, ENGINES, REFERENCE_ENGINE
+
+import sys
+import time
+import random
+import signal
+import argparse
+import traceback
+from typing import Optional, Tuple, List, Callable, Dict, Union
+
+
+DEFAULT_RULES = Rules(length=5, typing_limit=1, type_limit=3, allow_monotype=True)
+
+
+def load_from_cli():
+    args = sys.argv[1:]
+
+    parser = argparse.ArgumentParser(description="Run benchmarks against the puzzle generation code.")
+    parser.add_argument("--dex", type=str, default="src/dex_clean.csv", dest="DEX")
+    parser.add_argument("--seed", type=int, default=0, dest="SEED")
+    parser.add_argument("--time-limit", type=float, default=10.0, dest="TIME_LIMIT",
+                        help="Seconds after which a baseline run is abandoned.")
+    subparsers = parser.add_subparsers(dest="BENCHMARK")
+    subparsers.required = True
+
+    pathfind = subparsers.add_parser("pathfind", help="Path-finding between pairs of Pokémon.")
+    pathfind.add_argument("--typing-limit", type=int, default=1, dest="TYPING_LIMIT")
+    pathfind.add_argument("--type-limit", type=int, default=2, dest="TYPE_LIMIT")
+    pathfind.add_argument("--steps", type=int, nargs="+", default=[4, 6, 8], dest="STEPS")
+    pathfind.add_argument("--pairs", type=str, nargs="*", default=None, dest="PAIRS",
+                          help="Pairs as START:END names.  Defaults to hard pairs picked from the dataset.")
+
+    puzzle = subparsers.add_parser("puzzle", help="Generating puzzles with a unique solution.")
+    puzzle.add_argument("--typing-limit", type=int, default=1, dest="TYPING_LIMIT")
+    puzzle.add_argument("--type-limit", type=int, default=3, dest="TYPE_LIMIT")
+    puzzle.add_argument("--lengths", type=int, nargs="+", default=[3, 4], dest="LENGTHS")
+    puzzle.add_argument("--count", type=int, default=50, dest="COUNT",
+                        help="How many puzzles to generate for each length.")
+    puzzle.add_argument("--attempts", type=int, default=500, dest="ATTEMPTS",
+                        help="The number of endpoint pairs to try per puzzle before giving up.")
+    puzzle.add_argument("--latency-budget", type=float, default=500.0, dest="LATENCY_BUDGET",
+                        help="The per-request budget to check generation times against, in milliseconds.")
+
+    engines = subparsers.add_parser("engines", help="Every generator engine against the reference engine.")
+    engines.add_argument("--cases", type=int, default=40, dest="CASES",
+                         help="How many random parameter/seed cases to run every engine on.")
+    engines.add_argument("--lengths", type=int, nargs=2, default=[2, 8], dest="LENGTHS",
+                         help="The range of chain lengths to draw cases from.")
+    engines.add_argument("--engines", type=str, nargs="+", default=list(ENGINES), dest="ENGINES")
+
+    options = parser.parse_args(args)
+
+    data = PokemonMap.load_from_csv(options.DEX)
+    {
+        "pathfind": benchmark_pathfind,
+        "puzzle": benchmark_puzzle,
+        "engines": benchmark_engines,
+    }[options.BENCHMARK](data, options)
+
+
+#
+
+
+def benchmark_pathfind(data: PokemonMap, options: argparse.Namespace):
+    finder = PathFinder(data, options.TYPING_LIMIT, options.TYPE_LIMIT, True, random_seed=options.SEED)
+    if options.PAIRS:
+        pairs = [tuple(data.name(n.strip().upper()) for n in pair.split(":")) for pair in options.PAIRS]
+    else:
+        pairs = hard_pairs(data, finder)
+
+    print(f"{'START':>20} {'END':>20} {'STEPS':>5} | {'FOUND':>5} {'PATHFINDER':>10} | {'FOUND':>5} {'BASELINE':>10}")
+    for start, end in pairs:
+        for steps in options.STEPS:
+            found, elapsed = timed(lambda: finder.find(start, end, steps))
+            base_found, base_elapsed = timed(lambda: baseline_path(data, finder.rules(steps), start, end,
+                                                                   time.perf_counter() + options.TIME_LIMIT))
+            print(f"{start.name:>20} {end.name:>20} {steps:>5} | "
+                  f"{describe(found):>5} {elapsed * 1000:>8.1f}ms | "
+                  f"{describe(base_found):>5} {base_elapsed * 1000:>8.1f}ms")
+
+
+def hard_pairs(data: PokemonMap, finder: PathFinder, count: int = 4) -> List[Tuple[Pokemon, Pokemon]]:
+    # The pairs whose typings are furthest apart are the ones a forward search is least likely to stumble on.
+    by_typing = {p.typing: p for p in sorted(data, key=lambda p: p.name)}
+    pairs = sorted(((finder.distance(a, b) or 0, a, b) for a in by_typing for b in by_typing),
+                   key=lambda x: (-x[0], str(x[1]), str(x[2])))
+    return [(by_typing[a], by_typing[b]) for _, a, b in pairs[:count]]
+
+
+def baseline_path(data: PokemonMap, rules: Rules, start: Pokemon, end: Pokemon, deadline: float):
+    # Forward backtracking from the start with the end applied as a filter, as the generator would do it.
+    def extend(sequence: Tuple[Pokemon, ...], state: ChainState):
+        if time.perf_counter() > deadline:
+            raise TimeoutError()
+        if len(sequence) == rules.length:
+            return sequence if sequence[-1] == end else None
+        for p in sorted(data.type(*sequence[-1].typing), key=lambda x: x.name):
+            if rules.allows(p.typing, state):
+                seq = extend(sequence + (p,), state.push(p.typing))
+                if seq is not None:
+                    return seq
+        return None
+
+    try:
+        return extend((start,), ChainState.of((start,)))
+    except TimeoutError:
+        return TimeoutError
+
+
+def benchmark_puzzle(data: PokemonMap, options: argparse.Namespace):
+    graph = TypingGraph.of(data)
+    print(f"{'LENGTH':>6} | {'FOUND':>5} {'ATTEMPTS':>8} {'COLD':>9} {'P50':>9} {'P95':>9} {'MAX':>9} {'OVER':>4} | "
+          f"{'PAIRS':>5} {'COUNTER':>9} {'BASELINE':>9}")
+    for length in options.LENGTHS:
+        rules = Rules(length, options.TYPING_LIMIT, options.TYPE_LIMIT, True)
+        SolutionCounter.cache_of(graph).clear()
+
+        # Each puzzle as a request would make it, on a container that has made the ones before it
+        times, attempts, found = [], 0, 0
+        for i in range(options.COUNT):
+            generator = PuzzleGenerator(data, rules, random_seed=options.SEED + i, budget=options.ATTEMPTS)
+            puzzle, elapsed = timed(generator.generate)
+            times.append(elapsed * 1000)
+            attempts += puzzle.attempts if puzzle is not None else options.ATTEMPTS
+            found += puzzle is not None
+        ordered = sorted(times)
+
+        # The counter on its own against exhaustive counting, over the same sample of endpoint pairs
+        sample = random.Random(options.SEED)
+        pairs = [(sample.choice(graph.typings), sample.choice(graph.typings)) for _ in range(50)]
+        SolutionCounter.cache_of(graph).clear()
+        counter = SolutionCounter(data, rules)
+        counts, elapsed = timed(lambda: [counter.count(a, b) for a, b in pairs])
+        deadline = time.perf_counter() + options.TIME_LIMIT
+        base_counts, base_elapsed = timed(lambda: baseline_counts(graph, rules, pairs, deadline))
+        if base_counts is not TimeoutError and [min(c, 2) for c in base_counts] != counts:
+            raise Exception(f"Counts differ from the baseline's for length {length}")
+
+        print(f"{length:>6} | {found:>5} {attempts / options.COUNT:>8.1f} {times[0]:>7.1f}ms "
+              f"{ordered[len(ordered) // 2]:>7.1f}ms {ordered[int(len(ordered) * 0.95)]:>7.1f}ms "
+              f"{ordered[-1]:>7.1f}ms {sum(t > options.LATENCY_BUDGET for t in times):>4} | "
+              f"{len(pairs):>5} {elapsed * 1000:>7.1f}ms "
+              f"{'T/O' if base_counts is TimeoutError else f'{base_elapsed * 1000:.1f}ms':>9}")
+
+
+def baseline_counts(graph: TypingGraph, rules: Rules, pairs: List[Tuple[Typing, Typing]], deadline: float):
+    # Counts every chain between the endpoints in full, without memoization or stopping early.
+    def extend(state: ChainState, end: Typing) -> int:
+        if time.perf_counter() > deadline:
+            raise TimeoutError()
+        if state.length == rules.length - 1:
+            return 1 if graph.linked(state.last, end) else 0
+        return sum(extend(state.push(graph.typings[j]), end) for j in graph.neighbours[graph.index[state.last]]
+                   if rules.allows(graph.typings[j], state))
+
+    counts = []
+    try:
+        for start, end in pairs:
+            state = rules.start()
+            if not rules.allows(start, state) or not rules.allows(end, state.push(start)):
+                counts.append(0)
+                continue
+            both = state.push(start).push(end)
+            counts.append(extend(ChainState(1, start, both.typing_counts, both.type_counts), end))
+    except TimeoutError:
+        return TimeoutError
+    return counts
+
+
+def benchmark_engines(data: PokemonMap, options: argparse.Namespace):
+    # Every engine runs on the same cases.  Chains are checked by the reference rule checker, and every "no
+    # chain" answer against the reference engine's, which searches exhaustively.
+    corpus = random.Random(options.SEED)
+    cases = [(Rules(corpus.randint(*options.LENGTHS), corpus.choice((0, 1, 2)), corpus.choice((0, 1, 2, 3, 4)),
+                    corpus.random() < 0.5), corpus.randrange(2 ** 32)) for _ in range(options.CASES)]
+    engines = [REFERENCE_ENGINE] + [e for e in options.ENGINES if e != REFERENCE_ENGINE]
+    # The tables the engines use are built up front, so that building them isn't timed against any one engine
+    for engine in engines:
+        run_engine(make_engine(data, DEFAULT_RULES, 0, engine), options.TIME_LIMIT)
+
+    results: Dict[str, List[Tuple[str, float]]] = {engine: [] for engine in engines}
+    failures: List[str] = []
+    for rules, seed in cases:
+        checker = Generator(data, *rules.key(), engine=REFERENCE_ENGINE)
+        for engine in engines:
+            generator = make_engine(data, rules, seed, engine)
+            (status, chain), elapsed = timed(lambda: run_engine(generator, options.TIME_LIMIT))
+            if status == "error":
+                failures.append(f"{engine} crashed under {rules} (seed {seed}):\n{chain.rstrip()}")
+            elif status == "found" and not checker.meets_criteria(chain):
+                status = "violation"
+                failures.append(f"{engine} broke the rules with {' -> '.join(p.name for p in chain)} under {rules}")
+            elif status == "none" and engine != REFERENCE_ENGINE:
+                reference = results[REFERENCE_ENGINE][-1][0]
+                if reference == "found":
+                    status = "mismatch"
+                    failures.append(f"{engine} found no chain under {rules} (seed {seed}), but the reference did")
+                elif reference == "timeout":
+                    status = "unverified"
+            results[engine].append((status, elapsed))
+
+    print(f"{'ENGINE':>10} | {'FOUND':>5} {'NONE':>5} {'T/O':>5} | {'ERRORS':>6} {'VIOLATIONS':>10} {'MISMATCHES':>10} "
+          f"{'UNVERIFIED':>10} | {'MEDIAN':>9} {'TOTAL':>10} {'SPEEDUP':>7}")
+    reference = results[REFERENCE_ENGINE]
+    for engine in engines:
+        runs = results[engine]
+        statuses = [status for status, _ in runs]
+        ordered = sorted(elapsed for _, elapsed in runs)
+        # Compared over the cases both engines finished, so timeouts don't flatter either of them
+        both = [(r[1], e[1]) for r, e in zip(reference, runs)
+                if r[0] not in ("timeout", "error") and e[0] not in ("timeout", "error")]
+        speedup = sum(r for r, _ in both) / max(sum(e for _, e in both), 1e-9) if both else float("nan")
+        print(f"{engine:>10} | {statuses.count('found') + statuses.count('violation'):>5} "
+              f"{statuses.count('none') + statuses.count('mismatch') + statuses.count('unverified'):>5} "
+              f"{statuses.count('timeout'):>5} | {statuses.count('error'):>6} {statuses.count('violation'):>10} "
+              f"{statuses.count('mismatch'):>10} "
+              f"{statuses.count('unverified'):>10} | {ordered[len(ordered) // 2] * 1000:>7.1f}ms "
+              f"{sum(ordered) * 1000:>8.1f}ms {speedup:>6.1f}x")
+
+    for failure in failures:
+        print(failure)
+    if failures:
+        sys.exit(1)
+
+
+def make_engine(data: PokemonMap, rules: Rules, seed: int, engine: str) -> Generator:
+    # Only the targeted engine takes a band, so it is given one that every chain falls in
+    return Generator(data, *rules.key(), random_seed=seed, engine=engine,
+                     difficulty=(0.0, 1.0) if engine == "targeted" else None)
+
+
+def run_engine(generator: Generator, time_limit: float) -> Tuple[str, Union[Tuple[Pokemon, ...], str, None]]:
+    # The engines have no deadlines of their own, so runs are cut short by a timer signal instead.  Only
+    # finding no chain counts as "none"; any other exception is an "error", returned with its traceback.
+    def expire(signum, frame):
+        raise TimeoutError()
+
+    previous = signal.signal(signal.SIGALRM, expire)
+    signal.setitimer(signal.ITIMER_REAL, time_limit)
+    try:
+        return "found", generator.generate()
+    except TimeoutError:
+        return "timeout", None
+    except NoSequenceError:
+        return "none", None
+    except Exception:
+        return "error", traceback.format_exc()
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+#
+
+
+def timed(func: Callable):
+    begin = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - begin
+
+
+def describe(result) -> str:
+    if result is TimeoutError:
+        return "T/O"
+    return "yes" if result is not None else "no"
+
+
+#
+
+
+if __name__ == "__main__":
+    load_from_cli()
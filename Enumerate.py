@@ -0,0 +1,88 @@
+
+from Data import *
+from Game.Rules import Rules
+from Game.Enumerate import Enumerator, write_jsonl
+
+import os
+import sys
+import json
+import argparse
+
+
+def load_from_cli():
+    args = sys.argv[1:]
+
+    parser = argparse.ArgumentParser(description="Stream every valid chain to a JSON Lines file.")
+    parser.add_argument("--dex", type=str, default="src/dex_clean.csv", dest="DEX")
+    parser.add_argument("--length", type=int, default=3, dest="LENGTH")
+    parser.add_argument("--typing-limit", type=int, default=1, dest="TYPING_LIMIT")
+    parser.add_argument("--type-limit", type=int, default=3, dest="TYPE_LIMIT")
+    parser.add_argument("--no-monotype", action="store_true", dest="NO_MONOTYPE")
+    parser.add_argument("--limit", type=int, default=None, dest="LIMIT",
+                        help="Stop after this many chains.")
+    parser.add_argument("--shard", type=str, default="0/1", dest="SHARD",
+                        help="The shard to enumerate, as INDEX/COUNT, partitioned by first Pokémon.")
+    parser.add_argument("--contains", type=str, nargs="*", default=None, dest="CONTAINS",
+                        help="Only output chains containing all of these Pokémon.")
+    parser.add_argument("--output", type=str, default="chains.jsonl", dest="OUTPUT")
+    parser.add_argument("--checkpoint", type=str, default=None, dest="CHECKPOINT",
+                        help="A file to record progress in.  If it exists, enumeration resumes from it.")
+    parser.add_argument("--checkpoint-every", type=int, default=10000, dest="CHECKPOINT_EVERY")
+
+    options = parser.parse_args(args)
+
+    enumerate_to_file(options)
+
+
+def enumerate_to_file(options: argparse.Namespace):
+    rules = Rules(options.LENGTH, options.TYPING_LIMIT, options.TYPE_LIMIT, not options.NO_MONOTYPE)
+    shard, shards = (int(x) for x in options.SHARD.split("/"))
+    contains = {name.strip().upper() for name in options.CONTAINS} if options.CONTAINS else None
+
+    enumerator = Enumerator(PokemonMap.load_from_csv(options.DEX), rules,
+                            shard=shard,
+                            shards=shards,
+                            where=(lambda chain: contains <= {p.name for p in chain}) if contains else None)
+
+    progress = {"rules": list(rules.key()), "shard": shard, "shards": shards, "cursor": None, "count": 0,
+                "offset": 0}
+    if options.CHECKPOINT and os.path.exists(options.CHECKPOINT):
+        with open(options.CHECKPOINT, "r", encoding="utf-8") as f:
+            saved = json.load(f)
+        if (saved["rules"], saved["shard"], saved["shards"]) != (progress["rules"], shard, shards):
+            raise Exception("Checkpoint was written for a different enumeration.")
+        progress = saved
+
+    limit = options.LIMIT - progress["count"] if options.LIMIT is not None else None
+    if limit is not None and limit <= 0:
+        return
+
+    # Chains written after the last checkpoint are enumerated again, so they are cut from the output first
+    if progress["cursor"] is not None:
+        if not os.path.exists(options.OUTPUT) or os.path.getsize(options.OUTPUT) < progress["offset"]:
+            raise Exception("Output is missing chains the checkpoint records as written.")
+        os.truncate(options.OUTPUT, progress["offset"])
+
+    with open(options.OUTPUT, "a" if progress["cursor"] is not None else "w", encoding="utf-8") as f:
+        start = progress["count"]
+
+        def save(count: int):
+            if not options.CHECKPOINT:
+                return
+            f.flush()
+            progress["cursor"] = enumerator.checkpoint
+            progress["count"] = start + count
+            progress["offset"] = f.tell()
+            with open(options.CHECKPOINT + ".tmp", "w", encoding="utf-8") as cf:
+                json.dump(progress, cf)
+            os.replace(options.CHECKPOINT + ".tmp", options.CHECKPOINT)
+
+        count = write_jsonl(enumerator.chains(limit=limit, resume=progress["cursor"]), f,
+                            on_written=lambda n: save(n) if n % options.CHECKPOINT_EVERY == 0 else None)
+        save(count)
+
+    print(f"Wrote {start + count} chains to {options.OUTPUT}")
+
+
+if __name__ == "__main__":
+    load_from_cli()
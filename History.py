@@ -0,0 +1,54 @@
+
+from Data import *
+from Game.History import ChainHistory, DEFAULT_WINDOW
+
+import os
+import sys
+import json
+import argparse
+
+
+def load_from_cli():
+    args = sys.argv[1:]
+
+    parser = argparse.ArgumentParser(description="Add issued chains to the history index that generation avoids.")
+    parser.add_argument("chains", type=str, nargs="+",
+                        help="JSON Lines files of issued chains, one {\"seq\": [...]} object per line, oldest first.")
+    parser.add_argument("--dex", type=str, default="src/dex_clean.csv", dest="DEX")
+    parser.add_argument("--history", type=str, default="src/history.bin", dest="HISTORY",
+                        help="The history index to add to.  Created if it doesn't exist.")
+    parser.add_argument("--window", type=int, default=None, dest="WINDOW",
+                        help=f"How many of the latest chains rule out their Pokémon (default {DEFAULT_WINDOW}).")
+
+    options = parser.parse_args(args)
+
+    add_to_history(options)
+
+
+def add_to_history(options: argparse.Namespace):
+    data = PokemonMap.load_from_csv(options.DEX)
+    if os.path.exists(options.HISTORY):
+        history = ChainHistory.load(data, options.HISTORY, window=options.WINDOW)
+    else:
+        history = ChainHistory(data, window=options.WINDOW if options.WINDOW is not None else DEFAULT_WINDOW)
+
+    added = 0
+    for path in options.chains:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                names = json.loads(line)["seq"]
+                chain = [data.name(name.upper()) for name in names]
+                if any(p is None for p in chain):
+                    raise Exception(f"Unknown Pokémon in chain: {', '.join(names)}")
+                history.add(chain)
+                added += 1
+
+    history.save(options.HISTORY)
+    print(f"Added {added} chains; {options.HISTORY} now holds {len(history)} "
+          f"({os.path.getsize(options.HISTORY)} bytes)")
+
+
+if __name__ == "__main__":
+    load_from_cli()
@@ -0,0 +1,72 @@
+
+from AWS import LoadTest
+from Interfaces import LogMethod
+
+import os
+import sys
+import json
+import argparse
+import importlib
+import contextlib
+
+
+def load_from_cli():
+    args = sys.argv[1:]
+
+    parser = argparse.ArgumentParser(description="Fire many concurrent invocations at a function and report "
+                                                 "latency, cold starts and errors.")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--name", type=str, default=None, dest="NAME",
+                        help="The name of the deployed lambda function to invoke.")
+    target.add_argument("--local", type=str, default=None, dest="LOCAL",
+                        help="A handler in src/Main.py (e.g. \"main\") to call in-process instead.")
+    parser.add_argument("--profile", type=str, required=True, dest="PROFILE",
+                        help="A JSON file describing the distributions of the query parameters.")
+    parser.add_argument("--count", type=int, default=100, dest="COUNT")
+    parser.add_argument("--concurrency", type=int, default=8, dest="CONCURRENCY")
+    parser.add_argument("--seed", type=int, default=None, dest="SEED",
+                        help="Seeds the parameter draws, so that runs can be repeated.")
+    parser.add_argument("--src-dir", type=str, default="src", dest="SOURCE_DIR")
+    parser.add_argument("--aws-profile", type=str, default=None, dest="AWS_PROFILE")
+    parser.add_argument("--output", type=str, default=None, dest="OUTPUT",
+                        help="A file to write the JSON summary to.")
+
+    options = parser.parse_args(args)
+
+    load_test(options)
+
+
+def load_test(options: argparse.Namespace):
+    sampler = LoadTest.ParameterSampler.load(options.PROFILE, random_seed=options.SEED)
+    output = os.path.abspath(options.OUTPUT) if options.OUTPUT else None
+
+    if options.LOCAL:
+        # The handlers load their data relative to the source directory, as they do when deployed
+        os.chdir(options.SOURCE_DIR)
+        sys.path.insert(0, os.getcwd())
+        invoke = LoadTest.local_invoker(getattr(importlib.import_module("Main"), options.LOCAL))
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            summary = LoadTest.run_load_test(invoke, sampler, options.COUNT,
+                                             concurrency=options.CONCURRENCY,
+                                             logger=_stderr_logger)
+    else:
+        from AWS import Configuration
+        client_kwargs = Configuration.get_client_args(profile_name=options.AWS_PROFILE)
+        invoke = LoadTest.remote_invoker(options.NAME, client_kwargs, concurrency=options.CONCURRENCY)
+        summary = LoadTest.run_load_test(invoke, sampler, options.COUNT,
+                                         concurrency=options.CONCURRENCY,
+                                         logger=LogMethod.printer())
+
+    print(json.dumps(summary, indent=2))
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+
+
+def _stderr_logger(message: str, heading=None, level=None, **kwargs):
+    # Handlers print freely, so a local run silences stdout and reports its progress here instead
+    print(f"{('[%s] : ' % heading) if heading else ''}{message}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    load_from_cli()
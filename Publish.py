@@ -10,10 +10,17 @@ def load_from_cli():
     args = sys.argv[1:]
 
     parser = argparse.ArgumentParser(description="Publish the specified lambda function.")
-    parser.add_argument("--name", type=str, required=True, dest="NAME",
+    parser.add_argument("--name", type=str, default=None, dest="NAME",
                         help="The name of the lambda function")
+    parser.add_argument("--manifest", type=str, default=None, dest="MANIFEST",
+                        help="A TOML file listing several functions to publish from the same package, "
+                             "in place of --name.")
+    parser.add_argument("--max-workers", type=int, default=8, dest="MAX_WORKERS",
+                        help="The number of functions from the manifest to update concurrently.")
     parser.add_argument("--handler", type=str, default="main.handler", dest="HANDLER",
-                        help="The name of the handler function.")
+                        help="The name of the handler function.  With --manifest, the default for functions "
+                             "the manifest doesn't name one for, as are the environment, tags and code bucket "
+                             "options.")
     parser.add_argument("--build-dir", type=str, default="_build", dest="BUILD_DIR")
     parser.add_argument("--src-dir", type=str, default="src", dest="SOURCE_DIR")
     parser.add_argument("--requirements", type=str, default="requirements.txt", dest="REQUIREMENTS_FILE")
@@ -29,10 +36,22 @@ def load_from_cli():
     parser.add_argument("--skip-package-upload", action="store_true", dest="SKIP_UPLOAD")
     parser.add_argument("--cwd", type=str, default="./", dest="CWD")
     parser.add_argument("--skip-dependencies", "-s", action="store_true", dest="SKIP_DEPENDENCIES")
+    parser.add_argument("--force", action="store_true", dest="FORCE",
+                        help="Upload and update the function code even if it is unchanged.")
+    parser.add_argument("--prune", type=str, nargs="*", default=None, dest="PRUNE_RULES",
+                        help="Patterns of packaged files to leave out, replacing the default rules.")
+    parser.add_argument("--no-precompile", action="store_true", dest="NO_PRECOMPILE")
+    parser.add_argument("--python-version", type=str, default=None, dest="PYTHON_VERSION",
+                        help="The Python version the function runs on.  Read from the Pipfile by default.")
 
     options = parser.parse_args(args)
+    if (options.NAME is None) == (options.MANIFEST is None):
+        parser.error("exactly one of --name and --manifest is required")
 
-    publish(options)
+    if options.MANIFEST:
+        publish_many(options)
+    else:
+        publish(options)
 
 
 def publish(options: argparse.Namespace):
@@ -52,11 +71,49 @@ def publish(options: argparse.Namespace):
                    delete_lock=options.DELETE_LOCK,
                    skip_dependencies=options.SKIP_DEPENDENCIES,
                    skip_package_upload=options.SKIP_UPLOAD,
+                   force_update=options.FORCE,
+                   prune_rules=options.PRUNE_RULES,
+                   precompile=not options.NO_PRECOMPILE,
+                   python_version=options.PYTHON_VERSION,
                    local_libs=options.LOCAL_LIBS if hasattr(options, "LOCAL_LIBS") else dict(),
                    aws_client_kwargs=Configuration.get_client_args(profile_name=options.AWS_PROFILE),
                    cwd=options.CWD,
                    logger=LogMethod.printer())
 
 
+def publish_many(options: argparse.Namespace):
+
+    # The function options serve as defaults for whatever the manifest doesn't specify
+    results = Lambda.publish_many(manifest_file=options.MANIFEST,
+                                  handler=options.HANDLER,
+                                  build_dir=options.BUILD_DIR,
+                                  src_dir=options.SOURCE_DIR,
+                                  requirements_file=options.REQUIREMENTS_FILE,
+                                  environment_file=options.ENVIRONMENT_FILE,
+                                  tags_file=options.TAGS_FILE,
+                                  package_file=options.PACKAGE_FILE,
+                                  code_bucket=options.CODE_BUCKET,
+                                  code_bucket_path=options.CODE_BUCKET_PATH,
+                                  publish_after=not options.NO_PUBLISH and not options.DRY_RUN,
+                                  dry_run=options.DRY_RUN,
+                                  delete_lock=options.DELETE_LOCK,
+                                  skip_dependencies=options.SKIP_DEPENDENCIES,
+                                  skip_package_upload=options.SKIP_UPLOAD,
+                                  force_update=options.FORCE,
+                                  prune_rules=options.PRUNE_RULES,
+                                  precompile=not options.NO_PRECOMPILE,
+                                  python_version=options.PYTHON_VERSION,
+                                  local_libs=options.LOCAL_LIBS if hasattr(options, "LOCAL_LIBS") else dict(),
+                                  aws_client_kwargs=Configuration.get_client_args(profile_name=options.AWS_PROFILE),
+                                  max_workers=options.MAX_WORKERS,
+                                  cwd=options.CWD,
+                                  logger=LogMethod.printer())
+
+    failed = sorted(name for name, error in results.items() if error is not None)
+    if failed:
+        print(f"Failed to publish: {', '.join(failed)}")
+        sys.exit(1)
+
+
 if __name__ == "__main__":
     load_from_cli()
@@ -0,0 +1,46 @@
+
+from Data import *
+from Game.Rules import Rules
+from Game.Reservoir import ChainReservoir
+
+import os
+import sys
+import argparse
+
+
+def load_from_cli():
+    args = sys.argv[1:]
+
+    parser = argparse.ArgumentParser(description="Pre-generate a pool of chains to seed the chain reservoir with.")
+    parser.add_argument("--dex", type=str, default="src/dex_clean.csv", dest="DEX")
+    parser.add_argument("--weights", type=str, default=None, dest="WEIGHTS",
+                        help="The weights file the function is deployed with, if any.")
+    parser.add_argument("--rules", type=str, nargs="+", default=["5,1,3,true"], dest="RULES",
+                        help="The rules to generate chains for, each as LENGTH,TYPING_LIMIT,TYPE_LIMIT,MONOTYPE.")
+    parser.add_argument("--count", type=int, default=256, dest="COUNT",
+                        help="How many chains to generate for each of the rules.")
+    parser.add_argument("--output", type=str, default="src/reservoir.jsonl", dest="OUTPUT")
+
+    options = parser.parse_args(args)
+
+    generate_pool(options)
+
+
+def parse_rules(text: str) -> Rules:
+    length, typing_limit, type_limit, monotype = text.split(",")
+    return Rules(int(length), int(typing_limit), int(type_limit), monotype.strip().lower() in ("true", "1", "yes"))
+
+
+def generate_pool(options: argparse.Namespace):
+    data = PokemonMap.load_from_csv(options.DEX, weights_path=options.WEIGHTS)
+    reservoir = ChainReservoir(data, [parse_rules(r) for r in options.RULES], capacity=options.COUNT)
+    added = reservoir.fill()
+    reservoir.save(options.OUTPUT)
+    print(f"Generated {added} chains into {options.OUTPUT} ({os.path.getsize(options.OUTPUT)} bytes)")
+    for rules, size in reservoir.sizes().items():
+        if size < options.COUNT:
+            print(f"Only {size} chains for {rules}")
+
+
+if __name__ == "__main__":
+    load_from_cli()
@@ -1,7 +1,10 @@
-import pickle
+import os
+import sys
 import csv
-from typing import Dict, List, Collection, Union, Iterable, Tuple
 import json
+import pickle
+import hashlib
+from typing import Dict, List, Iterator, Tuple
 
 from Data.Pokemon import PokemonType, Pokemon, Typing, PokemonMap
 
@@ -9,59 +12,243 @@ INPUT = "./dex.csv"
 OUTPUT_PICKLE = "./dex.pickle"
 OUTPUT_CSV = "./dex_clean.csv"
 OUTPUT_JS = "./dex.js"
+MANIFEST = "./dex.manifest.json"
+
+# dex.js is loaded by every client, so a build that makes it grow past this fails instead.
+JS_SIZE_BUDGET = 64 * 1024
+TYPE_CODES: Dict[PokemonType, int] = {t: i for i, t in enumerate(PokemonType)}
+
+
+class RowError(Exception):
+
+    def __init__(self, line: int, message: str):
+        super(RowError, self).__init__(f"line {line}: {message}")
+        self.line = line
 
 
 def main():
-    data = load()
-    data = simplify(data)
-    save(data)
+    force = "--force" in sys.argv[1:]
+    if not force and up_to_date():
+        print("Dataset is up to date, nothing to build.")
+        return
+    count = build()
+    print(f"Built {count} Pokémon into {', '.join(outputs())}")
 
 
 #
 
 
-def load() -> List[Dict[str, str]]:
-    with open(INPUT, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f, next(f).strip().split(","))
-        return [x for x in reader]
+def outputs() -> List[str]:
+    return [OUTPUT_PICKLE, OUTPUT_CSV, OUTPUT_JS]
 
 
-#
+def sources() -> Dict[str, str]:
+    # The build script is hashed too, so that changing how outputs are written also triggers a rebuild.
+    return {path: file_digest(path) for path in (INPUT, os.path.abspath(__file__))}
+
 
+def up_to_date() -> bool:
+    if not os.path.exists(MANIFEST):
+        return False
+    with open(MANIFEST, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("sources") != {os.path.basename(k): v for k, v in sources().items()}:
+        return False
+    return all(os.path.exists(path) and file_digest(path) == manifest.get("outputs", dict()).get(path)
+               for path in outputs())
 
-def simplify(data: Iterable[Dict[str, str]]) -> PokemonMap:
-    return PokemonMap(*(Pokemon(item["Pokémon"],
-                                Typing(*(PokemonType(t) for t in (item["Type 1"], item["Type 2"]))),
-                                int(item["Dex #"]))
-                        for item in data))
+
+def file_digest(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
 
 
 #
 
 
-def save(data: PokemonMap) -> None:
-    with open(OUTPUT_PICKLE, "wb") as f:
-        pickle.dump(data, f)
-    with open(OUTPUT_CSV, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, ["Name", "Type1", "Type2", "Dex#"])
-        writer.writeheader()
-        for p in data:
-            types = list(p.typing)
-            writer.writerow({"Name": p.name,
-                             "Type1": types[0].name,
-                             "Type2": types[1].name if len(types) > 1 else types[0].name,
-                             "Dex#": p.dex_number})
-    with open(OUTPUT_JS, "w", encoding="utf-8") as f:
-        f.write("const DEX=" + json.dumps([{"n": p.name.upper(),
-                                            "t": [p.name for p in p.typing],
-                                            "d": p.dex_number}
-                                           for p in data],
-                                          separators=(",", ":")))
+def load() -> Iterator[Tuple[int, Pokemon]]:
+    """
+    Streams the Pokémon in the input, each with the line it was read from.  Every row is validated as it is
+    read; malformed rows are skipped, and reported all together, with their line numbers, once the whole
+    input has been read.
+    """
+    errors: List[RowError] = []
+    seen: Dict[str, int] = dict()
+    with open(INPUT, "r", encoding="utf-8", newline="") as f:
+        reader = csv.DictReader(f)
+        for item in reader:
+            try:
+                pokemon = simplify(reader.line_num, item)
+                if pokemon.name in seen:
+                    raise RowError(reader.line_num,
+                                   f"Duplicate name {pokemon.name} (first on line {seen[pokemon.name]})")
+                seen[pokemon.name] = reader.line_num
+            except RowError as e:
+                errors.append(e)
+                continue
+            yield reader.line_num, pokemon
+    if errors:
+        raise Exception(f"{len(errors)} malformed rows in {INPUT}:\n" + "\n".join(str(e) for e in errors))
+
+
+def simplify(line: int, item: Dict[str, str]) -> Pokemon:
+    name = (item.get("Pokémon") or "").strip()
+    if not name:
+        raise RowError(line, "Missing name")
+    try:
+        types = [PokemonType(t.strip()) for t in (item.get("Type 1"), item.get("Type 2")) if t and t.strip()]
+    except ValueError as e:
+        raise RowError(line, f"Unknown type for {name}: {e}")
+    if not types:
+        raise RowError(line, f"Missing type for {name}")
+    try:
+        dex_number = int(item.get("Dex #") or "")
+    except ValueError:
+        raise RowError(line, f"Invalid dex number for {name}: {item.get('Dex #')!r}")
+    return Pokemon(name, Typing(*types), dex_number)
 
 
 #
 
 
+def build() -> int:
+    """
+    Makes a single pass over the input, handing every row to all of the output writers at once.  Outputs are
+    written to temporary files, which only replace the previous outputs once the whole input is valid.
+    """
+    writers = [PickleWriter(OUTPUT_PICKLE), CsvWriter(OUTPUT_CSV), JsWriter(OUTPUT_JS)]
+    count = 0
+    try:
+        for _, pokemon in load():
+            for writer in writers:
+                writer.write(pokemon)
+            count += 1
+        for writer in writers:
+            writer.close()
+    except Exception:
+        for writer in writers:
+            writer.discard()
+        raise
+
+    for writer in writers:
+        writer.commit()
+    with open(MANIFEST, "w", encoding="utf-8") as f:
+        json.dump({"sources": {os.path.basename(k): v for k, v in sources().items()},
+                   "outputs": {path: file_digest(path) for path in outputs()},
+                   "count": count}, f, indent=2, sort_keys=True)
+    return count
+
+
+class OutputWriter:
+
+    def __init__(self, path: str, binary: bool = False):
+        self.path = path
+        self._temp = path + ".tmp"
+        self._file = open(self._temp, "wb") if binary else open(self._temp, "w", encoding="utf-8", newline="")
+
+    def write(self, pokemon: Pokemon) -> None: ...
+
+    def close(self) -> None:
+        self._file.close()
+
+    def commit(self) -> None:
+        os.replace(self._temp, self.path)
+
+    def discard(self) -> None:
+        self._file.close()
+        if os.path.exists(self._temp):
+            os.remove(self._temp)
+
+
+class PickleWriter(OutputWriter):
+
+    def __init__(self, path: str):
+        super(PickleWriter, self).__init__(path, binary=True)
+        self._data = PokemonMap()
+
+    def write(self, pokemon: Pokemon) -> None:
+        self._data.add(pokemon)
+
+    def close(self) -> None:
+        # The pickle holds the whole map, so it can only be written once every row is in.
+        pickle.dump(self._data, self._file)
+        super(PickleWriter, self).close()
+
+
+class CsvWriter(OutputWriter):
+
+    def __init__(self, path: str):
+        super(CsvWriter, self).__init__(path)
+        self._writer = csv.DictWriter(self._file, ["Name", "Type1", "Type2", "Dex#"], lineterminator="\n")
+        self._writer.writeheader()
+
+    def write(self, pokemon: Pokemon) -> None:
+        types = list(pokemon.typing)
+        self._writer.writerow({"Name": pokemon.name,
+                               "Type1": types[0].name,
+                               "Type2": types[1].name if len(types) > 1 else types[0].name,
+                               "Dex#": pokemon.dex_number})
+
+
+class JsWriter(OutputWriter):
+    """
+    Writes the dex for the frontend, along with indexes that make checking or listing the legal moves after
+    any Pokémon a lookup instead of a scan over the whole dex:
+
+    - TYPES: type names, by integer type code
+    - TYPINGS: the type codes of each typing, by typing index
+    - DEX: {n: name, t: type codes, y: typing index, d: dex number} for every Pokémon
+    - TYPING_MEMBERS: the positions in DEX of the Pokémon of each typing, by typing index
+    - TYPE_TYPINGS: the indexes of the typings that include each type, by type code
+
+    A guess is a legal move when its typing shares a type with the previous one's; the legal moves after a
+    Pokémon are the members of the typings listed under either of its types.
+    """
+
+    def __init__(self, path: str, budget: int = JS_SIZE_BUDGET):
+        super(JsWriter, self).__init__(path)
+        self._budget = budget
+        self._count = 0
+        self._typings: Dict[Typing, int] = dict()
+        self._members: List[List[int]] = []
+        self._file.write("const TYPES=" + _compact([t.name for t in PokemonType]) + ";\n")
+        self._file.write("const DEX=[")
+
+    def write(self, pokemon: Pokemon) -> None:
+        if pokemon.typing not in self._typings:
+            self._typings[pokemon.typing] = len(self._typings)
+            self._members.append([])
+        typing = self._typings[pokemon.typing]
+        self._members[typing].append(self._count)
+        if self._count > 0:
+            self._file.write(",")
+        self._file.write(_compact({"n": pokemon.name.upper(),
+                                   "t": [TYPE_CODES[t] for t in pokemon.typing],
+                                   "y": typing,
+                                   "d": pokemon.dex_number}))
+        self._count += 1
+
+    def close(self) -> None:
+        # The indexes are small, and can only be written once every Pokémon has been seen.
+        typings = list(self._typings)
+        self._file.write("];\n")
+        self._file.write("const TYPINGS=" + _compact([[TYPE_CODES[t] for t in typing] for typing in typings]) + ";\n")
+        self._file.write("const TYPING_MEMBERS=" + _compact(self._members) + ";\n")
+        self._file.write("const TYPE_TYPINGS=" + _compact([[i for i, typing in enumerate(typings) if t in typing]
+                                                           for t in PokemonType]) + ";\n")
+        size = self._file.tell()
+        super(JsWriter, self).close()
+        if size > self._budget:
+            raise Exception(f"{self.path} would be {size} bytes, over its budget of {self._budget} bytes.")
+
+
+def _compact(obj) -> str:
+    return json.dumps(obj, separators=(",", ":"))
+
+
 #
 
 
@@ -1 +1,5 @@
-const DEX=[{"n":"BULBASAUR","t":["GRASS","POISON"],"d":1},{"n":"IVYSAUR","t":["GRASS","POISON"],"d":2},{"n":"VENUSAUR","t":["GRASS","POISON"],"d":3},{"n":"VENUSAUR-MEGA","t":["GRASS","POISON"],"d":3},{"n":"CHARMANDER","t":["FIRE"],"d":4},{"n":"CHARMELEON","t":["FIRE"],"d":5},{"n":"CHARIZARD","t":["FIRE","FLYING"],"d":6},{"n":"CHARIZARD-MEGA-X","t":["DRAGON","FIRE"],"d":6},{"n":"CHARIZARD-MEGA-Y","t":["FIRE","FLYING"],"d":6},{"n":"SQUIRTLE","t":["WATER"],"d":7},{"n":"WARTORTLE","t":["WATER"],"d":8},{"n":"BLASTOISE","t":["WATER"],"d":9},{"n":"BLASTOISE-MEGA","t":["WATER"],"d":9},{"n":"CATERPIE","t":["BUG"],"d":10},{"n":"METAPOD","t":["BUG"],"d":11},{"n":"BUTTERFREE","t":["BUG","FLYING"],"d":12},{"n":"WEEDLE","t":["BUG","POISON"],"d":13},{"n":"KAKUNA","t":["BUG","POISON"],"d":14},{"n":"BEEDRILL","t":["BUG","POISON"],"d":15},{"n":"BEEDRILL-MEGA","t":["BUG","POISON"],"d":15},{"n":"PIDGEY","t":["FLYING","NORMAL"],"d":16},{"n":"PIDGEOTTO","t":["FLYING","NORMAL"],"d":17},{"n":"PIDGEOT","t":["FLYING","NORMAL"],"d":18},{"n":"PIDGEOT-MEGA","t":["FLYING","NORMAL"],"d":18},{"n":"RATTATA","t":["NORMAL"],"d":19},{"n":"RATTATA-ALOLA","t":["DARK","NORMAL"],"d":19},{"n":"RATICATE","t":["NORMAL"],"d":20},{"n":"RATICATE-ALOLA","t":["DARK","NORMAL"],"d":20},{"n":"SPEAROW","t":["FLYING","NORMAL"],"d":21},{"n":"FEAROW","t":["FLYING","NORMAL"],"d":22},{"n":"EKANS","t":["POISON"],"d":23},{"n":"ARBOK","t":["POISON"],"d":24},{"n":"PIKACHU","t":["ELECTRIC"],"d":25},{"n":"PIKACHU-PARTNER","t":["ELECTRIC"],"d":25},{"n":"RAICHU","t":["ELECTRIC"],"d":26},{"n":"RAICHU-ALOLA","t":["ELECTRIC","PSYCHIC"],"d":26},{"n":"SANDSHREW","t":["GROUND"],"d":27},{"n":"SANDSHREW-ALOLA","t":["ICE","STEEL"],"d":27},{"n":"SANDSLASH","t":["GROUND"],"d":28},{"n":"SANDSLASH-ALOLA","t":["ICE","STEEL"],"d":28},{"n":"NIDORAN\u2640","t":["POISON"],"d":29},{"n":"NIDORINA","t":["POISON"],"d":30},{"n":"NIDOQUEEN","t":["GROUND","POISON"],"d":31},{"n":"NIDORAN\u2642","t":["POISON"],"d":32},{"n":"NIDORINO","t":["POISON"],"d":33},{"n":"NIDOKING","t":["GROUND","POISON"],"d":34},{"n":"CLEFAIRY","t":["FAIRY"],"d":35},{"n":"CLEFABLE","t":["FAIRY"],"d":36},{"n":"VULPIX","t":["FIRE"],"d":37},{"n":"VULPIX-ALOLA","t":["ICE"],"d":37},{"n":"NINETALES","t":["FIRE"],"d":38},{"n":"NINETALES-ALOLA","t":["FAIRY","ICE"],"d":38},{"n":"JIGGLYPUFF","t":["FAIRY","NORMAL"],"d":39},{"n":"WIGGLYTUFF","t":["FAIRY","NORMAL"],"d":40},{"n":"ZUBAT","t":["FLYING","POISON"],"d":41},{"n":"GOLBAT","t":["FLYING","POISON"],"d":42},{"n":"ODDISH","t":["GRASS","POISON"],"d":43},{"n":"GLOOM","t":["GRASS","POISON"],"d":44},{"n":"VILEPLUME","t":["GRASS","POISON"],"d":45},{"n":"PARAS","t":["BUG","GRASS"],"d":46},{"n":"PARASECT","t":["BUG","GRASS"],"d":47},{"n":"VENONAT","t":["BUG","POISON"],"d":48},{"n":"VENOMOTH","t":["BUG","POISON"],"d":49},{"n":"DIGLETT","t":["GROUND"],"d":50},{"n":"DIGLETT-ALOLA","t":["GROUND","STEEL"],"d":50},{"n":"DUGTRIO","t":["GROUND"],"d":51},{"n":"DUGTRIO-ALOLA","t":["GROUND","STEEL"],"d":51},{"n":"MEOWTH","t":["NORMAL"],"d":52},{"n":"MEOWTH-ALOLA","t":["DARK"],"d":52},{"n":"MEOWTH-GALAR","t":["STEEL"],"d":52},{"n":"PERSIAN","t":["NORMAL"],"d":53},{"n":"PERSIAN-ALOLA","t":["DARK"],"d":53},{"n":"PSYDUCK","t":["WATER"],"d":54},{"n":"GOLDUCK","t":["WATER"],"d":55},{"n":"MANKEY","t":["FIGHTING"],"d":56},{"n":"PRIMEAPE","t":["FIGHTING"],"d":57},{"n":"GROWLITHE","t":["FIRE"],"d":58},{"n":"GROWLITHE-HISUI","t":["FIRE","ROCK"],"d":58},{"n":"ARCANINE","t":["FIRE"],"d":59},{"n":"ARCANINE-HISUI","t":["FIRE","ROCK"],"d":59},{"n":"POLIWAG","t":["WATER"],"d":60},{"n":"POLIWHIRL","t":["WATER"],"d":61},{"n":"POLIWRATH","t":["FIGHTING","WATER"],"d":62},{"n":"ABRA","t":["PSYCHIC"],"d":63},{"n":"KADABRA","t":["PSYCHIC"],"d":64},{"n":"ALAKAZAM","t":["PSYCHIC"],"d":65},{"n":"ALAKAZAM-MEGA","t":["PSYCHIC"],"d":65},{"n":"MACHOP","t":["FIGHTING"],"d":66},{"n":"MACHOKE","t":["FIGHTING"],"d":67},{"n":"MACHAMP","t":["FIGHTING"],"d":68},{"n":"BELLSPROUT","t":["GRASS","POISON"],"d":69},{"n":"WEEPINBELL","t":["GRASS","POISON"],"d":70},{"n":"VICTREEBEL","t":["GRASS","POISON"],"d":71},{"n":"TENTACOOL","t":["POISON","WATER"],"d":72},{"n":"TENTACRUEL","t":["POISON","WATER"],"d":73},{"n":"GEODUDE","t":["GROUND","ROCK"],"d":74},{"n":"GEODUDE-ALOLA","t":["ELECTRIC","ROCK"],"d":74},{"n":"GRAVELER","t":["GROUND","ROCK"],"d":75},{"n":"GRAVELER-ALOLA","t":["ELECTRIC","ROCK"],"d":75},{"n":"GOLEM","t":["GROUND","ROCK"],"d":76},{"n":"GOLEM-ALOLA","t":["ELECTRIC","ROCK"],"d":76},{"n":"PONYTA","t":["FIRE"],"d":77},{"n":"PONYTA-GALAR","t":["PSYCHIC"],"d":77},{"n":"RAPIDASH","t":["FIRE"],"d":78},{"n":"RAPIDASH-GALAR","t":["FAIRY","PSYCHIC"],"d":78},{"n":"SLOWPOKE","t":["PSYCHIC","WATER"],"d":79},{"n":"SLOWPOKE-GALAR","t":["PSYCHIC"],"d":79},{"n":"SLOWBRO","t":["PSYCHIC","WATER"],"d":80},{"n":"SLOWBRO-MEGA","t":["PSYCHIC","WATER"],"d":80},{"n":"SLOWBRO-GALAR","t":["POISON","PSYCHIC"],"d":80},{"n":"MAGNEMITE","t":["ELECTRIC","STEEL"],"d":81},{"n":"MAGNETON","t":["ELECTRIC","STEEL"],"d":82},{"n":"FARFETCH'D","t":["FLYING","NORMAL"],"d":83},{"n":"FARFETCH'D-GALAR","t":["FIGHTING"],"d":83},{"n":"DODUO","t":["FLYING","NORMAL"],"d":84},{"n":"DODRIO","t":["FLYING","NORMAL"],"d":85},{"n":"SEEL","t":["WATER"],"d":86},{"n":"DEWGONG","t":["ICE","WATER"],"d":87},{"n":"GRIMER","t":["POISON"],"d":88},{"n":"GRIMER-ALOLA","t":["DARK","POISON"],"d":88},{"n":"MUK","t":["POISON"],"d":89},{"n":"MUK-ALOLA","t":["DARK","POISON"],"d":89},{"n":"SHELLDER","t":["WATER"],"d":90},{"n":"CLOYSTER","t":["ICE","WATER"],"d":91},{"n":"GASTLY","t":["GHOST","POISON"],"d":92},{"n":"HAUNTER","t":["GHOST","POISON"],"d":93},{"n":"GENGAR","t":["GHOST","POISON"],"d":94},{"n":"GENGAR-MEGA","t":["GHOST","POISON"],"d":94},{"n":"ONIX","t":["GROUND","ROCK"],"d":95},{"n":"DROWZEE","t":["PSYCHIC"],"d":96},{"n":"HYPNO","t":["PSYCHIC"],"d":97},{"n":"KRABBY","t":["WATER"],"d":98},{"n":"KINGLER","t":["WATER"],"d":99},{"n":"VOLTORB","t":["ELECTRIC"],"d":100},{"n":"VOLTORB-HISUI","t":["ELECTRIC","GRASS"],"d":100},{"n":"ELECTRODE","t":["ELECTRIC"],"d":101},{"n":"ELECTRODE-HISUI","t":["ELECTRIC","GRASS"],"d":101},{"n":"EXEGGCUTE","t":["GRASS","PSYCHIC"],"d":102},{"n":"EXEGGUTOR","t":["GRASS","PSYCHIC"],"d":103},{"n":"EXEGGUTOR-ALOLA","t":["DRAGON","GRASS"],"d":103},{"n":"CUBONE","t":["GROUND"],"d":104},{"n":"MAROWAK","t":["GROUND"],"d":105},{"n":"MAROWAK-ALOLA","t":["FIRE","GHOST"],"d":105},{"n":"HITMONLEE","t":["FIGHTING"],"d":106},{"n":"HITMONCHAN","t":["FIGHTING"],"d":107},{"n":"LICKITUNG","t":["NORMAL"],"d":108},{"n":"KOFFING","t":["POISON"],"d":109},{"n":"WEEZING","t":["POISON"],"d":110},{"n":"WEEZING-GALAR","t":["FAIRY","POISON"],"d":110},{"n":"RHYHORN","t":["GROUND","ROCK"],"d":111},{"n":"RHYDON","t":["GROUND","ROCK"],"d":112},{"n":"CHANSEY","t":["NORMAL"],"d":113},{"n":"TANGELA","t":["GRASS"],"d":114},{"n":"KANGASKHAN","t":["NORMAL"],"d":115},{"n":"KANGASKHAN-MEGA","t":["NORMAL"],"d":115},{"n":"HORSEA","t":["WATER"],"d":116},{"n":"SEADRA","t":["WATER"],"d":117},{"n":"GOLDEEN","t":["WATER"],"d":118},{"n":"SEAKING","t":["WATER"],"d":119},{"n":"STARYU","t":["WATER"],"d":120},{"n":"STARMIE","t":["PSYCHIC","WATER"],"d":121},{"n":"MR. MIME","t":["FAIRY","PSYCHIC"],"d":122},{"n":"MR. MIME-GALAR","t":["ICE","PSYCHIC"],"d":122},{"n":"SCYTHER","t":["BUG","FLYING"],"d":123},{"n":"JYNX","t":["ICE","PSYCHIC"],"d":124},{"n":"ELECTABUZZ","t":["ELECTRIC"],"d":125},{"n":"MAGMAR","t":["FIRE"],"d":126},{"n":"PINSIR","t":["BUG"],"d":127},{"n":"PINSIR-MEGA","t":["BUG","FLYING"],"d":127},{"n":"TAUROS","t":["NORMAL"],"d":128},{"n":"TAUROS-PALDEA","t":["FIGHTING"],"d":128},{"n":"TAUROS-PALDEA-FIRE","t":["FIGHTING","FIRE"],"d":128},{"n":"TAUROS-PALDEA-WATER","t":["FIGHTING","WATER"],"d":128},{"n":"MAGIKARP","t":["WATER"],"d":129},{"n":"GYARADOS","t":["FLYING","WATER"],"d":130},{"n":"GYARADOS-MEGA","t":["DARK","WATER"],"d":130},{"n":"LAPRAS","t":["ICE","WATER"],"d":131},{"n":"DITTO","t":["NORMAL"],"d":132},{"n":"EEVEE","t":["NORMAL"],"d":133},{"n":"EEVEE-PARTNER","t":["NORMAL"],"d":133},{"n":"VAPOREON","t":["WATER"],"d":134},{"n":"JOLTEON","t":["ELECTRIC"],"d":135},{"n":"FLAREON","t":["FIRE"],"d":136},{"n":"PORYGON","t":["NORMAL"],"d":137},{"n":"OMANYTE","t":["ROCK","WATER"],"d":138},{"n":"OMASTAR","t":["ROCK","WATER"],"d":139},{"n":"KABUTO","t":["ROCK","WATER"],"d":140},{"n":"KABUTOPS","t":["ROCK","WATER"],"d":141},{"n":"AERODACTYL","t":["FLYING","ROCK"],"d":142},{"n":"AERODACTYL-MEGA","t":["FLYING","ROCK"],"d":142},{"n":"SNORLAX","t":["NORMAL"],"d":143},{"n":"ARTICUNO","t":["FLYING","ICE"],"d":144},{"n":"ARTICUNO-GALAR","t":["FLYING","PSYCHIC"],"d":144},{"n":"ZAPDOS","t":["ELECTRIC","FLYING"],"d":145},{"n":"ZAPDOS-GALAR","t":["FIGHTING","FLYING"],"d":145},{"n":"MOLTRES","t":["FIRE","FLYING"],"d":146},{"n":"MOLTRES-GALAR","t":["DARK","FLYING"],"d":146},{"n":"DRATINI","t":["DRAGON"],"d":147},{"n":"DRAGONAIR","t":["DRAGON"],"d":148},{"n":"DRAGONITE","t":["DRAGON","FLYING"],"d":149},{"n":"MEWTWO","t":["PSYCHIC"],"d":150},{"n":"MEWTWO-MEGA-X","t":["FIGHTING","PSYCHIC"],"d":150},{"n":"MEWTWO-MEGA-Y","t":["PSYCHIC"],"d":150},{"n":"MEW","t":["PSYCHIC"],"d":151},{"n":"CHIKORITA","t":["GRASS"],"d":152},{"n":"BAYLEEF","t":["GRASS"],"d":153},{"n":"MEGANIUM","t":["GRASS"],"d":154},{"n":"CYNDAQUIL","t":["FIRE"],"d":155},{"n":"QUILAVA","t":["FIRE"],"d":156},{"n":"TYPHLOSION","t":["FIRE"],"d":157},{"n":"TYPHLOSION-HISUI","t":["FIRE","GHOST"],"d":157},{"n":"TOTODILE","t":["WATER"],"d":158},{"n":"CROCONAW","t":["WATER"],"d":159},{"n":"FERALIGATR","t":["WATER"],"d":160},{"n":"SENTRET","t":["NORMAL"],"d":161},{"n":"FURRET","t":["NORMAL"],"d":162},{"n":"HOOTHOOT","t":["FLYING","NORMAL"],"d":163},{"n":"NOCTOWL","t":["FLYING","NORMAL"],"d":164},{"n":"LEDYBA","t":["BUG","FLYING"],"d":165},{"n":"LEDIAN","t":["BUG","FLYING"],"d":166},{"n":"SPINARAK","t":["BUG","POISON"],"d":167},{"n":"ARIADOS","t":["BUG","POISON"],"d":168},{"n":"CROBAT","t":["FLYING","POISON"],"d":169},{"n":"CHINCHOU","t":["ELECTRIC","WATER"],"d":170},{"n":"LANTURN","t":["ELECTRIC","WATER"],"d":171},{"n":"PICHU","t":["ELECTRIC"],"d":172},{"n":"CLEFFA","t":["FAIRY"],"d":173},{"n":"IGGLYBUFF","t":["FAIRY","NORMAL"],"d":174},{"n":"TOGEPI","t":["FAIRY"],"d":175},{"n":"TOGETIC","t":["FAIRY","FLYING"],"d":176},{"n":"NATU","t":["FLYING","PSYCHIC"],"d":177},{"n":"XATU","t":["FLYING","PSYCHIC"],"d":178},{"n":"MAREEP","t":["ELECTRIC"],"d":179},{"n":"FLAAFFY","t":["ELECTRIC"],"d":180},{"n":"AMPHAROS","t":["ELECTRIC"],"d":181},{"n":"AMPHAROS-MEGA","t":["DRAGON","ELECTRIC"],"d":181},{"n":"BELLOSSOM","t":["GRASS"],"d":182},{"n":"MARILL","t":["FAIRY","WATER"],"d":183},{"n":"AZUMARILL","t":["FAIRY","WATER"],"d":184},{"n":"SUDOWOODO","t":["ROCK"],"d":185},{"n":"POLITOED","t":["WATER"],"d":186},{"n":"HOPPIP","t":["FLYING","GRASS"],"d":187},{"n":"SKIPLOOM","t":["FLYING","GRASS"],"d":188},{"n":"JUMPLUFF","t":["FLYING","GRASS"],"d":189},{"n":"AIPOM","t":["NORMAL"],"d":190},{"n":"SUNKERN","t":["GRASS"],"d":191},{"n":"SUNFLORA","t":["GRASS"],"d":192},{"n":"YANMA","t":["BUG","FLYING"],"d":193},{"n":"WOOPER","t":["GROUND","WATER"],"d":194},{"n":"WOOPER-PALDEA","t":["GROUND","POISON"],"d":194},{"n":"QUAGSIRE","t":["GROUND","WATER"],"d":195},{"n":"ESPEON","t":["PSYCHIC"],"d":196},{"n":"UMBREON","t":["DARK"],"d":197},{"n":"MURKROW","t":["DARK","FLYING"],"d":198},{"n":"SLOWKING","t":["PSYCHIC","WATER"],"d":199},{"n":"SLOWKING-GALAR","t":["POISON","PSYCHIC"],"d":199},{"n":"MISDREAVUS","t":["GHOST"],"d":200},{"n":"UNOWN","t":["PSYCHIC"],"d":201},{"n":"WOBBUFFET","t":["PSYCHIC"],"d":202},{"n":"GIRAFARIG","t":["NORMAL","PSYCHIC"],"d":203},{"n":"PINECO","t":["BUG"],"d":204},{"n":"FORRETRESS","t":["BUG","STEEL"],"d":205},{"n":"DUNSPARCE","t":["NORMAL"],"d":206},{"n":"GLIGAR","t":["FLYING","GROUND"],"d":207},{"n":"STEELIX","t":["GROUND","STEEL"],"d":208},{"n":"STEELIX-MEGA","t":["GROUND","STEEL"],"d":208},{"n":"SNUBBULL","t":["FAIRY"],"d":209},{"n":"GRANBULL","t":["FAIRY"],"d":210},{"n":"QWILFISH","t":["POISON","WATER"],"d":211},{"n":"QWILFISH-HISUI","t":["DARK","POISON"],"d":211},{"n":"SCIZOR","t":["BUG","STEEL"],"d":212},{"n":"SCIZOR-MEGA","t":["BUG","STEEL"],"d":212},{"n":"SHUCKLE","t":["BUG","ROCK"],"d":213},{"n":"HERACROSS","t":["BUG","FIGHTING"],"d":214},{"n":"HERACROSS-MEGA","t":["BUG","FIGHTING"],"d":214},{"n":"SNEASEL","t":["DARK","ICE"],"d":215},{"n":"SNEASEL-HISUI","t":["FIGHTING","POISON"],"d":215},{"n":"TEDDIURSA","t":["NORMAL"],"d":216},{"n":"URSARING","t":["NORMAL"],"d":217},{"n":"SLUGMA","t":["FIRE"],"d":218},{"n":"MAGCARGO","t":["FIRE","ROCK"],"d":219},{"n":"SWINUB","t":["GROUND","ICE"],"d":220},{"n":"PILOSWINE","t":["GROUND","ICE"],"d":221},{"n":"CORSOLA","t":["ROCK","WATER"],"d":222},{"n":"CORSOLA-GALAR","t":["GHOST"],"d":222},{"n":"REMORAID","t":["WATER"],"d":223},{"n":"OCTILLERY","t":["WATER"],"d":224},{"n":"DELIBIRD","t":["FLYING","ICE"],"d":225},{"n":"MANTINE","t":["FLYING","WATER"],"d":226},{"n":"SKARMORY","t":["FLYING","STEEL"],"d":227},{"n":"HOUNDOUR","t":["DARK","FIRE"],"d":228},{"n":"HOUNDOOM","t":["DARK","FIRE"],"d":229},{"n":"HOUNDOOM-MEGA","t":["DARK","FIRE"],"d":229},{"n":"KINGDRA","t":["DRAGON","WATER"],"d":230},{"n":"PHANPY","t":["GROUND"],"d":231},{"n":"DONPHAN","t":["GROUND"],"d":232},{"n":"PORYGON2","t":["NORMAL"],"d":233},{"n":"STANTLER","t":["NORMAL"],"d":234},{"n":"SMEARGLE","t":["NORMAL"],"d":235},{"n":"TYROGUE","t":["FIGHTING"],"d":236},{"n":"HITMONTOP","t":["FIGHTING"],"d":237},{"n":"SMOOCHUM","t":["ICE","PSYCHIC"],"d":238},{"n":"ELEKID","t":["ELECTRIC"],"d":239},{"n":"MAGBY","t":["FIRE"],"d":240},{"n":"MILTANK","t":["NORMAL"],"d":241},{"n":"BLISSEY","t":["NORMAL"],"d":242},{"n":"RAIKOU","t":["ELECTRIC"],"d":243},{"n":"ENTEI","t":["FIRE"],"d":244},{"n":"SUICUNE","t":["WATER"],"d":245},{"n":"LARVITAR","t":["GROUND","ROCK"],"d":246},{"n":"PUPITAR","t":["GROUND","ROCK"],"d":247},{"n":"TYRANITAR","t":["DARK","ROCK"],"d":248},{"n":"TYRANITAR-MEGA","t":["DARK","ROCK"],"d":248},{"n":"LUGIA","t":["FLYING","PSYCHIC"],"d":249},{"n":"HO-OH","t":["FIRE","FLYING"],"d":250},{"n":"CELEBI","t":["GRASS","PSYCHIC"],"d":251},{"n":"TREECKO","t":["GRASS"],"d":252},{"n":"GROVYLE","t":["GRASS"],"d":253},{"n":"SCEPTILE","t":["GRASS"],"d":254},{"n":"SCEPTILE-MEGA","t":["DRAGON","GRASS"],"d":254},{"n":"TORCHIC","t":["FIRE"],"d":255},{"n":"COMBUSKEN","t":["FIGHTING","FIRE"],"d":256},{"n":"BLAZIKEN","t":["FIGHTING","FIRE"],"d":257},{"n":"BLAZIKEN-MEGA","t":["FIGHTING","FIRE"],"d":257},{"n":"MUDKIP","t":["WATER"],"d":258},{"n":"MARSHTOMP","t":["GROUND","WATER"],"d":259},{"n":"SWAMPERT","t":["GROUND","WATER"],"d":260},{"n":"SWAMPERT-MEGA","t":["GROUND","WATER"],"d":260},{"n":"POOCHYENA","t":["DARK"],"d":261},{"n":"MIGHTYENA","t":["DARK"],"d":262},{"n":"ZIGZAGOON","t":["NORMAL"],"d":263},{"n":"ZIGZAGOON-GALAR","t":["DARK","NORMAL"],"d":263},{"n":"LINOONE","t":["NORMAL"],"d":264},{"n":"LINOONE-GALAR","t":["DARK","NORMAL"],"d":264},{"n":"WURMPLE","t":["BUG"],"d":265},{"n":"SILCOON","t":["BUG"],"d":266},{"n":"BEAUTIFLY","t":["BUG","FLYING"],"d":267},{"n":"CASCOON","t":["BUG"],"d":268},{"n":"DUSTOX","t":["BUG","POISON"],"d":269},{"n":"LOTAD","t":["GRASS","WATER"],"d":270},{"n":"LOMBRE","t":["GRASS","WATER"],"d":271},{"n":"LUDICOLO","t":["GRASS","WATER"],"d":272},{"n":"SEEDOT","t":["GRASS"],"d":273},{"n":"NUZLEAF","t":["DARK","GRASS"],"d":274},{"n":"SHIFTRY","t":["DARK","GRASS"],"d":275},{"n":"TAILLOW","t":["FLYING","NORMAL"],"d":276},{"n":"SWELLOW","t":["FLYING","NORMAL"],"d":277},{"n":"WINGULL","t":["FLYING","WATER"],"d":278},{"n":"PELIPPER","t":["FLYING","WATER"],"d":279},{"n":"RALTS","t":["FAIRY","PSYCHIC"],"d":280},{"n":"KIRLIA","t":["FAIRY","PSYCHIC"],"d":281},{"n":"GARDEVOIR","t":["FAIRY","PSYCHIC"],"d":282},{"n":"GARDEVOIR-MEGA","t":["FAIRY","PSYCHIC"],"d":282},{"n":"SURSKIT","t":["BUG","WATER"],"d":283},{"n":"MASQUERAIN","t":["BUG","FLYING"],"d":284},{"n":"SHROOMISH","t":["GRASS"],"d":285},{"n":"BRELOOM","t":["FIGHTING","GRASS"],"d":286},{"n":"SLAKOTH","t":["NORMAL"],"d":287},{"n":"VIGOROTH","t":["NORMAL"],"d":288},{"n":"SLAKING","t":["NORMAL"],"d":289},{"n":"NINCADA","t":["BUG","GROUND"],"d":290},{"n":"NINJASK","t":["BUG","FLYING"],"d":291},{"n":"SHEDINJA","t":["BUG","GHOST"],"d":292},{"n":"WHISMUR","t":["NORMAL"],"d":293},{"n":"LOUDRED","t":["NORMAL"],"d":294},{"n":"EXPLOUD","t":["NORMAL"],"d":295},{"n":"MAKUHITA","t":["FIGHTING"],"d":296},{"n":"HARIYAMA","t":["FIGHTING"],"d":297},{"n":"AZURILL","t":["FAIRY","NORMAL"],"d":298},{"n":"NOSEPASS","t":["ROCK"],"d":299},{"n":"SKITTY","t":["NORMAL"],"d":300},{"n":"DELCATTY","t":["NORMAL"],"d":301},{"n":"SABLEYE","t":["DARK","GHOST"],"d":302},{"n":"SABLEYE-MEGA","t":["DARK","GHOST"],"d":302},{"n":"MAWILE","t":["FAIRY","STEEL"],"d":303},{"n":"MAWILE-MEGA","t":["FAIRY","STEEL"],"d":303},{"n":"ARON","t":["ROCK","STEEL"],"d":304},{"n":"LAIRON","t":["ROCK","STEEL"],"d":305},{"n":"AGGRON","t":["ROCK","STEEL"],"d":306},{"n":"AGGRON-MEGA","t":["STEEL"],"d":306},{"n":"MEDITITE","t":["FIGHTING","PSYCHIC"],"d":307},{"n":"MEDICHAM","t":["FIGHTING","PSYCHIC"],"d":308},{"n":"MEDICHAM-MEGA","t":["FIGHTING","PSYCHIC"],"d":308},{"n":"ELECTRIKE","t":["ELECTRIC"],"d":309},{"n":"MANECTRIC","t":["ELECTRIC"],"d":310},{"n":"MANECTRIC-MEGA","t":["ELECTRIC"],"d":310},{"n":"PLUSLE","t":["ELECTRIC"],"d":311},{"n":"MINUN","t":["ELECTRIC"],"d":312},{"n":"VOLBEAT","t":["BUG"],"d":313},{"n":"ILLUMISE","t":["BUG"],"d":314},{"n":"ROSELIA","t":["GRASS","POISON"],"d":315},{"n":"GULPIN","t":["POISON"],"d":316},{"n":"SWALOT","t":["POISON"],"d":317},{"n":"CARVANHA","t":["DARK","WATER"],"d":318},{"n":"SHARPEDO","t":["DARK","WATER"],"d":319},{"n":"SHARPEDO-MEGA","t":["DARK","WATER"],"d":319},{"n":"WAILMER","t":["WATER"],"d":320},{"n":"WAILORD","t":["WATER"],"d":321},{"n":"NUMEL","t":["FIRE","GROUND"],"d":322},{"n":"CAMERUPT","t":["FIRE","GROUND"],"d":323},{"n":"CAMERUPT-MEGA","t":["FIRE","GROUND"],"d":323},{"n":"TORKOAL","t":["FIRE"],"d":324},{"n":"SPOINK","t":["PSYCHIC"],"d":325},{"n":"GRUMPIG","t":["PSYCHIC"],"d":326},{"n":"SPINDA","t":["NORMAL"],"d":327},{"n":"TRAPINCH","t":["GROUND"],"d":328},{"n":"VIBRAVA","t":["DRAGON","GROUND"],"d":329},{"n":"FLYGON","t":["DRAGON","GROUND"],"d":330},{"n":"CACNEA","t":["GRASS"],"d":331},{"n":"CACTURNE","t":["DARK","GRASS"],"d":332},{"n":"SWABLU","t":["FLYING","NORMAL"],"d":333},{"n":"ALTARIA","t":["DRAGON","FLYING"],"d":334},{"n":"ALTARIA-MEGA","t":["DRAGON","FAIRY"],"d":334},{"n":"ZANGOOSE","t":["NORMAL"],"d":335},{"n":"SEVIPER","t":["POISON"],"d":336},{"n":"LUNATONE","t":["PSYCHIC","ROCK"],"d":337},{"n":"SOLROCK","t":["PSYCHIC","ROCK"],"d":338},{"n":"BARBOACH","t":["GROUND","WATER"],"d":339},{"n":"WHISCASH","t":["GROUND","WATER"],"d":340},{"n":"CORPHISH","t":["WATER"],"d":341},{"n":"CRAWDAUNT","t":["DARK","WATER"],"d":342},{"n":"BALTOY","t":["GROUND","PSYCHIC"],"d":343},{"n":"CLAYDOL","t":["GROUND","PSYCHIC"],"d":344},{"n":"LILEEP","t":["GRASS","ROCK"],"d":345},{"n":"CRADILY","t":["GRASS","ROCK"],"d":346},{"n":"ANORITH","t":["BUG","ROCK"],"d":347},{"n":"ARMALDO","t":["BUG","ROCK"],"d":348},{"n":"FEEBAS","t":["WATER"],"d":349},{"n":"MILOTIC","t":["WATER"],"d":350},{"n":"CASTFORM","t":["NORMAL"],"d":351},{"n":"CASTFORM-SUNNY","t":["FIRE"],"d":351},{"n":"CASTFORM-RAINY","t":["WATER"],"d":351},{"n":"CASTFORM-SNOWY","t":["ICE"],"d":351},{"n":"KECLEON","t":["NORMAL"],"d":352},{"n":"SHUPPET","t":["GHOST"],"d":353},{"n":"BANETTE","t":["GHOST"],"d":354},{"n":"BANETTE-MEGA","t":["GHOST"],"d":354},{"n":"DUSKULL","t":["GHOST"],"d":355},{"n":"DUSCLOPS","t":["GHOST"],"d":356},{"n":"TROPIUS","t":["FLYING","GRASS"],"d":357},{"n":"CHIMECHO","t":["PSYCHIC"],"d":358},{"n":"ABSOL","t":["DARK"],"d":359},{"n":"ABSOL-MEGA","t":["DARK"],"d":359},{"n":"WYNAUT","t":["PSYCHIC"],"d":360},{"n":"SNORUNT","t":["ICE"],"d":361},{"n":"GLALIE","t":["ICE"],"d":362},{"n":"GLALIE-MEGA","t":["ICE"],"d":362},{"n":"SPHEAL","t":["ICE","WATER"],"d":363},{"n":"SEALEO","t":["ICE","WATER"],"d":364},{"n":"WALREIN","t":["ICE","WATER"],"d":365},{"n":"CLAMPERL","t":["WATER"],"d":366},{"n":"HUNTAIL","t":["WATER"],"d":367},{"n":"GOREBYSS","t":["WATER"],"d":368},{"n":"RELICANTH","t":["ROCK","WATER"],"d":369},{"n":"LUVDISC","t":["WATER"],"d":370},{"n":"BAGON","t":["DRAGON"],"d":371},{"n":"SHELGON","t":["DRAGON"],"d":372},{"n":"SALAMENCE","t":["DRAGON","FLYING"],"d":373},{"n":"SALAMENCE-MEGA","t":["DRAGON","FLYING"],"d":373},{"n":"BELDUM","t":["PSYCHIC","STEEL"],"d":374},{"n":"METANG","t":["PSYCHIC","STEEL"],"d":375},{"n":"METAGROSS","t":["PSYCHIC","STEEL"],"d":376},{"n":"METAGROSS-MEGA","t":["PSYCHIC","STEEL"],"d":376},{"n":"REGIROCK","t":["ROCK"],"d":377},{"n":"REGICE","t":["ICE"],"d":378},{"n":"REGISTEEL","t":["STEEL"],"d":379},{"n":"LATIAS","t":["DRAGON","PSYCHIC"],"d":380},{"n":"LATIAS-MEGA","t":["DRAGON","PSYCHIC"],"d":380},{"n":"LATIOS","t":["DRAGON","PSYCHIC"],"d":381},{"n":"LATIOS-MEGA","t":["DRAGON","PSYCHIC"],"d":381},{"n":"KYOGRE","t":["WATER"],"d":382},{"n":"KYOGRE-PRIMAL","t":["WATER"],"d":382},{"n":"GROUDON","t":["GROUND"],"d":383},{"n":"GROUDON-PRIMAL","t":["FIRE","GROUND"],"d":383},{"n":"RAYQUAZA","t":["DRAGON","FLYING"],"d":384},{"n":"RAYQUAZA-MEGA","t":["DRAGON","FLYING"],"d":384},{"n":"JIRACHI","t":["PSYCHIC","STEEL"],"d":385},{"n":"DEOXYS","t":["PSYCHIC"],"d":386},{"n":"DEOXYS-ATTACK","t":["PSYCHIC"],"d":386},{"n":"DEOXYS-DEFENSE","t":["PSYCHIC"],"d":386},{"n":"DEOXYS-SPEED","t":["PSYCHIC"],"d":386},{"n":"TURTWIG","t":["GRASS"],"d":387},{"n":"GROTLE","t":["GRASS"],"d":388},{"n":"TORTERRA","t":["GRASS","GROUND"],"d":389},{"n":"CHIMCHAR","t":["FIRE"],"d":390},{"n":"MONFERNO","t":["FIGHTING","FIRE"],"d":391},{"n":"INFERNAPE","t":["FIGHTING","FIRE"],"d":392},{"n":"PIPLUP","t":["WATER"],"d":393},{"n":"PRINPLUP","t":["WATER"],"d":394},{"n":"EMPOLEON","t":["STEEL","WATER"],"d":395},{"n":"STARLY","t":["FLYING","NORMAL"],"d":396},{"n":"STARAVIA","t":["FLYING","NORMAL"],"d":397},{"n":"STARAPTOR","t":["FLYING","NORMAL"],"d":398},{"n":"BIDOOF","t":["NORMAL"],"d":399},{"n":"BIBAREL","t":["NORMAL","WATER"],"d":400},{"n":"KRICKETOT","t":["BUG"],"d":401},{"n":"KRICKETUNE","t":["BUG"],"d":402},{"n":"SHINX","t":["ELECTRIC"],"d":403},{"n":"LUXIO","t":["ELECTRIC"],"d":404},{"n":"LUXRAY","t":["ELECTRIC"],"d":405},{"n":"BUDEW","t":["GRASS","POISON"],"d":406},{"n":"ROSERADE","t":["GRASS","POISON"],"d":407},{"n":"CRANIDOS","t":["ROCK"],"d":408},{"n":"RAMPARDOS","t":["ROCK"],"d":409},{"n":"SHIELDON","t":["ROCK","STEEL"],"d":410},{"n":"BASTIODON","t":["ROCK","STEEL"],"d":411},{"n":"BURMY","t":["BUG"],"d":412},{"n":"BURMY-SANDY","t":["BUG"],"d":412},{"n":"BURMY-TRASH","t":["BUG"],"d":412},{"n":"WORMADAM","t":["BUG","GRASS"],"d":413},{"n":"WORMADAM-SANDY","t":["BUG","GROUND"],"d":413},{"n":"WORMADAM-TRASH","t":["BUG","STEEL"],"d":413},{"n":"MOTHIM","t":["BUG","FLYING"],"d":414},{"n":"COMBEE","t":["BUG","FLYING"],"d":415},{"n":"VESPIQUEN","t":["BUG","FLYING"],"d":416},{"n":"PACHIRISU","t":["ELECTRIC"],"d":417},{"n":"BUIZEL","t":["WATER"],"d":418},{"n":"FLOATZEL","t":["WATER"],"d":419},{"n":"CHERUBI","t":["GRASS"],"d":420},{"n":"CHERRIM","t":["GRASS"],"d":421},{"n":"SHELLOS","t":["WATER"],"d":422},{"n":"GASTRODON","t":["GROUND","WATER"],"d":423},{"n":"AMBIPOM","t":["NORMAL"],"d":424},{"n":"DRIFLOON","t":["FLYING","GHOST"],"d":425},{"n":"DRIFBLIM","t":["FLYING","GHOST"],"d":426},{"n":"BUNEARY","t":["NORMAL"],"d":427},{"n":"LOPUNNY","t":["NORMAL"],"d":428},{"n":"LOPUNNY-MEGA","t":["FIGHTING","NORMAL"],"d":428},{"n":"MISMAGIUS","t":["GHOST"],"d":429},{"n":"HONCHKROW","t":["DARK","FLYING"],"d":430},{"n":"GLAMEOW","t":["NORMAL"],"d":431},{"n":"PURUGLY","t":["NORMAL"],"d":432},{"n":"CHINGLING","t":["PSYCHIC"],"d":433},{"n":"STUNKY","t":["DARK","POISON"],"d":434},{"n":"SKUNTANK","t":["DARK","POISON"],"d":435},{"n":"BRONZOR","t":["PSYCHIC","STEEL"],"d":436},{"n":"BRONZONG","t":["PSYCHIC","STEEL"],"d":437},{"n":"BONSLY","t":["ROCK"],"d":438},{"n":"MIME JR.","t":["FAIRY","PSYCHIC"],"d":439},{"n":"HAPPINY","t":["NORMAL"],"d":440},{"n":"CHATOT","t":["FLYING","NORMAL"],"d":441},{"n":"SPIRITOMB","t":["DARK","GHOST"],"d":442},{"n":"GIBLE","t":["DRAGON","GROUND"],"d":443},{"n":"GABITE","t":["DRAGON","GROUND"],"d":444},{"n":"GARCHOMP","t":["DRAGON","GROUND"],"d":445},{"n":"GARCHOMP-MEGA","t":["DRAGON","GROUND"],"d":445},{"n":"MUNCHLAX","t":["NORMAL"],"d":446},{"n":"RIOLU","t":["FIGHTING"],"d":447},{"n":"LUCARIO","t":["FIGHTING","STEEL"],"d":448},{"n":"LUCARIO-MEGA","t":["FIGHTING","STEEL"],"d":448},{"n":"HIPPOPOTAS","t":["GROUND"],"d":449},{"n":"HIPPOWDON","t":["GROUND"],"d":450},{"n":"SKORUPI","t":["BUG","POISON"],"d":451},{"n":"DRAPION","t":["DARK","POISON"],"d":452},{"n":"CROAGUNK","t":["FIGHTING","POISON"],"d":453},{"n":"TOXICROAK","t":["FIGHTING","POISON"],"d":454},{"n":"CARNIVINE","t":["GRASS"],"d":455},{"n":"FINNEON","t":["WATER"],"d":456},{"n":"LUMINEON","t":["WATER"],"d":457},{"n":"MANTYKE","t":["FLYING","WATER"],"d":458},{"n":"SNOVER","t":["GRASS","ICE"],"d":459},{"n":"ABOMASNOW","t":["GRASS","ICE"],"d":460},{"n":"ABOMASNOW-MEGA","t":["GRASS","ICE"],"d":460},{"n":"WEAVILE","t":["DARK","ICE"],"d":461},{"n":"MAGNEZONE","t":["ELECTRIC","STEEL"],"d":462},{"n":"LICKILICKY","t":["NORMAL"],"d":463},{"n":"RHYPERIOR","t":["GROUND","ROCK"],"d":464},{"n":"TANGROWTH","t":["GRASS"],"d":465},{"n":"ELECTIVIRE","t":["ELECTRIC"],"d":466},{"n":"MAGMORTAR","t":["FIRE"],"d":467},{"n":"TOGEKISS","t":["FAIRY","FLYING"],"d":468},{"n":"YANMEGA","t":["BUG","FLYING"],"d":469},{"n":"LEAFEON","t":["GRASS"],"d":470},{"n":"GLACEON","t":["ICE"],"d":471},{"n":"GLISCOR","t":["FLYING","GROUND"],"d":472},{"n":"MAMOSWINE","t":["GROUND","ICE"],"d":473},{"n":"PORYGON-Z","t":["NORMAL"],"d":474},{"n":"GALLADE","t":["FIGHTING","PSYCHIC"],"d":475},{"n":"GALLADE-MEGA","t":["FIGHTING","PSYCHIC"],"d":475},{"n":"PROBOPASS","t":["ROCK","STEEL"],"d":476},{"n":"DUSKNOIR","t":["GHOST"],"d":477},{"n":"FROSLASS","t":["GHOST","ICE"],"d":478},{"n":"ROTOM","t":["ELECTRIC","GHOST"],"d":479},{"n":"ROTOM-HEAT","t":["ELECTRIC","FIRE"],"d":479},{"n":"ROTOM-WASH","t":["ELECTRIC","WATER"],"d":479},{"n":"ROTOM-FROST","t":["ELECTRIC","ICE"],"d":479},{"n":"ROTOM-FAN","t":["ELECTRIC","FLYING"],"d":479},{"n":"ROTOM-MOW","t":["ELECTRIC","GRASS"],"d":479},{"n":"UXIE","t":["PSYCHIC"],"d":480},{"n":"MESPRIT","t":["PSYCHIC"],"d":481},{"n":"AZELF","t":["PSYCHIC"],"d":482},{"n":"DIALGA","t":["DRAGON","STEEL"],"d":483},{"n":"DIALGA-ORIGIN","t":["DRAGON","STEEL"],"d":483},{"n":"PALKIA","t":["DRAGON","WATER"],"d":484},{"n":"PALKIA-ORIGIN","t":["DRAGON","WATER"],"d":484},{"n":"HEATRAN","t":["FIRE","STEEL"],"d":485},{"n":"REGIGIGAS","t":["NORMAL"],"d":486},{"n":"GIRATINA","t":["DRAGON","GHOST"],"d":487},{"n":"GIRATINA-ORIGIN","t":["DRAGON","GHOST"],"d":487},{"n":"CRESSELIA","t":["PSYCHIC"],"d":488},{"n":"PHIONE","t":["WATER"],"d":489},{"n":"MANAPHY","t":["WATER"],"d":490},{"n":"DARKRAI","t":["DARK"],"d":491},{"n":"SHAYMIN","t":["GRASS"],"d":492},{"n":"SHAYMIN-SKY","t":["FLYING","GRASS"],"d":492},{"n":"ARCEUS","t":["NORMAL"],"d":493},{"n":"VICTINI","t":["FIRE","PSYCHIC"],"d":494},{"n":"SNIVY","t":["GRASS"],"d":495},{"n":"SERVINE","t":["GRASS"],"d":496},{"n":"SERPERIOR","t":["GRASS"],"d":497},{"n":"TEPIG","t":["FIRE"],"d":498},{"n":"PIGNITE","t":["FIGHTING","FIRE"],"d":499},{"n":"EMBOAR","t":["FIGHTING","FIRE"],"d":500},{"n":"OSHAWOTT","t":["WATER"],"d":501},{"n":"DEWOTT","t":["WATER"],"d":502},{"n":"SAMUROTT","t":["WATER"],"d":503},{"n":"SAMUROTT-HISUI","t":["DARK","WATER"],"d":503},{"n":"PATRAT","t":["NORMAL"],"d":504},{"n":"WATCHOG","t":["NORMAL"],"d":505},{"n":"LILLIPUP","t":["NORMAL"],"d":506},{"n":"HERDIER","t":["NORMAL"],"d":507},{"n":"STOUTLAND","t":["NORMAL"],"d":508},{"n":"PURRLOIN","t":["DARK"],"d":509},{"n":"LIEPARD","t":["DARK"],"d":510},{"n":"PANSAGE","t":["GRASS"],"d":511},{"n":"SIMISAGE","t":["GRASS"],"d":512},{"n":"PANSEAR","t":["FIRE"],"d":513},{"n":"SIMISEAR","t":["FIRE"],"d":514},{"n":"PANPOUR","t":["WATER"],"d":515},{"n":"SIMIPOUR","t":["WATER"],"d":516},{"n":"MUNNA","t":["PSYCHIC"],"d":517},{"n":"MUSHARNA","t":["PSYCHIC"],"d":518},{"n":"PIDOVE","t":["FLYING","NORMAL"],"d":519},{"n":"TRANQUILL","t":["FLYING","NORMAL"],"d":520},{"n":"UNFEZANT","t":["FLYING","NORMAL"],"d":521},{"n":"BLITZLE","t":["ELECTRIC"],"d":522},{"n":"ZEBSTRIKA","t":["ELECTRIC"],"d":523},{"n":"ROGGENROLA","t":["ROCK"],"d":524},{"n":"BOLDORE","t":["ROCK"],"d":525},{"n":"GIGALITH","t":["ROCK"],"d":526},{"n":"WOOBAT","t":["FLYING","PSYCHIC"],"d":527},{"n":"SWOOBAT","t":["FLYING","PSYCHIC"],"d":528},{"n":"DRILBUR","t":["GROUND"],"d":529},{"n":"EXCADRILL","t":["GROUND","STEEL"],"d":530},{"n":"AUDINO","t":["NORMAL"],"d":531},{"n":"AUDINO-MEGA","t":["FAIRY","NORMAL"],"d":531},{"n":"TIMBURR","t":["FIGHTING"],"d":532},{"n":"GURDURR","t":["FIGHTING"],"d":533},{"n":"CONKELDURR","t":["FIGHTING"],"d":534},{"n":"TYMPOLE","t":["WATER"],"d":535},{"n":"PALPITOAD","t":["GROUND","WATER"],"d":536},{"n":"SEISMITOAD","t":["GROUND","WATER"],"d":537},{"n":"THROH","t":["FIGHTING"],"d":538},{"n":"SAWK","t":["FIGHTING"],"d":539},{"n":"SEWADDLE","t":["BUG","GRASS"],"d":540},{"n":"SWADLOON","t":["BUG","GRASS"],"d":541},{"n":"LEAVANNY","t":["BUG","GRASS"],"d":542},{"n":"VENIPEDE","t":["BUG","POISON"],"d":543},{"n":"WHIRLIPEDE","t":["BUG","POISON"],"d":544},{"n":"SCOLIPEDE","t":["BUG","POISON"],"d":545},{"n":"COTTONEE","t":["FAIRY","GRASS"],"d":546},{"n":"WHIMSICOTT","t":["FAIRY","GRASS"],"d":547},{"n":"PETILIL","t":["GRASS"],"d":548},{"n":"LILLIGANT","t":["GRASS"],"d":549},{"n":"LILLIGANT-HISUI","t":["FIGHTING","GRASS"],"d":549},{"n":"BASCULIN","t":["WATER"],"d":550},{"n":"BASCULIN-BLUE-STRIPED","t":["WATER"],"d":550},{"n":"BASCULIN-WHITE-STRIPED","t":["WATER"],"d":550},{"n":"SANDILE","t":["DARK","GROUND"],"d":551},{"n":"KROKOROK","t":["DARK","GROUND"],"d":552},{"n":"KROOKODILE","t":["DARK","GROUND"],"d":553},{"n":"DARUMAKA","t":["FIRE"],"d":554},{"n":"DARUMAKA-GALAR","t":["ICE"],"d":554},{"n":"DARMANITAN","t":["FIRE"],"d":555},{"n":"DARMANITAN-ZEN","t":["FIRE","PSYCHIC"],"d":555},{"n":"DARMANITAN-GALAR","t":["ICE"],"d":555},{"n":"DARMANITAN-GALAR-ZEN","t":["FIRE","ICE"],"d":555},{"n":"MARACTUS","t":["GRASS"],"d":556},{"n":"DWEBBLE","t":["BUG","ROCK"],"d":557},{"n":"CRUSTLE","t":["BUG","ROCK"],"d":558},{"n":"SCRAGGY","t":["DARK","FIGHTING"],"d":559},{"n":"SCRAFTY","t":["DARK","FIGHTING"],"d":560},{"n":"SIGILYPH","t":["FLYING","PSYCHIC"],"d":561},{"n":"YAMASK","t":["GHOST"],"d":562},{"n":"YAMASK-GALAR","t":["GHOST","GROUND"],"d":562},{"n":"COFAGRIGUS","t":["GHOST"],"d":563},{"n":"TIRTOUGA","t":["ROCK","WATER"],"d":564},{"n":"CARRACOSTA","t":["ROCK","WATER"],"d":565},{"n":"ARCHEN","t":["FLYING","ROCK"],"d":566},{"n":"ARCHEOPS","t":["FLYING","ROCK"],"d":567},{"n":"TRUBBISH","t":["POISON"],"d":568},{"n":"GARBODOR","t":["POISON"],"d":569},{"n":"ZORUA","t":["DARK"],"d":570},{"n":"ZORUA-HISUI","t":["GHOST","NORMAL"],"d":570},{"n":"ZOROARK","t":["DARK"],"d":571},{"n":"ZOROARK-HISUI","t":["GHOST","NORMAL"],"d":571},{"n":"MINCCINO","t":["NORMAL"],"d":572},{"n":"CINCCINO","t":["NORMAL"],"d":573},{"n":"GOTHITA","t":["PSYCHIC"],"d":574},{"n":"GOTHORITA","t":["PSYCHIC"],"d":575},{"n":"GOTHITELLE","t":["PSYCHIC"],"d":576},{"n":"SOLOSIS","t":["PSYCHIC"],"d":577},{"n":"DUOSION","t":["PSYCHIC"],"d":578},{"n":"REUNICLUS","t":["PSYCHIC"],"d":579},{"n":"DUCKLETT","t":["FLYING","WATER"],"d":580},{"n":"SWANNA","t":["FLYING","WATER"],"d":581},{"n":"VANILLITE","t":["ICE"],"d":582},{"n":"VANILLISH","t":["ICE"],"d":583},{"n":"VANILLUXE","t":["ICE"],"d":584},{"n":"DEERLING","t":["GRASS","NORMAL"],"d":585},{"n":"SAWSBUCK","t":["GRASS","NORMAL"],"d":586},{"n":"EMOLGA","t":["ELECTRIC","FLYING"],"d":587},{"n":"KARRABLAST","t":["BUG"],"d":588},{"n":"ESCAVALIER","t":["BUG","STEEL"],"d":589},{"n":"FOONGUS","t":["GRASS","POISON"],"d":590},{"n":"AMOONGUSS","t":["GRASS","POISON"],"d":591},{"n":"FRILLISH","t":["GHOST","WATER"],"d":592},{"n":"JELLICENT","t":["GHOST","WATER"],"d":593},{"n":"ALOMOMOLA","t":["WATER"],"d":594},{"n":"JOLTIK","t":["BUG","ELECTRIC"],"d":595},{"n":"GALVANTULA","t":["BUG","ELECTRIC"],"d":596},{"n":"FERROSEED","t":["GRASS","STEEL"],"d":597},{"n":"FERROTHORN","t":["GRASS","STEEL"],"d":598},{"n":"KLINK","t":["STEEL"],"d":599},{"n":"KLANG","t":["STEEL"],"d":600},{"n":"KLINKLANG","t":["STEEL"],"d":601},{"n":"TYNAMO","t":["ELECTRIC"],"d":602},{"n":"EELEKTRIK","t":["ELECTRIC"],"d":603},{"n":"EELEKTROSS","t":["ELECTRIC"],"d":604},{"n":"ELGYEM","t":["PSYCHIC"],"d":605},{"n":"BEHEEYEM","t":["PSYCHIC"],"d":606},{"n":"LITWICK","t":["FIRE","GHOST"],"d":607},{"n":"LAMPENT","t":["FIRE","GHOST"],"d":608},{"n":"CHANDELURE","t":["FIRE","GHOST"],"d":609},{"n":"AXEW","t":["DRAGON"],"d":610},{"n":"FRAXURE","t":["DRAGON"],"d":611},{"n":"HAXORUS","t":["DRAGON"],"d":612},{"n":"CUBCHOO","t":["ICE"],"d":613},{"n":"BEARTIC","t":["ICE"],"d":614},{"n":"CRYOGONAL","t":["ICE"],"d":615},{"n":"SHELMET","t":["BUG"],"d":616},{"n":"ACCELGOR","t":["BUG"],"d":617},{"n":"STUNFISK","t":["ELECTRIC","GROUND"],"d":618},{"n":"STUNFISK-GALAR","t":["GROUND","STEEL"],"d":618},{"n":"MIENFOO","t":["FIGHTING"],"d":619},{"n":"MIENSHAO","t":["FIGHTING"],"d":620},{"n":"DRUDDIGON","t":["DRAGON"],"d":621},{"n":"GOLETT","t":["GHOST","GROUND"],"d":622},{"n":"GOLURK","t":["GHOST","GROUND"],"d":623},{"n":"PAWNIARD","t":["DARK","STEEL"],"d":624},{"n":"BISHARP","t":["DARK","STEEL"],"d":625},{"n":"BOUFFALANT","t":["NORMAL"],"d":626},{"n":"RUFFLET","t":["FLYING","NORMAL"],"d":627},{"n":"BRAVIARY","t":["FLYING","NORMAL"],"d":628},{"n":"BRAVIARY-HISUI","t":["FLYING","PSYCHIC"],"d":628},{"n":"VULLABY","t":["DARK","FLYING"],"d":629},{"n":"MANDIBUZZ","t":["DARK","FLYING"],"d":630},{"n":"HEATMOR","t":["FIRE"],"d":631},{"n":"DURANT","t":["BUG","STEEL"],"d":632},{"n":"DEINO","t":["DARK","DRAGON"],"d":633},{"n":"ZWEILOUS","t":["DARK","DRAGON"],"d":634},{"n":"HYDREIGON","t":["DARK","DRAGON"],"d":635},{"n":"LARVESTA","t":["BUG","FIRE"],"d":636},{"n":"VOLCARONA","t":["BUG","FIRE"],"d":637},{"n":"COBALION","t":["FIGHTING","STEEL"],"d":638},{"n":"TERRAKION","t":["FIGHTING","ROCK"],"d":639},{"n":"VIRIZION","t":["FIGHTING","GRASS"],"d":640},{"n":"TORNADUS","t":["FLYING"],"d":641},{"n":"TORNADUS-THERIAN","t":["FLYING"],"d":641},{"n":"THUNDURUS","t":["ELECTRIC","FLYING"],"d":642},{"n":"THUNDURUS-THERIAN","t":["ELECTRIC","FLYING"],"d":642},{"n":"RESHIRAM","t":["DRAGON","FIRE"],"d":643},{"n":"ZEKROM","t":["DRAGON","ELECTRIC"],"d":644},{"n":"LANDORUS","t":["FLYING","GROUND"],"d":645},{"n":"LANDORUS-THERIAN","t":["FLYING","GROUND"],"d":645},{"n":"KYUREM","t":["DRAGON","ICE"],"d":646},{"n":"KYUREM-WHITE","t":["DRAGON","ICE"],"d":646},{"n":"KYUREM-BLACK","t":["DRAGON","ICE"],"d":646},{"n":"KELDEO","t":["FIGHTING","WATER"],"d":647},{"n":"KELDEO-RESOLUTE","t":["FIGHTING","WATER"],"d":647},{"n":"MELOETTA","t":["FIGHTING","NORMAL"],"d":648},{"n":"GENESECT","t":["BUG","STEEL"],"d":649},{"n":"CHESPIN","t":["GRASS"],"d":650},{"n":"QUILLADIN","t":["GRASS"],"d":651},{"n":"CHESNAUGHT","t":["FIGHTING","GRASS"],"d":652},{"n":"FENNEKIN","t":["FIRE"],"d":653},{"n":"BRAIXEN","t":["FIRE"],"d":654},{"n":"DELPHOX","t":["FIRE","PSYCHIC"],"d":655},{"n":"FROAKIE","t":["WATER"],"d":656},{"n":"FROGADIER","t":["WATER"],"d":657},{"n":"GRENINJA","t":["DARK","WATER"],"d":658},{"n":"GRENINJA-ASH","t":["DARK","WATER"],"d":658},{"n":"BUNNELBY","t":["NORMAL"],"d":659},{"n":"DIGGERSBY","t":["GROUND","NORMAL"],"d":660},{"n":"FLETCHLING","t":["FLYING","NORMAL"],"d":661},{"n":"FLETCHINDER","t":["FIRE","FLYING"],"d":662},{"n":"TALONFLAME","t":["FIRE","FLYING"],"d":663},{"n":"SCATTERBUG","t":["BUG"],"d":664},{"n":"SPEWPA","t":["BUG"],"d":665},{"n":"VIVILLON","t":["BUG","FLYING"],"d":666},{"n":"LITLEO","t":["FIRE","NORMAL"],"d":667},{"n":"PYROAR","t":["FIRE","NORMAL"],"d":668},{"n":"FLAB\u00c9B\u00c9","t":["FAIRY"],"d":669},{"n":"FLOETTE","t":["FAIRY"],"d":670},{"n":"FLORGES","t":["FAIRY"],"d":671},{"n":"SKIDDO","t":["GRASS"],"d":672},{"n":"GOGOAT","t":["GRASS"],"d":673},{"n":"PANCHAM","t":["FIGHTING"],"d":674},{"n":"PANGORO","t":["DARK","FIGHTING"],"d":675},{"n":"FURFROU","t":["NORMAL"],"d":676},{"n":"ESPURR","t":["PSYCHIC"],"d":677},{"n":"MEOWSTIC-M","t":["PSYCHIC"],"d":678},{"n":"MEOWSTIC-F","t":["PSYCHIC"],"d":678},{"n":"HONEDGE","t":["GHOST","STEEL"],"d":679},{"n":"DOUBLADE","t":["GHOST","STEEL"],"d":680},{"n":"AEGISLASH","t":["GHOST","STEEL"],"d":681},{"n":"AEGISLASH-BLADE","t":["GHOST","STEEL"],"d":681},{"n":"SPRITZEE","t":["FAIRY"],"d":682},{"n":"AROMATISSE","t":["FAIRY"],"d":683},{"n":"SWIRLIX","t":["FAIRY"],"d":684},{"n":"SLURPUFF","t":["FAIRY"],"d":685},{"n":"INKAY","t":["DARK","PSYCHIC"],"d":686},{"n":"MALAMAR","t":["DARK","PSYCHIC"],"d":687},{"n":"BINACLE","t":["ROCK","WATER"],"d":688},{"n":"BARBARACLE","t":["ROCK","WATER"],"d":689},{"n":"SKRELP","t":["POISON","WATER"],"d":690},{"n":"DRAGALGE","t":["DRAGON","POISON"],"d":691},{"n":"CLAUNCHER","t":["WATER"],"d":692},{"n":"CLAWITZER","t":["WATER"],"d":693},{"n":"HELIOPTILE","t":["ELECTRIC","NORMAL"],"d":694},{"n":"HELIOLISK","t":["ELECTRIC","NORMAL"],"d":695},{"n":"TYRUNT","t":["DRAGON","ROCK"],"d":696},{"n":"TYRANTRUM","t":["DRAGON","ROCK"],"d":697},{"n":"AMAURA","t":["ICE","ROCK"],"d":698},{"n":"AURORUS","t":["ICE","ROCK"],"d":699},{"n":"SYLVEON","t":["FAIRY"],"d":700},{"n":"HAWLUCHA","t":["FIGHTING","FLYING"],"d":701},{"n":"DEDENNE","t":["ELECTRIC","FAIRY"],"d":702},{"n":"CARBINK","t":["FAIRY","ROCK"],"d":703},{"n":"GOOMY","t":["DRAGON"],"d":704},{"n":"SLIGGOO","t":["DRAGON"],"d":705},{"n":"SLIGGOO-HISUI","t":["DRAGON","STEEL"],"d":705},{"n":"GOODRA","t":["DRAGON"],"d":706},{"n":"GOODRA-HISUI","t":["DRAGON","STEEL"],"d":706},{"n":"KLEFKI","t":["FAIRY","STEEL"],"d":707},{"n":"PHANTUMP","t":["GHOST","GRASS"],"d":708},{"n":"TREVENANT","t":["GHOST","GRASS"],"d":709},{"n":"PUMPKABOO","t":["GHOST","GRASS"],"d":710},{"n":"PUMPKABOO-SMALL","t":["GHOST","GRASS"],"d":710},{"n":"PUMPKABOO-LARGE","t":["GHOST","GRASS"],"d":710},{"n":"PUMPKABOO-SUPER","t":["GHOST","GRASS"],"d":710},{"n":"GOURGEIST","t":["GHOST","GRASS"],"d":711},{"n":"GOURGEIST-SMALL","t":["GHOST","GRASS"],"d":711},{"n":"GOURGEIST-LARGE","t":["GHOST","GRASS"],"d":711},{"n":"GOURGEIST-SUPER","t":["GHOST","GRASS"],"d":711},{"n":"BERGMITE","t":["ICE"],"d":712},{"n":"AVALUGG","t":["ICE"],"d":713},{"n":"AVALUGG-HISUI","t":["ICE","ROCK"],"d":713},{"n":"NOIBAT","t":["DRAGON","FLYING"],"d":714},{"n":"NOIVERN","t":["DRAGON","FLYING"],"d":715},{"n":"XERNEAS","t":["FAIRY"],"d":716},{"n":"YVELTAL","t":["DARK","FLYING"],"d":717},{"n":"ZYGARDE","t":["DRAGON","GROUND"],"d":718},{"n":"ZYGARDE-10%","t":["DRAGON","GROUND"],"d":718},{"n":"ZYGARDE-COMPLETE","t":["DRAGON","GROUND"],"d":718},{"n":"DIANCIE","t":["FAIRY","ROCK"],"d":719},{"n":"DIANCIE-MEGA","t":["FAIRY","ROCK"],"d":719},{"n":"HOOPA","t":["GHOST","PSYCHIC"],"d":720},{"n":"HOOPA-UNBOUND","t":["DARK","PSYCHIC"],"d":720},{"n":"VOLCANION","t":["FIRE","WATER"],"d":721},{"n":"ROWLET","t":["FLYING","GRASS"],"d":722},{"n":"DARTRIX","t":["FLYING","GRASS"],"d":723},{"n":"DECIDUEYE","t":["GHOST","GRASS"],"d":724},{"n":"DECIDUEYE-HISUI","t":["FIGHTING","GRASS"],"d":724},{"n":"LITTEN","t":["FIRE"],"d":725},{"n":"TORRACAT","t":["FIRE"],"d":726},{"n":"INCINEROAR","t":["DARK","FIRE"],"d":727},{"n":"POPPLIO","t":["WATER"],"d":728},{"n":"BRIONNE","t":["WATER"],"d":729},{"n":"PRIMARINA","t":["FAIRY","WATER"],"d":730},{"n":"PIKIPEK","t":["FLYING","NORMAL"],"d":731},{"n":"TRUMBEAK","t":["FLYING","NORMAL"],"d":732},{"n":"TOUCANNON","t":["FLYING","NORMAL"],"d":733},{"n":"YUNGOOS","t":["NORMAL"],"d":734},{"n":"GUMSHOOS","t":["NORMAL"],"d":735},{"n":"GRUBBIN","t":["BUG"],"d":736},{"n":"CHARJABUG","t":["BUG","ELECTRIC"],"d":737},{"n":"VIKAVOLT","t":["BUG","ELECTRIC"],"d":738},{"n":"CRABRAWLER","t":["FIGHTING"],"d":739},{"n":"CRABOMINABLE","t":["FIGHTING","ICE"],"d":740},{"n":"ORICORIO","t":["FIRE","FLYING"],"d":741},{"n":"ORICORIO-POM-POM","t":["ELECTRIC","FLYING"],"d":741},{"n":"ORICORIO-PA'U","t":["FLYING","PSYCHIC"],"d":741},{"n":"ORICORIO-SENSU","t":["FLYING","GHOST"],"d":741},{"n":"CUTIEFLY","t":["BUG","FAIRY"],"d":742},{"n":"RIBOMBEE","t":["BUG","FAIRY"],"d":743},{"n":"ROCKRUFF","t":["ROCK"],"d":744},{"n":"LYCANROC","t":["ROCK"],"d":745},{"n":"LYCANROC-MIDNIGHT","t":["ROCK"],"d":745},{"n":"LYCANROC-DUSK","t":["ROCK"],"d":745},{"n":"WISHIWASHI","t":["WATER"],"d":746},{"n":"WISHIWASHI-SCHOOL","t":["WATER"],"d":746},{"n":"MAREANIE","t":["POISON","WATER"],"d":747},{"n":"TOXAPEX","t":["POISON","WATER"],"d":748},{"n":"MUDBRAY","t":["GROUND"],"d":749},{"n":"MUDSDALE","t":["GROUND"],"d":750},{"n":"DEWPIDER","t":["BUG","WATER"],"d":751},{"n":"ARAQUANID","t":["BUG","WATER"],"d":752},{"n":"FOMANTIS","t":["GRASS"],"d":753},{"n":"LURANTIS","t":["GRASS"],"d":754},{"n":"MORELULL","t":["FAIRY","GRASS"],"d":755},{"n":"SHIINOTIC","t":["FAIRY","GRASS"],"d":756},{"n":"SALANDIT","t":["FIRE","POISON"],"d":757},{"n":"SALAZZLE","t":["FIRE","POISON"],"d":758},{"n":"STUFFUL","t":["FIGHTING","NORMAL"],"d":759},{"n":"BEWEAR","t":["FIGHTING","NORMAL"],"d":760},{"n":"BOUNSWEET","t":["GRASS"],"d":761},{"n":"STEENEE","t":["GRASS"],"d":762},{"n":"TSAREENA","t":["GRASS"],"d":763},{"n":"COMFEY","t":["FAIRY"],"d":764},{"n":"ORANGURU","t":["NORMAL","PSYCHIC"],"d":765},{"n":"PASSIMIAN","t":["FIGHTING"],"d":766},{"n":"WIMPOD","t":["BUG","WATER"],"d":767},{"n":"GOLISOPOD","t":["BUG","WATER"],"d":768},{"n":"SANDYGAST","t":["GHOST","GROUND"],"d":769},{"n":"PALOSSAND","t":["GHOST","GROUND"],"d":770},{"n":"PYUKUMUKU","t":["WATER"],"d":771},{"n":"TYPE: NULL","t":["NORMAL"],"d":772},{"n":"SILVALLY","t":["NORMAL"],"d":773},{"n":"MINIOR-METEOR","t":["FLYING","ROCK"],"d":774},{"n":"MINIOR","t":["FLYING","ROCK"],"d":774},{"n":"KOMALA","t":["NORMAL"],"d":775},{"n":"TURTONATOR","t":["DRAGON","FIRE"],"d":776},{"n":"TOGEDEMARU","t":["ELECTRIC","STEEL"],"d":777},{"n":"MIMIKYU","t":["FAIRY","GHOST"],"d":778},{"n":"BRUXISH","t":["PSYCHIC","WATER"],"d":779},{"n":"DRAMPA","t":["DRAGON","NORMAL"],"d":780},{"n":"DHELMISE","t":["GHOST","GRASS"],"d":781},{"n":"JANGMO-O","t":["DRAGON"],"d":782},{"n":"HAKAMO-O","t":["DRAGON","FIGHTING"],"d":783},{"n":"KOMMO-O","t":["DRAGON","FIGHTING"],"d":784},{"n":"TAPU KOKO","t":["ELECTRIC","FAIRY"],"d":785},{"n":"TAPU LELE","t":["FAIRY","PSYCHIC"],"d":786},{"n":"TAPU BULU","t":["FAIRY","GRASS"],"d":787},{"n":"TAPU FINI","t":["FAIRY","WATER"],"d":788},{"n":"COSMOG","t":["PSYCHIC"],"d":789},{"n":"COSMOEM","t":["PSYCHIC"],"d":790},{"n":"SOLGALEO","t":["PSYCHIC","STEEL"],"d":791},{"n":"LUNALA","t":["GHOST","PSYCHIC"],"d":792},{"n":"NIHILEGO","t":["POISON","ROCK"],"d":793},{"n":"BUZZWOLE","t":["BUG","FIGHTING"],"d":794},{"n":"PHEROMOSA","t":["BUG","FIGHTING"],"d":795},{"n":"XURKITREE","t":["ELECTRIC"],"d":796},{"n":"CELESTEELA","t":["FLYING","STEEL"],"d":797},{"n":"KARTANA","t":["GRASS","STEEL"],"d":798},{"n":"GUZZLORD","t":["DARK","DRAGON"],"d":799},{"n":"NECROZMA","t":["PSYCHIC"],"d":800},{"n":"NECROZMA-DUSK-MANE","t":["PSYCHIC","STEEL"],"d":800},{"n":"NECROZMA-DAWN-WINGS","t":["GHOST","PSYCHIC"],"d":800},{"n":"NECROZMA-ULTRA","t":["DRAGON","PSYCHIC"],"d":800},{"n":"MAGEARNA","t":["FAIRY","STEEL"],"d":801},{"n":"MARSHADOW","t":["FIGHTING","GHOST"],"d":802},{"n":"POIPOLE","t":["POISON"],"d":803},{"n":"NAGANADEL","t":["DRAGON","POISON"],"d":804},{"n":"STAKATAKA","t":["ROCK","STEEL"],"d":805},{"n":"BLACEPHALON","t":["FIRE","GHOST"],"d":806},{"n":"ZERAORA","t":["ELECTRIC"],"d":807},{"n":"MELTAN","t":["STEEL"],"d":808},{"n":"MELMETAL","t":["STEEL"],"d":809},{"n":"GROOKEY","t":["GRASS"],"d":810},{"n":"THWACKEY","t":["GRASS"],"d":811},{"n":"RILLABOOM","t":["GRASS"],"d":812},{"n":"SCORBUNNY","t":["FIRE"],"d":813},{"n":"RABOOT","t":["FIRE"],"d":814},{"n":"CINDERACE","t":["FIRE"],"d":815},{"n":"SOBBLE","t":["WATER"],"d":816},{"n":"DRIZZILE","t":["WATER"],"d":817},{"n":"INTELEON","t":["WATER"],"d":818},{"n":"SKWOVET","t":["NORMAL"],"d":819},{"n":"GREEDENT","t":["NORMAL"],"d":820},{"n":"ROOKIDEE","t":["FLYING"],"d":821},{"n":"CORVISQUIRE","t":["FLYING"],"d":822},{"n":"CORVIKNIGHT","t":["FLYING","STEEL"],"d":823},{"n":"BLIPBUG","t":["BUG"],"d":824},{"n":"DOTTLER","t":["BUG","PSYCHIC"],"d":825},{"n":"ORBEETLE","t":["BUG","PSYCHIC"],"d":826},{"n":"NICKIT","t":["DARK"],"d":827},{"n":"THIEVUL","t":["DARK"],"d":828},{"n":"GOSSIFLEUR","t":["GRASS"],"d":829},{"n":"ELDEGOSS","t":["GRASS"],"d":830},{"n":"WOOLOO","t":["NORMAL"],"d":831},{"n":"DUBWOOL","t":["NORMAL"],"d":832},{"n":"CHEWTLE","t":["WATER"],"d":833},{"n":"DREDNAW","t":["ROCK","WATER"],"d":834},{"n":"YAMPER","t":["ELECTRIC"],"d":835},{"n":"BOLTUND","t":["ELECTRIC"],"d":836},{"n":"ROLYCOLY","t":["ROCK"],"d":837},{"n":"CARKOL","t":["FIRE","ROCK"],"d":838},{"n":"COALOSSAL","t":["FIRE","ROCK"],"d":839},{"n":"APPLIN","t":["DRAGON","GRASS"],"d":840},{"n":"FLAPPLE","t":["DRAGON","GRASS"],"d":841},{"n":"APPLETUN","t":["DRAGON","GRASS"],"d":842},{"n":"SILICOBRA","t":["GROUND"],"d":843},{"n":"SANDACONDA","t":["GROUND"],"d":844},{"n":"CRAMORANT","t":["FLYING","WATER"],"d":845},{"n":"ARROKUDA","t":["WATER"],"d":846},{"n":"BARRASKEWDA","t":["WATER"],"d":847},{"n":"TOXEL","t":["ELECTRIC","POISON"],"d":848},{"n":"TOXTRICITY","t":["ELECTRIC","POISON"],"d":849},{"n":"TOXTRICITY-LOW-KEY","t":["ELECTRIC","POISON"],"d":849},{"n":"SIZZLIPEDE","t":["BUG","FIRE"],"d":850},{"n":"CENTISKORCH","t":["BUG","FIRE"],"d":851},{"n":"CLOBBOPUS","t":["FIGHTING"],"d":852},{"n":"GRAPPLOCT","t":["FIGHTING"],"d":853},{"n":"SINISTEA","t":["GHOST"],"d":854},{"n":"POLTEAGEIST","t":["GHOST"],"d":855},{"n":"HATENNA","t":["PSYCHIC"],"d":856},{"n":"HATTREM","t":["PSYCHIC"],"d":857},{"n":"HATTERENE","t":["FAIRY","PSYCHIC"],"d":858},{"n":"IMPIDIMP","t":["DARK","FAIRY"],"d":859},{"n":"MORGREM","t":["DARK","FAIRY"],"d":860},{"n":"GRIMMSNARL","t":["DARK","FAIRY"],"d":861},{"n":"OBSTAGOON","t":["DARK","NORMAL"],"d":862},{"n":"PERRSERKER","t":["STEEL"],"d":863},{"n":"CURSOLA","t":["GHOST"],"d":864},{"n":"SIRFETCH'D","t":["FIGHTING"],"d":865},{"n":"MR. RIME","t":["ICE","PSYCHIC"],"d":866},{"n":"RUNERIGUS","t":["GHOST","GROUND"],"d":867},{"n":"MILCERY","t":["FAIRY"],"d":868},{"n":"ALCREMIE","t":["FAIRY"],"d":869},{"n":"FALINKS","t":["FIGHTING"],"d":870},{"n":"PINCURCHIN","t":["ELECTRIC"],"d":871},{"n":"SNOM","t":["BUG","ICE"],"d":872},{"n":"FROSMOTH","t":["BUG","ICE"],"d":873},{"n":"STONJOURNER","t":["ROCK"],"d":874},{"n":"EISCUE","t":["ICE"],"d":875},{"n":"EISCUE-NOICE","t":["ICE"],"d":875},{"n":"INDEEDEE-M","t":["NORMAL","PSYCHIC"],"d":876},{"n":"INDEEDEE-F","t":["NORMAL","PSYCHIC"],"d":876},{"n":"MORPEKO","t":["DARK","ELECTRIC"],"d":877},{"n":"MORPEKO-HANGRY","t":["DARK","ELECTRIC"],"d":877},{"n":"CUFANT","t":["STEEL"],"d":878},{"n":"COPPERAJAH","t":["STEEL"],"d":879},{"n":"DRACOZOLT","t":["DRAGON","ELECTRIC"],"d":880},{"n":"ARCTOZOLT","t":["ELECTRIC","ICE"],"d":881},{"n":"DRACOVISH","t":["DRAGON","WATER"],"d":882},{"n":"ARCTOVISH","t":["ICE","WATER"],"d":883},{"n":"DURALUDON","t":["DRAGON","STEEL"],"d":884},{"n":"DREEPY","t":["DRAGON","GHOST"],"d":885},{"n":"DRAKLOAK","t":["DRAGON","GHOST"],"d":886},{"n":"DRAGAPULT","t":["DRAGON","GHOST"],"d":887},{"n":"ZACIAN","t":["FAIRY"],"d":888},{"n":"ZACIAN-CROWNED","t":["FAIRY","STEEL"],"d":888},{"n":"ZAMAZENTA","t":["FIGHTING"],"d":889},{"n":"ZAMAZENTA-CROWNED","t":["FIGHTING","STEEL"],"d":889},{"n":"ETERNATUS","t":["DRAGON","POISON"],"d":890},{"n":"ETERNATUS-ETERNAMAX","t":["DRAGON","POISON"],"d":890},{"n":"KUBFU","t":["FIGHTING"],"d":891},{"n":"URSHIFU","t":["DARK","FIGHTING"],"d":892},{"n":"URSHIFU-RAPID-STRIKE","t":["FIGHTING","WATER"],"d":892},{"n":"ZARUDE","t":["DARK","GRASS"],"d":893},{"n":"REGIELEKI","t":["ELECTRIC"],"d":894},{"n":"REGIDRAGO","t":["DRAGON"],"d":895},{"n":"GLASTRIER","t":["ICE"],"d":896},{"n":"SPECTRIER","t":["GHOST"],"d":897},{"n":"CALYREX","t":["GRASS","PSYCHIC"],"d":898},{"n":"CALYREX-ICE","t":["ICE","PSYCHIC"],"d":898},{"n":"CALYREX-SHADOW","t":["GHOST","PSYCHIC"],"d":898},{"n":"WYRDEER","t":["NORMAL","PSYCHIC"],"d":899},{"n":"KLEAVOR","t":["BUG","ROCK"],"d":900},{"n":"URSALUNA","t":["GROUND","NORMAL"],"d":901},{"n":"BASCULEGION-M","t":["GHOST","WATER"],"d":902},{"n":"BASCULEGION-F","t":["GHOST","WATER"],"d":902},{"n":"SNEASLER","t":["FIGHTING","POISON"],"d":903},{"n":"OVERQWIL","t":["DARK","POISON"],"d":904},{"n":"ENAMORUS","t":["FAIRY","FLYING"],"d":905},{"n":"ENAMORUS-THERIAN","t":["FAIRY","FLYING"],"d":905},{"n":"SPRIGATITO","t":["GRASS"],"d":906},{"n":"FLORAGATO","t":["GRASS"],"d":907},{"n":"MEOWSCARADA","t":["DARK","GRASS"],"d":908},{"n":"FUECOCO","t":["FIRE"],"d":909},{"n":"CROCALOR","t":["FIRE"],"d":910},{"n":"SKELEDIRGE","t":["FIRE","GHOST"],"d":911},{"n":"QUAXLY","t":["WATER"],"d":912},{"n":"QUAXWELL","t":["WATER"],"d":913},{"n":"QUAQUAVAL","t":["FIGHTING","WATER"],"d":914},{"n":"LECHONK","t":["NORMAL"],"d":915},{"n":"OINKOLOGNE-M","t":["NORMAL"],"d":916},{"n":"OINKOLOGNE-F","t":["NORMAL"],"d":916},{"n":"TAROUNTULA","t":["BUG"],"d":917},{"n":"SPIDOPS","t":["BUG"],"d":918},{"n":"NYMBLE","t":["BUG"],"d":919},{"n":"LOKIX","t":["BUG","DARK"],"d":920},{"n":"PAWMI","t":["ELECTRIC"],"d":921},{"n":"PAWMO","t":["ELECTRIC","FIGHTING"],"d":922},{"n":"PAWMOT","t":["ELECTRIC","FIGHTING"],"d":923},{"n":"TANDEMAUS","t":["NORMAL"],"d":924},{"n":"MAUSHOLD","t":["NORMAL"],"d":925},{"n":"MAUSHOLD-FOUR","t":["NORMAL"],"d":925},{"n":"FIDOUGH","t":["FAIRY"],"d":926},{"n":"DACHSBUN","t":["FAIRY"],"d":927},{"n":"SMOLIV","t":["GRASS","NORMAL"],"d":928},{"n":"DOLLIV","t":["GRASS","NORMAL"],"d":929},{"n":"ARBOLIVA","t":["GRASS","NORMAL"],"d":930},{"n":"SQUAWKABILLY","t":["FLYING","NORMAL"],"d":931},{"n":"SQUAWKABILLY-BLUE","t":["FLYING","NORMAL"],"d":931},{"n":"SQUAWKABILLY-YELLOW","t":["FLYING","NORMAL"],"d":931},{"n":"SQUAWKABILLY-WHITE","t":["FLYING","NORMAL"],"d":931},{"n":"NACLI","t":["ROCK"],"d":932},{"n":"NACLSTACK","t":["ROCK"],"d":933},{"n":"GARGANACL","t":["ROCK"],"d":934},{"n":"CHARCADET","t":["FIRE"],"d":935},{"n":"ARMAROUGE","t":["FIRE","PSYCHIC"],"d":936},{"n":"CERULEDGE","t":["FIRE","GHOST"],"d":937},{"n":"TADBULB","t":["ELECTRIC"],"d":938},{"n":"BELLIBOLT","t":["ELECTRIC"],"d":939},{"n":"WATTREL","t":["ELECTRIC","FLYING"],"d":940},{"n":"KILOWATTREL","t":["ELECTRIC","FLYING"],"d":941},{"n":"MASCHIFF","t":["DARK"],"d":942},{"n":"MABOSSTIFF","t":["DARK"],"d":943},{"n":"SHROODLE","t":["NORMAL","POISON"],"d":944},{"n":"GRAFAIAI","t":["NORMAL","POISON"],"d":945},{"n":"BRAMBLIN","t":["GHOST","GRASS"],"d":946},{"n":"BRAMBLEGHAST","t":["GHOST","GRASS"],"d":947},{"n":"TOEDSCOOL","t":["GRASS","GROUND"],"d":948},{"n":"TOEDSCRUEL","t":["GRASS","GROUND"],"d":949},{"n":"KLAWF","t":["ROCK"],"d":950},{"n":"CAPSAKID","t":["GRASS"],"d":951},{"n":"SCOVILLAIN","t":["FIRE","GRASS"],"d":952},{"n":"RELLOR","t":["BUG"],"d":953},{"n":"RABSCA","t":["BUG","PSYCHIC"],"d":954},{"n":"FLITTLE","t":["PSYCHIC"],"d":955},{"n":"ESPATHRA","t":["PSYCHIC"],"d":956},{"n":"TINKATINK","t":["FAIRY","STEEL"],"d":957},{"n":"TINKATUFF","t":["FAIRY","STEEL"],"d":958},{"n":"TINKATON","t":["FAIRY","STEEL"],"d":959},{"n":"WIGLETT","t":["WATER"],"d":960},{"n":"WUGTRIO","t":["WATER"],"d":961},{"n":"BOMBIRDIER","t":["DARK","FLYING"],"d":962},{"n":"FINIZEN","t":["WATER"],"d":963},{"n":"PALAFIN","t":["WATER"],"d":964},{"n":"PALAFIN-HERO","t":["WATER"],"d":964},{"n":"VAROOM","t":["POISON","STEEL"],"d":965},{"n":"REVAVROOM","t":["POISON","STEEL"],"d":966},{"n":"CYCLIZAR","t":["DRAGON","NORMAL"],"d":967},{"n":"ORTHWORM","t":["STEEL"],"d":968},{"n":"GLIMMET","t":["POISON","ROCK"],"d":969},{"n":"GLIMMORA","t":["POISON","ROCK"],"d":970},{"n":"GREAVARD","t":["GHOST"],"d":971},{"n":"HOUNDSTONE","t":["GHOST"],"d":972},{"n":"FLAMIGO","t":["FIGHTING","FLYING"],"d":973},{"n":"CETODDLE","t":["ICE"],"d":974},{"n":"CETITAN","t":["ICE"],"d":975},{"n":"VELUZA","t":["PSYCHIC","WATER"],"d":976},{"n":"DONDOZO","t":["WATER"],"d":977},{"n":"TATSUGIRI","t":["DRAGON","WATER"],"d":978},{"n":"ANNIHILAPE","t":["FIGHTING","GHOST"],"d":979},{"n":"CLODSIRE","t":["GROUND","POISON"],"d":980},{"n":"FARIGIRAF","t":["NORMAL","PSYCHIC"],"d":981},{"n":"DUDUNSPARCE","t":["NORMAL"],"d":982},{"n":"DUDUNSPARCE-THREE","t":["NORMAL"],"d":982},{"n":"KINGAMBIT","t":["DARK","STEEL"],"d":983},{"n":"GREAT TUSK","t":["FIGHTING","GROUND"],"d":984},{"n":"SCREAM TAIL","t":["FAIRY","PSYCHIC"],"d":985},{"n":"BRUTE BONNET","t":["DARK","GRASS"],"d":986},{"n":"FLUTTER MANE","t":["FAIRY","GHOST"],"d":987},{"n":"SLITHER WING","t":["BUG","FIGHTING"],"d":988},{"n":"SANDY SHOCKS","t":["ELECTRIC","GROUND"],"d":989},{"n":"IRON TREADS","t":["GROUND","STEEL"],"d":990},{"n":"IRON BUNDLE","t":["ICE","WATER"],"d":991},{"n":"IRON HANDS","t":["ELECTRIC","FIGHTING"],"d":992},{"n":"IRON JUGULIS","t":["DARK","FLYING"],"d":993},{"n":"IRON MOTH","t":["FIRE","POISON"],"d":994},{"n":"IRON THORNS","t":["ELECTRIC","ROCK"],"d":995},{"n":"FRIGIBAX","t":["DRAGON","ICE"],"d":996},{"n":"ARCTIBAX","t":["DRAGON","ICE"],"d":997},{"n":"BAXCALIBUR","t":["DRAGON","ICE"],"d":998},{"n":"GIMMIGHOUL","t":["GHOST"],"d":999},{"n":"GIMMIGHOUL-ROAMING","t":["GHOST"],"d":999},{"n":"GHOLDENGO","t":["GHOST","STEEL"],"d":1000},{"n":"WO-CHIEN","t":["DARK","GRASS"],"d":1001},{"n":"CHIEN-PAO","t":["DARK","ICE"],"d":1002},{"n":"TING-LU","t":["DARK","GROUND"],"d":1003},{"n":"CHI-YU","t":["DARK","FIRE"],"d":1004},{"n":"ROARING MOON","t":["DARK","DRAGON"],"d":1005},{"n":"IRON VALIANT","t":["FAIRY","FIGHTING"],"d":1006},{"n":"KORAIDON","t":["DRAGON","FIGHTING"],"d":1007},{"n":"MIRAIDON","t":["DRAGON","ELECTRIC"],"d":1008}]
\ No newline at end of file
+const TYPES=["NORMAL","FIRE","WATER","GRASS","ELECTRIC","ICE","FIGHTING","POISON","GROUND","FLYING","PSYCHIC","BUG","ROCK","GHOST","DARK","DRAGON","STEEL","FAIRY"];
+const DEX=[{"n":"BULBASAUR","t":[3,7],"y":0,"d":1},{"n":"IVYSAUR","t":[3,7],"y":0,"d":2},{"n":"VENUSAUR","t":[3,7],"y":0,"d":3},{"n":"VENUSAUR-MEGA","t":[3,7],"y":0,"d":3},{"n":"CHARMANDER","t":[1],"y":1,"d":4},{"n":"CHARMELEON","t":[1],"y":1,"d":5},{"n":"CHARIZARD","t":[1,9],"y":2,"d":6},{"n":"CHARIZARD-MEGA-X","t":[15,1],"y":3,"d":6},{"n":"CHARIZARD-MEGA-Y","t":[1,9],"y":2,"d":6},{"n":"SQUIRTLE","t":[2],"y":4,"d":7},{"n":"WARTORTLE","t":[2],"y":4,"d":8},{"n":"BLASTOISE","t":[2],"y":4,"d":9},{"n":"BLASTOISE-MEGA","t":[2],"y":4,"d":9},{"n":"CATERPIE","t":[11],"y":5,"d":10},{"n":"METAPOD","t":[11],"y":5,"d":11},{"n":"BUTTERFREE","t":[11,9],"y":6,"d":12},{"n":"WEEDLE","t":[11,7],"y":7,"d":13},{"n":"KAKUNA","t":[11,7],"y":7,"d":14},{"n":"BEEDRILL","t":[11,7],"y":7,"d":15},{"n":"BEEDRILL-MEGA","t":[11,7],"y":7,"d":15},{"n":"PIDGEY","t":[9,0],"y":8,"d":16},{"n":"PIDGEOTTO","t":[9,0],"y":8,"d":17},{"n":"PIDGEOT","t":[9,0],"y":8,"d":18},{"n":"PIDGEOT-MEGA","t":[9,0],"y":8,"d":18},{"n":"RATTATA","t":[0],"y":9,"d":19},{"n":"RATTATA-ALOLA","t":[14,0],"y":10,"d":19},{"n":"RATICATE","t":[0],"y":9,"d":20},{"n":"RATICATE-ALOLA","t":[14,0],"y":10,"d":20},{"n":"SPEAROW","t":[9,0],"y":8,"d":21},{"n":"FEAROW","t":[9,0],"y":8,"d":22},{"n":"EKANS","t":[7],"y":11,"d":23},{"n":"ARBOK","t":[7],"y":11,"d":24},{"n":"PIKACHU","t":[4],"y":12,"d":25},{"n":"PIKACHU-PARTNER","t":[4],"y":12,"d":25},{"n":"RAICHU","t":[4],"y":12,"d":26},{"n":"RAICHU-ALOLA","t":[4,10],"y":13,"d":26},{"n":"SANDSHREW","t":[8],"y":14,"d":27},{"n":"SANDSHREW-ALOLA","t":[5,16],"y":15,"d":27},{"n":"SANDSLASH","t":[8],"y":14,"d":28},{"n":"SANDSLASH-ALOLA","t":[5,16],"y":15,"d":28},{"n":"NIDORAN\u2640","t":[7],"y":11,"d":29},{"n":"NIDORINA","t":[7],"y":11,"d":30},{"n":"NIDOQUEEN","t":[8,7],"y":16,"d":31},{"n":"NIDORAN\u2642","t":[7],"y":11,"d":32},{"n":"NIDORINO","t":[7],"y":11,"d":33},{"n":"NIDOKING","t":[8,7],"y":16,"d":34},{"n":"CLEFAIRY","t":[17],"y":17,"d":35},{"n":"CLEFABLE","t":[17],"y":17,"d":36},{"n":"VULPIX","t":[1],"y":1,"d":37},{"n":"VULPIX-ALOLA","t":[5],"y":18,"d":37},{"n":"NINETALES","t":[1],"y":1,"d":38},{"n":"NINETALES-ALOLA","t":[17,5],"y":19,"d":38},{"n":"JIGGLYPUFF","t":[17,0],"y":20,"d":39},{"n":"WIGGLYTUFF","t":[17,0],"y":20,"d":40},{"n":"ZUBAT","t":[9,7],"y":21,"d":41},{"n":"GOLBAT","t":[9,7],"y":21,"d":42},{"n":"ODDISH","t":[3,7],"y":0,"d":43},{"n":"GLOOM","t":[3,7],"y":0,"d":44},{"n":"VILEPLUME","t":[3,7],"y":0,"d":45},{"n":"PARAS","t":[11,3],"y":22,"d":46},{"n":"PARASECT","t":[11,3],"y":22,"d":47},{"n":"VENONAT","t":[11,7],"y":7,"d":48},{"n":"VENOMOTH","t":[11,7],"y":7,"d":49},{"n":"DIGLETT","t":[8],"y":14,"d":50},{"n":"DIGLETT-ALOLA","t":[8,16],"y":23,"d":50},{"n":"DUGTRIO","t":[8],"y":14,"d":51},{"n":"DUGTRIO-ALOLA","t":[8,16],"y":23,"d":51},{"n":"MEOWTH","t":[0],"y":9,"d":52},{"n":"MEOWTH-ALOLA","t":[14],"y":24,"d":52},{"n":"MEOWTH-GALAR","t":[16],"y":25,"d":52},{"n":"PERSIAN","t":[0],"y":9,"d":53},{"n":"PERSIAN-ALOLA","t":[14],"y":24,"d":53},{"n":"PSYDUCK","t":[2],"y":4,"d":54},{"n":"GOLDUCK","t":[2],"y":4,"d":55},{"n":"MANKEY","t":[6],"y":26,"d":56},{"n":"PRIMEAPE","t":[6],"y":26,"d":57},{"n":"GROWLITHE","t":[1],"y":1,"d":58},{"n":"GROWLITHE-HISUI","t":[1,12],"y":27,"d":58},{"n":"ARCANINE","t":[1],"y":1,"d":59},{"n":"ARCANINE-HISUI","t":[1,12],"y":27,"d":59},{"n":"POLIWAG","t":[2],"y":4,"d":60},{"n":"POLIWHIRL","t":[2],"y":4,"d":61},{"n":"POLIWRATH","t":[6,2],"y":28,"d":62},{"n":"ABRA","t":[10],"y":29,"d":63},{"n":"KADABRA","t":[10],"y":29,"d":64},{"n":"ALAKAZAM","t":[10],"y":29,"d":65},{"n":"ALAKAZAM-MEGA","t":[10],"y":29,"d":65},{"n":"MACHOP","t":[6],"y":26,"d":66},{"n":"MACHOKE","t":[6],"y":26,"d":67},{"n":"MACHAMP","t":[6],"y":26,"d":68},{"n":"BELLSPROUT","t":[3,7],"y":0,"d":69},{"n":"WEEPINBELL","t":[3,7],"y":0,"d":70},{"n":"VICTREEBEL","t":[3,7],"y":0,"d":71},{"n":"TENTACOOL","t":[7,2],"y":30,"d":72},{"n":"TENTACRUEL","t":[7,2],"y":30,"d":73},{"n":"GEODUDE","t":[8,12],"y":31,"d":74},{"n":"GEODUDE-ALOLA","t":[4,12],"y":32,"d":74},{"n":"GRAVELER","t":[8,12],"y":31,"d":75},{"n":"GRAVELER-ALOLA","t":[4,12],"y":32,"d":75},{"n":"GOLEM","t":[8,12],"y":31,"d":76},{"n":"GOLEM-ALOLA","t":[4,12],"y":32,"d":76},{"n":"PONYTA","t":[1],"y":1,"d":77},{"n":"PONYTA-GALAR","t":[10],"y":29,"d":77},{"n":"RAPIDASH","t":[1],"y":1,"d":78},{"n":"RAPIDASH-GALAR","t":[17,10],"y":33,"d":78},{"n":"SLOWPOKE","t":[10,2],"y":34,"d":79},{"n":"SLOWPOKE-GALAR","t":[10],"y":29,"d":79},{"n":"SLOWBRO","t":[10,2],"y":34,"d":80},{"n":"SLOWBRO-MEGA","t":[10,2],"y":34,"d":80},{"n":"SLOWBRO-GALAR","t":[7,10],"y":35,"d":80},{"n":"MAGNEMITE","t":[4,16],"y":36,"d":81},{"n":"MAGNETON","t":[4,16],"y":36,"d":82},{"n":"FARFETCH'D","t":[9,0],"y":8,"d":83},{"n":"FARFETCH'D-GALAR","t":[6],"y":26,"d":83},{"n":"DODUO","t":[9,0],"y":8,"d":84},{"n":"DODRIO","t":[9,0],"y":8,"d":85},{"n":"SEEL","t":[2],"y":4,"d":86},{"n":"DEWGONG","t":[5,2],"y":37,"d":87},{"n":"GRIMER","t":[7],"y":11,"d":88},{"n":"GRIMER-ALOLA","t":[14,7],"y":38,"d":88},{"n":"MUK","t":[7],"y":11,"d":89},{"n":"MUK-ALOLA","t":[14,7],"y":38,"d":89},{"n":"SHELLDER","t":[2],"y":4,"d":90},{"n":"CLOYSTER","t":[5,2],"y":37,"d":91},{"n":"GASTLY","t":[13,7],"y":39,"d":92},{"n":"HAUNTER","t":[13,7],"y":39,"d":93},{"n":"GENGAR","t":[13,7],"y":39,"d":94},{"n":"GENGAR-MEGA","t":[13,7],"y":39,"d":94},{"n":"ONIX","t":[8,12],"y":31,"d":95},{"n":"DROWZEE","t":[10],"y":29,"d":96},{"n":"HYPNO","t":[10],"y":29,"d":97},{"n":"KRABBY","t":[2],"y":4,"d":98},{"n":"KINGLER","t":[2],"y":4,"d":99},{"n":"VOLTORB","t":[4],"y":12,"d":100},{"n":"VOLTORB-HISUI","t":[4,3],"y":40,"d":100},{"n":"ELECTRODE","t":[4],"y":12,"d":101},{"n":"ELECTRODE-HISUI","t":[4,3],"y":40,"d":101},{"n":"EXEGGCUTE","t":[3,10],"y":41,"d":102},{"n":"EXEGGUTOR","t":[3,10],"y":41,"d":103},{"n":"EXEGGUTOR-ALOLA","t":[15,3],"y":42,"d":103},{"n":"CUBONE","t":[8],"y":14,"d":104},{"n":"MAROWAK","t":[8],"y":14,"d":105},{"n":"MAROWAK-ALOLA","t":[1,13],"y":43,"d":105},{"n":"HITMONLEE","t":[6],"y":26,"d":106},{"n":"HITMONCHAN","t":[6],"y":26,"d":107},{"n":"LICKITUNG","t":[0],"y":9,"d":108},{"n":"KOFFING","t":[7],"y":11,"d":109},{"n":"WEEZING","t":[7],"y":11,"d":110},{"n":"WEEZING-GALAR","t":[17,7],"y":44,"d":110},{"n":"RHYHORN","t":[8,12],"y":31,"d":111},{"n":"RHYDON","t":[8,12],"y":31,"d":112},{"n":"CHANSEY","t":[0],"y":9,"d":113},{"n":"TANGELA","t":[3],"y":45,"d":114},{"n":"KANGASKHAN","t":[0],"y":9,"d":115},{"n":"KANGASKHAN-MEGA","t":[0],"y":9,"d":115},{"n":"HORSEA","t":[2],"y":4,"d":116},{"n":"SEADRA","t":[2],"y":4,"d":117},{"n":"GOLDEEN","t":[2],"y":4,"d":118},{"n":"SEAKING","t":[2],"y":4,"d":119},{"n":"STARYU","t":[2],"y":4,"d":120},{"n":"STARMIE","t":[10,2],"y":34,"d":121},{"n":"MR. MIME","t":[17,10],"y":33,"d":122},{"n":"MR. MIME-GALAR","t":[5,10],"y":46,"d":122},{"n":"SCYTHER","t":[11,9],"y":6,"d":123},{"n":"JYNX","t":[5,10],"y":46,"d":124},{"n":"ELECTABUZZ","t":[4],"y":12,"d":125},{"n":"MAGMAR","t":[1],"y":1,"d":126},{"n":"PINSIR","t":[11],"y":5,"d":127},{"n":"PINSIR-MEGA","t":[11,9],"y":6,"d":127},{"n":"TAUROS","t":[0],"y":9,"d":128},{"n":"TAUROS-PALDEA","t":[6],"y":26,"d":128},{"n":"TAUROS-PALDEA-FIRE","t":[6,1],"y":47,"d":128},{"n":"TAUROS-PALDEA-WATER","t":[6,2],"y":28,"d":128},{"n":"MAGIKARP","t":[2],"y":4,"d":129},{"n":"GYARADOS","t":[9,2],"y":48,"d":130},{"n":"GYARADOS-MEGA","t":[14,2],"y":49,"d":130},{"n":"LAPRAS","t":[5,2],"y":37,"d":131},{"n":"DITTO","t":[0],"y":9,"d":132},{"n":"EEVEE","t":[0],"y":9,"d":133},{"n":"EEVEE-PARTNER","t":[0],"y":9,"d":133},{"n":"VAPOREON","t":[2],"y":4,"d":134},{"n":"JOLTEON","t":[4],"y":12,"d":135},{"n":"FLAREON","t":[1],"y":1,"d":136},{"n":"PORYGON","t":[0],"y":9,"d":137},{"n":"OMANYTE","t":[12,2],"y":50,"d":138},{"n":"OMASTAR","t":[12,2],"y":50,"d":139},{"n":"KABUTO","t":[12,2],"y":50,"d":140},{"n":"KABUTOPS","t":[12,2],"y":50,"d":141},{"n":"AERODACTYL","t":[9,12],"y":51,"d":142},{"n":"AERODACTYL-MEGA","t":[9,12],"y":51,"d":142},{"n":"SNORLAX","t":[0],"y":9,"d":143},{"n":"ARTICUNO","t":[9,5],"y":52,"d":144},{"n":"ARTICUNO-GALAR","t":[9,10],"y":53,"d":144},{"n":"ZAPDOS","t":[4,9],"y":54,"d":145},{"n":"ZAPDOS-GALAR","t":[6,9],"y":55,"d":145},{"n":"MOLTRES","t":[1,9],"y":2,"d":146},{"n":"MOLTRES-GALAR","t":[14,9],"y":56,"d":146},{"n":"DRATINI","t":[15],"y":57,"d":147},{"n":"DRAGONAIR","t":[15],"y":57,"d":148},{"n":"DRAGONITE","t":[15,9],"y":58,"d":149},{"n":"MEWTWO","t":[10],"y":29,"d":150},{"n":"MEWTWO-MEGA-X","t":[6,10],"y":59,"d":150},{"n":"MEWTWO-MEGA-Y","t":[10],"y":29,"d":150},{"n":"MEW","t":[10],"y":29,"d":151},{"n":"CHIKORITA","t":[3],"y":45,"d":152},{"n":"BAYLEEF","t":[3],"y":45,"d":153},{"n":"MEGANIUM","t":[3],"y":45,"d":154},{"n":"CYNDAQUIL","t":[1],"y":1,"d":155},{"n":"QUILAVA","t":[1],"y":1,"d":156},{"n":"TYPHLOSION","t":[1],"y":1,"d":157},{"n":"TYPHLOSION-HISUI","t":[1,13],"y":43,"d":157},{"n":"TOTODILE","t":[2],"y":4,"d":158},{"n":"CROCONAW","t":[2],"y":4,"d":159},{"n":"FERALIGATR","t":[2],"y":4,"d":160},{"n":"SENTRET","t":[0],"y":9,"d":161},{"n":"FURRET","t":[0],"y":9,"d":162},{"n":"HOOTHOOT","t":[9,0],"y":8,"d":163},{"n":"NOCTOWL","t":[9,0],"y":8,"d":164},{"n":"LEDYBA","t":[11,9],"y":6,"d":165},{"n":"LEDIAN","t":[11,9],"y":6,"d":166},{"n":"SPINARAK","t":[11,7],"y":7,"d":167},{"n":"ARIADOS","t":[11,7],"y":7,"d":168},{"n":"CROBAT","t":[9,7],"y":21,"d":169},{"n":"CHINCHOU","t":[4,2],"y":60,"d":170},{"n":"LANTURN","t":[4,2],"y":60,"d":171},{"n":"PICHU","t":[4],"y":12,"d":172},{"n":"CLEFFA","t":[17],"y":17,"d":173},{"n":"IGGLYBUFF","t":[17,0],"y":20,"d":174},{"n":"TOGEPI","t":[17],"y":17,"d":175},{"n":"TOGETIC","t":[17,9],"y":61,"d":176},{"n":"NATU","t":[9,10],"y":53,"d":177},{"n":"XATU","t":[9,10],"y":53,"d":178},{"n":"MAREEP","t":[4],"y":12,"d":179},{"n":"FLAAFFY","t":[4],"y":12,"d":180},{"n":"AMPHAROS","t":[4],"y":12,"d":181},{"n":"AMPHAROS-MEGA","t":[15,4],"y":62,"d":181},{"n":"BELLOSSOM","t":[3],"y":45,"d":182},{"n":"MARILL","t":[17,2],"y":63,"d":183},{"n":"AZUMARILL","t":[17,2],"y":63,"d":184},{"n":"SUDOWOODO","t":[12],"y":64,"d":185},{"n":"POLITOED","t":[2],"y":4,"d":186},{"n":"HOPPIP","t":[9,3],"y":65,"d":187},{"n":"SKIPLOOM","t":[9,3],"y":65,"d":188},{"n":"JUMPLUFF","t":[9,3],"y":65,"d":189},{"n":"AIPOM","t":[0],"y":9,"d":190},{"n":"SUNKERN","t":[3],"y":45,"d":191},{"n":"SUNFLORA","t":[3],"y":45,"d":192},{"n":"YANMA","t":[11,9],"y":6,"d":193},{"n":"WOOPER","t":[8,2],"y":66,"d":194},{"n":"WOOPER-PALDEA","t":[8,7],"y":16,"d":194},{"n":"QUAGSIRE","t":[8,2],"y":66,"d":195},{"n":"ESPEON","t":[10],"y":29,"d":196},{"n":"UMBREON","t":[14],"y":24,"d":197},{"n":"MURKROW","t":[14,9],"y":56,"d":198},{"n":"SLOWKING","t":[10,2],"y":34,"d":199},{"n":"SLOWKING-GALAR","t":[7,10],"y":35,"d":199},{"n":"MISDREAVUS","t":[13],"y":67,"d":200},{"n":"UNOWN","t":[10],"y":29,"d":201},{"n":"WOBBUFFET","t":[10],"y":29,"d":202},{"n":"GIRAFARIG","t":[0,10],"y":68,"d":203},{"n":"PINECO","t":[11],"y":5,"d":204},{"n":"FORRETRESS","t":[11,16],"y":69,"d":205},{"n":"DUNSPARCE","t":[0],"y":9,"d":206},{"n":"GLIGAR","t":[9,8],"y":70,"d":207},{"n":"STEELIX","t":[8,16],"y":23,"d":208},{"n":"STEELIX-MEGA","t":[8,16],"y":23,"d":208},{"n":"SNUBBULL","t":[17],"y":17,"d":209},{"n":"GRANBULL","t":[17],"y":17,"d":210},{"n":"QWILFISH","t":[7,2],"y":30,"d":211},{"n":"QWILFISH-HISUI","t":[14,7],"y":38,"d":211},{"n":"SCIZOR","t":[11,16],"y":69,"d":212},{"n":"SCIZOR-MEGA","t":[11,16],"y":69,"d":212},{"n":"SHUCKLE","t":[11,12],"y":71,"d":213},{"n":"HERACROSS","t":[11,6],"y":72,"d":214},{"n":"HERACROSS-MEGA","t":[11,6],"y":72,"d":214},{"n":"SNEASEL","t":[14,5],"y":73,"d":215},{"n":"SNEASEL-HISUI","t":[6,7],"y":74,"d":215},{"n":"TEDDIURSA","t":[0],"y":9,"d":216},{"n":"URSARING","t":[0],"y":9,"d":217},{"n":"SLUGMA","t":[1],"y":1,"d":218},{"n":"MAGCARGO","t":[1,12],"y":27,"d":219},{"n":"SWINUB","t":[8,5],"y":75,"d":220},{"n":"PILOSWINE","t":[8,5],"y":75,"d":221},{"n":"CORSOLA","t":[12,2],"y":50,"d":222},{"n":"CORSOLA-GALAR","t":[13],"y":67,"d":222},{"n":"REMORAID","t":[2],"y":4,"d":223},{"n":"OCTILLERY","t":[2],"y":4,"d":224},{"n":"DELIBIRD","t":[9,5],"y":52,"d":225},{"n":"MANTINE","t":[9,2],"y":48,"d":226},{"n":"SKARMORY","t":[9,16],"y":76,"d":227},{"n":"HOUNDOUR","t":[14,1],"y":77,"d":228},{"n":"HOUNDOOM","t":[14,1],"y":77,"d":229},{"n":"HOUNDOOM-MEGA","t":[14,1],"y":77,"d":229},{"n":"KINGDRA","t":[15,2],"y":78,"d":230},{"n":"PHANPY","t":[8],"y":14,"d":231},{"n":"DONPHAN","t":[8],"y":14,"d":232},{"n":"PORYGON2","t":[0],"y":9,"d":233},{"n":"STANTLER","t":[0],"y":9,"d":234},{"n":"SMEARGLE","t":[0],"y":9,"d":235},{"n":"TYROGUE","t":[6],"y":26,"d":236},{"n":"HITMONTOP","t":[6],"y":26,"d":237},{"n":"SMOOCHUM","t":[5,10],"y":46,"d":238},{"n":"ELEKID","t":[4],"y":12,"d":239},{"n":"MAGBY","t":[1],"y":1,"d":240},{"n":"MILTANK","t":[0],"y":9,"d":241},{"n":"BLISSEY","t":[0],"y":9,"d":242},{"n":"RAIKOU","t":[4],"y":12,"d":243},{"n":"ENTEI","t":[1],"y":1,"d":244},{"n":"SUICUNE","t":[2],"y":4,"d":245},{"n":"LARVITAR","t":[8,12],"y":31,"d":246},{"n":"PUPITAR","t":[8,12],"y":31,"d":247},{"n":"TYRANITAR","t":[14,12],"y":79,"d":248},{"n":"TYRANITAR-MEGA","t":[14,12],"y":79,"d":248},{"n":"LUGIA","t":[9,10],"y":53,"d":249},{"n":"HO-OH","t":[1,9],"y":2,"d":250},{"n":"CELEBI","t":[3,10],"y":41,"d":251},{"n":"TREECKO","t":[3],"y":45,"d":252},{"n":"GROVYLE","t":[3],"y":45,"d":253},{"n":"SCEPTILE","t":[3],"y":45,"d":254},{"n":"SCEPTILE-MEGA","t":[15,3],"y":42,"d":254},{"n":"TORCHIC","t":[1],"y":1,"d":255},{"n":"COMBUSKEN","t":[6,1],"y":47,"d":256},{"n":"BLAZIKEN","t":[6,1],"y":47,"d":257},{"n":"BLAZIKEN-MEGA","t":[6,1],"y":47,"d":257},{"n":"MUDKIP","t":[2],"y":4,"d":258},{"n":"MARSHTOMP","t":[8,2],"y":66,"d":259},{"n":"SWAMPERT","t":[8,2],"y":66,"d":260},{"n":"SWAMPERT-MEGA","t":[8,2],"y":66,"d":260},{"n":"POOCHYENA","t":[14],"y":24,"d":261},{"n":"MIGHTYENA","t":[14],"y":24,"d":262},{"n":"ZIGZAGOON","t":[0],"y":9,"d":263},{"n":"ZIGZAGOON-GALAR","t":[14,0],"y":10,"d":263},{"n":"LINOONE","t":[0],"y":9,"d":264},{"n":"LINOONE-GALAR","t":[14,0],"y":10,"d":264},{"n":"WURMPLE","t":[11],"y":5,"d":265},{"n":"SILCOON","t":[11],"y":5,"d":266},{"n":"BEAUTIFLY","t":[11,9],"y":6,"d":267},{"n":"CASCOON","t":[11],"y":5,"d":268},{"n":"DUSTOX","t":[11,7],"y":7,"d":269},{"n":"LOTAD","t":[3,2],"y":80,"d":270},{"n":"LOMBRE","t":[3,2],"y":80,"d":271},{"n":"LUDICOLO","t":[3,2],"y":80,"d":272},{"n":"SEEDOT","t":[3],"y":45,"d":273},{"n":"NUZLEAF","t":[14,3],"y":81,"d":274},{"n":"SHIFTRY","t":[14,3],"y":81,"d":275},{"n":"TAILLOW","t":[9,0],"y":8,"d":276},{"n":"SWELLOW","t":[9,0],"y":8,"d":277},{"n":"WINGULL","t":[9,2],"y":48,"d":278},{"n":"PELIPPER","t":[9,2],"y":48,"d":279},{"n":"RALTS","t":[17,10],"y":33,"d":280},{"n":"KIRLIA","t":[17,10],"y":33,"d":281},{"n":"GARDEVOIR","t":[17,10],"y":33,"d":282},{"n":"GARDEVOIR-MEGA","t":[17,10],"y":33,"d":282},{"n":"SURSKIT","t":[11,2],"y":82,"d":283},{"n":"MASQUERAIN","t":[11,9],"y":6,"d":284},{"n":"SHROOMISH","t":[3],"y":45,"d":285},{"n":"BRELOOM","t":[6,3],"y":83,"d":286},{"n":"SLAKOTH","t":[0],"y":9,"d":287},{"n":"VIGOROTH","t":[0],"y":9,"d":288},{"n":"SLAKING","t":[0],"y":9,"d":289},{"n":"NINCADA","t":[11,8],"y":84,"d":290},{"n":"NINJASK","t":[11,9],"y":6,"d":291},{"n":"SHEDINJA","t":[11,13],"y":85,"d":292},{"n":"WHISMUR","t":[0],"y":9,"d":293},{"n":"LOUDRED","t":[0],"y":9,"d":294},{"n":"EXPLOUD","t":[0],"y":9,"d":295},{"n":"MAKUHITA","t":[6],"y":26,"d":296},{"n":"HARIYAMA","t":[6],"y":26,"d":297},{"n":"AZURILL","t":[17,0],"y":20,"d":298},{"n":"NOSEPASS","t":[12],"y":64,"d":299},{"n":"SKITTY","t":[0],"y":9,"d":300},{"n":"DELCATTY","t":[0],"y":9,"d":301},{"n":"SABLEYE","t":[14,13],"y":86,"d":302},{"n":"SABLEYE-MEGA","t":[14,13],"y":86,"d":302},{"n":"MAWILE","t":[17,16],"y":87,"d":303},{"n":"MAWILE-MEGA","t":[17,16],"y":87,"d":303},{"n":"ARON","t":[12,16],"y":88,"d":304},{"n":"LAIRON","t":[12,16],"y":88,"d":305},{"n":"AGGRON","t":[12,16],"y":88,"d":306},{"n":"AGGRON-MEGA","t":[16],"y":25,"d":306},{"n":"MEDITITE","t":[6,10],"y":59,"d":307},{"n":"MEDICHAM","t":[6,10],"y":59,"d":308},{"n":"MEDICHAM-MEGA","t":[6,10],"y":59,"d":308},{"n":"ELECTRIKE","t":[4],"y":12,"d":309},{"n":"MANECTRIC","t":[4],"y":12,"d":310},{"n":"MANECTRIC-MEGA","t":[4],"y":12,"d":310},{"n":"PLUSLE","t":[4],"y":12,"d":311},{"n":"MINUN","t":[4],"y":12,"d":312},{"n":"VOLBEAT","t":[11],"y":5,"d":313},{"n":"ILLUMISE","t":[11],"y":5,"d":314},{"n":"ROSELIA","t":[3,7],"y":0,"d":315},{"n":"GULPIN","t":[7],"y":11,"d":316},{"n":"SWALOT","t":[7],"y":11,"d":317},{"n":"CARVANHA","t":[14,2],"y":49,"d":318},{"n":"SHARPEDO","t":[14,2],"y":49,"d":319},{"n":"SHARPEDO-MEGA","t":[14,2],"y":49,"d":319},{"n":"WAILMER","t":[2],"y":4,"d":320},{"n":"WAILORD","t":[2],"y":4,"d":321},{"n":"NUMEL","t":[1,8],"y":89,"d":322},{"n":"CAMERUPT","t":[1,8],"y":89,"d":323},{"n":"CAMERUPT-MEGA","t":[1,8],"y":89,"d":323},{"n":"TORKOAL","t":[1],"y":1,"d":324},{"n":"SPOINK","t":[10],"y":29,"d":325},{"n":"GRUMPIG","t":[10],"y":29,"d":326},{"n":"SPINDA","t":[0],"y":9,"d":327},{"n":"TRAPINCH","t":[8],"y":14,"d":328},{"n":"VIBRAVA","t":[15,8],"y":90,"d":329},{"n":"FLYGON","t":[15,8],"y":90,"d":330},{"n":"CACNEA","t":[3],"y":45,"d":331},{"n":"CACTURNE","t":[14,3],"y":81,"d":332},{"n":"SWABLU","t":[9,0],"y":8,"d":333},{"n":"ALTARIA","t":[15,9],"y":58,"d":334},{"n":"ALTARIA-MEGA","t":[15,17],"y":91,"d":334},{"n":"ZANGOOSE","t":[0],"y":9,"d":335},{"n":"SEVIPER","t":[7],"y":11,"d":336},{"n":"LUNATONE","t":[10,12],"y":92,"d":337},{"n":"SOLROCK","t":[10,12],"y":92,"d":338},{"n":"BARBOACH","t":[8,2],"y":66,"d":339},{"n":"WHISCASH","t":[8,2],"y":66,"d":340},{"n":"CORPHISH","t":[2],"y":4,"d":341},{"n":"CRAWDAUNT","t":[14,2],"y":49,"d":342},{"n":"BALTOY","t":[8,10],"y":93,"d":343},{"n":"CLAYDOL","t":[8,10],"y":93,"d":344},{"n":"LILEEP","t":[3,12],"y":94,"d":345},{"n":"CRADILY","t":[3,12],"y":94,"d":346},{"n":"ANORITH","t":[11,12],"y":71,"d":347},{"n":"ARMALDO","t":[11,12],"y":71,"d":348},{"n":"FEEBAS","t":[2],"y":4,"d":349},{"n":"MILOTIC","t":[2],"y":4,"d":350},{"n":"CASTFORM","t":[0],"y":9,"d":351},{"n":"CASTFORM-SUNNY","t":[1],"y":1,"d":351},{"n":"CASTFORM-RAINY","t":[2],"y":4,"d":351},{"n":"CASTFORM-SNOWY","t":[5],"y":18,"d":351},{"n":"KECLEON","t":[0],"y":9,"d":352},{"n":"SHUPPET","t":[13],"y":67,"d":353},{"n":"BANETTE","t":[13],"y":67,"d":354},{"n":"BANETTE-MEGA","t":[13],"y":67,"d":354},{"n":"DUSKULL","t":[13],"y":67,"d":355},{"n":"DUSCLOPS","t":[13],"y":67,"d":356},{"n":"TROPIUS","t":[9,3],"y":65,"d":357},{"n":"CHIMECHO","t":[10],"y":29,"d":358},{"n":"ABSOL","t":[14],"y":24,"d":359},{"n":"ABSOL-MEGA","t":[14],"y":24,"d":359},{"n":"WYNAUT","t":[10],"y":29,"d":360},{"n":"SNORUNT","t":[5],"y":18,"d":361},{"n":"GLALIE","t":[5],"y":18,"d":362},{"n":"GLALIE-MEGA","t":[5],"y":18,"d":362},{"n":"SPHEAL","t":[5,2],"y":37,"d":363},{"n":"SEALEO","t":[5,2],"y":37,"d":364},{"n":"WALREIN","t":[5,2],"y":37,"d":365},{"n":"CLAMPERL","t":[2],"y":4,"d":366},{"n":"HUNTAIL","t":[2],"y":4,"d":367},{"n":"GOREBYSS","t":[2],"y":4,"d":368},{"n":"RELICANTH","t":[12,2],"y":50,"d":369},{"n":"LUVDISC","t":[2],"y":4,"d":370},{"n":"BAGON","t":[15],"y":57,"d":371},{"n":"SHELGON","t":[15],"y":57,"d":372},{"n":"SALAMENCE","t":[15,9],"y":58,"d":373},{"n":"SALAMENCE-MEGA","t":[15,9],"y":58,"d":373},{"n":"BELDUM","t":[10,16],"y":95,"d":374},{"n":"METANG","t":[10,16],"y":95,"d":375},{"n":"METAGROSS","t":[10,16],"y":95,"d":376},{"n":"METAGROSS-MEGA","t":[10,16],"y":95,"d":376},{"n":"REGIROCK","t":[12],"y":64,"d":377},{"n":"REGICE","t":[5],"y":18,"d":378},{"n":"REGISTEEL","t":[16],"y":25,"d":379},{"n":"LATIAS","t":[15,10],"y":96,"d":380},{"n":"LATIAS-MEGA","t":[15,10],"y":96,"d":380},{"n":"LATIOS","t":[15,10],"y":96,"d":381},{"n":"LATIOS-MEGA","t":[15,10],"y":96,"d":381},{"n":"KYOGRE","t":[2],"y":4,"d":382},{"n":"KYOGRE-PRIMAL","t":[2],"y":4,"d":382},{"n":"GROUDON","t":[8],"y":14,"d":383},{"n":"GROUDON-PRIMAL","t":[1,8],"y":89,"d":383},{"n":"RAYQUAZA","t":[15,9],"y":58,"d":384},{"n":"RAYQUAZA-MEGA","t":[15,9],"y":58,"d":384},{"n":"JIRACHI","t":[10,16],"y":95,"d":385},{"n":"DEOXYS","t":[10],"y":29,"d":386},{"n":"DEOXYS-ATTACK","t":[10],"y":29,"d":386},{"n":"DEOXYS-DEFENSE","t":[10],"y":29,"d":386},{"n":"DEOXYS-SPEED","t":[10],"y":29,"d":386},{"n":"TURTWIG","t":[3],"y":45,"d":387},{"n":"GROTLE","t":[3],"y":45,"d":388},{"n":"TORTERRA","t":[3,8],"y":97,"d":389},{"n":"CHIMCHAR","t":[1],"y":1,"d":390},{"n":"MONFERNO","t":[6,1],"y":47,"d":391},{"n":"INFERNAPE","t":[6,1],"y":47,"d":392},{"n":"PIPLUP","t":[2],"y":4,"d":393},{"n":"PRINPLUP","t":[2],"y":4,"d":394},{"n":"EMPOLEON","t":[16,2],"y":98,"d":395},{"n":"STARLY","t":[9,0],"y":8,"d":396},{"n":"STARAVIA","t":[9,0],"y":8,"d":397},{"n":"STARAPTOR","t":[9,0],"y":8,"d":398},{"n":"BIDOOF","t":[0],"y":9,"d":399},{"n":"BIBAREL","t":[0,2],"y":99,"d":400},{"n":"KRICKETOT","t":[11],"y":5,"d":401},{"n":"KRICKETUNE","t":[11],"y":5,"d":402},{"n":"SHINX","t":[4],"y":12,"d":403},{"n":"LUXIO","t":[4],"y":12,"d":404},{"n":"LUXRAY","t":[4],"y":12,"d":405},{"n":"BUDEW","t":[3,7],"y":0,"d":406},{"n":"ROSERADE","t":[3,7],"y":0,"d":407},{"n":"CRANIDOS","t":[12],"y":64,"d":408},{"n":"RAMPARDOS","t":[12],"y":64,"d":409},{"n":"SHIELDON","t":[12,16],"y":88,"d":410},{"n":"BASTIODON","t":[12,16],"y":88,"d":411},{"n":"BURMY","t":[11],"y":5,"d":412},{"n":"BURMY-SANDY","t":[11],"y":5,"d":412},{"n":"BURMY-TRASH","t":[11],"y":5,"d":412},{"n":"WORMADAM","t":[11,3],"y":22,"d":413},{"n":"WORMADAM-SANDY","t":[11,8],"y":84,"d":413},{"n":"WORMADAM-TRASH","t":[11,16],"y":69,"d":413},{"n":"MOTHIM","t":[11,9],"y":6,"d":414},{"n":"COMBEE","t":[11,9],"y":6,"d":415},{"n":"VESPIQUEN","t":[11,9],"y":6,"d":416},{"n":"PACHIRISU","t":[4],"y":12,"d":417},{"n":"BUIZEL","t":[2],"y":4,"d":418},{"n":"FLOATZEL","t":[2],"y":4,"d":419},{"n":"CHERUBI","t":[3],"y":45,"d":420},{"n":"CHERRIM","t":[3],"y":45,"d":421},{"n":"SHELLOS","t":[2],"y":4,"d":422},{"n":"GASTRODON","t":[8,2],"y":66,"d":423},{"n":"AMBIPOM","t":[0],"y":9,"d":424},{"n":"DRIFLOON","t":[9,13],"y":100,"d":425},{"n":"DRIFBLIM","t":[9,13],"y":100,"d":426},{"n":"BUNEARY","t":[0],"y":9,"d":427},{"n":"LOPUNNY","t":[0],"y":9,"d":428},{"n":"LOPUNNY-MEGA","t":[6,0],"y":101,"d":428},{"n":"MISMAGIUS","t":[13],"y":67,"d":429},{"n":"HONCHKROW","t":[14,9],"y":56,"d":430},{"n":"GLAMEOW","t":[0],"y":9,"d":431},{"n":"PURUGLY","t":[0],"y":9,"d":432},{"n":"CHINGLING","t":[10],"y":29,"d":433},{"n":"STUNKY","t":[14,7],"y":38,"d":434},{"n":"SKUNTANK","t":[14,7],"y":38,"d":435},{"n":"BRONZOR","t":[10,16],"y":95,"d":436},{"n":"BRONZONG","t":[10,16],"y":95,"d":437},{"n":"BONSLY","t":[12],"y":64,"d":438},{"n":"MIME JR.","t":[17,10],"y":33,"d":439},{"n":"HAPPINY","t":[0],"y":9,"d":440},{"n":"CHATOT","t":[9,0],"y":8,"d":441},{"n":"SPIRITOMB","t":[14,13],"y":86,"d":442},{"n":"GIBLE","t":[15,8],"y":90,"d":443},{"n":"GABITE","t":[15,8],"y":90,"d":444},{"n":"GARCHOMP","t":[15,8],"y":90,"d":445},{"n":"GARCHOMP-MEGA","t":[15,8],"y":90,"d":445},{"n":"MUNCHLAX","t":[0],"y":9,"d":446},{"n":"RIOLU","t":[6],"y":26,"d":447},{"n":"LUCARIO","t":[6,16],"y":102,"d":448},{"n":"LUCARIO-MEGA","t":[6,16],"y":102,"d":448},{"n":"HIPPOPOTAS","t":[8],"y":14,"d":449},{"n":"HIPPOWDON","t":[8],"y":14,"d":450},{"n":"SKORUPI","t":[11,7],"y":7,"d":451},{"n":"DRAPION","t":[14,7],"y":38,"d":452},{"n":"CROAGUNK","t":[6,7],"y":74,"d":453},{"n":"TOXICROAK","t":[6,7],"y":74,"d":454},{"n":"CARNIVINE","t":[3],"y":45,"d":455},{"n":"FINNEON","t":[2],"y":4,"d":456},{"n":"LUMINEON","t":[2],"y":4,"d":457},{"n":"MANTYKE","t":[9,2],"y":48,"d":458},{"n":"SNOVER","t":[3,5],"y":103,"d":459},{"n":"ABOMASNOW","t":[3,5],"y":103,"d":460},{"n":"ABOMASNOW-MEGA","t":[3,5],"y":103,"d":460},{"n":"WEAVILE","t":[14,5],"y":73,"d":461},{"n":"MAGNEZONE","t":[4,16],"y":36,"d":462},{"n":"LICKILICKY","t":[0],"y":9,"d":463},{"n":"RHYPERIOR","t":[8,12],"y":31,"d":464},{"n":"TANGROWTH","t":[3],"y":45,"d":465},{"n":"ELECTIVIRE","t":[4],"y":12,"d":466},{"n":"MAGMORTAR","t":[1],"y":1,"d":467},{"n":"TOGEKISS","t":[17,9],"y":61,"d":468},{"n":"YANMEGA","t":[11,9],"y":6,"d":469},{"n":"LEAFEON","t":[3],"y":45,"d":470},{"n":"GLACEON","t":[5],"y":18,"d":471},{"n":"GLISCOR","t":[9,8],"y":70,"d":472},{"n":"MAMOSWINE","t":[8,5],"y":75,"d":473},{"n":"PORYGON-Z","t":[0],"y":9,"d":474},{"n":"GALLADE","t":[6,10],"y":59,"d":475},{"n":"GALLADE-MEGA","t":[6,10],"y":59,"d":475},{"n":"PROBOPASS","t":[12,16],"y":88,"d":476},{"n":"DUSKNOIR","t":[13],"y":67,"d":477},{"n":"FROSLASS","t":[13,5],"y":104,"d":478},{"n":"ROTOM","t":[4,13],"y":105,"d":479},{"n":"ROTOM-HEAT","t":[4,1],"y":106,"d":479},{"n":"ROTOM-WASH","t":[4,2],"y":60,"d":479},{"n":"ROTOM-FROST","t":[4,5],"y":107,"d":479},{"n":"ROTOM-FAN","t":[4,9],"y":54,"d":479},{"n":"ROTOM-MOW","t":[4,3],"y":40,"d":479},{"n":"UXIE","t":[10],"y":29,"d":480},{"n":"MESPRIT","t":[10],"y":29,"d":481},{"n":"AZELF","t":[10],"y":29,"d":482},{"n":"DIALGA","t":[15,16],"y":108,"d":483},{"n":"DIALGA-ORIGIN","t":[15,16],"y":108,"d":483},{"n":"PALKIA","t":[15,2],"y":78,"d":484},{"n":"PALKIA-ORIGIN","t":[15,2],"y":78,"d":484},{"n":"HEATRAN","t":[1,16],"y":109,"d":485},{"n":"REGIGIGAS","t":[0],"y":9,"d":486},{"n":"GIRATINA","t":[15,13],"y":110,"d":487},{"n":"GIRATINA-ORIGIN","t":[15,13],"y":110,"d":487},{"n":"CRESSELIA","t":[10],"y":29,"d":488},{"n":"PHIONE","t":[2],"y":4,"d":489},{"n":"MANAPHY","t":[2],"y":4,"d":490},{"n":"DARKRAI","t":[14],"y":24,"d":491},{"n":"SHAYMIN","t":[3],"y":45,"d":492},{"n":"SHAYMIN-SKY","t":[9,3],"y":65,"d":492},{"n":"ARCEUS","t":[0],"y":9,"d":493},{"n":"VICTINI","t":[1,10],"y":111,"d":494},{"n":"SNIVY","t":[3],"y":45,"d":495},{"n":"SERVINE","t":[3],"y":45,"d":496},{"n":"SERPERIOR","t":[3],"y":45,"d":497},{"n":"TEPIG","t":[1],"y":1,"d":498},{"n":"PIGNITE","t":[6,1],"y":47,"d":499},{"n":"EMBOAR","t":[6,1],"y":47,"d":500},{"n":"OSHAWOTT","t":[2],"y":4,"d":501},{"n":"DEWOTT","t":[2],"y":4,"d":502},{"n":"SAMUROTT","t":[2],"y":4,"d":503},{"n":"SAMUROTT-HISUI","t":[14,2],"y":49,"d":503},{"n":"PATRAT","t":[0],"y":9,"d":504},{"n":"WATCHOG","t":[0],"y":9,"d":505},{"n":"LILLIPUP","t":[0],"y":9,"d":506},{"n":"HERDIER","t":[0],"y":9,"d":507},{"n":"STOUTLAND","t":[0],"y":9,"d":508},{"n":"PURRLOIN","t":[14],"y":24,"d":509},{"n":"LIEPARD","t":[14],"y":24,"d":510},{"n":"PANSAGE","t":[3],"y":45,"d":511},{"n":"SIMISAGE","t":[3],"y":45,"d":512},{"n":"PANSEAR","t":[1],"y":1,"d":513},{"n":"SIMISEAR","t":[1],"y":1,"d":514},{"n":"PANPOUR","t":[2],"y":4,"d":515},{"n":"SIMIPOUR","t":[2],"y":4,"d":516},{"n":"MUNNA","t":[10],"y":29,"d":517},{"n":"MUSHARNA","t":[10],"y":29,"d":518},{"n":"PIDOVE","t":[9,0],"y":8,"d":519},{"n":"TRANQUILL","t":[9,0],"y":8,"d":520},{"n":"UNFEZANT","t":[9,0],"y":8,"d":521},{"n":"BLITZLE","t":[4],"y":12,"d":522},{"n":"ZEBSTRIKA","t":[4],"y":12,"d":523},{"n":"ROGGENROLA","t":[12],"y":64,"d":524},{"n":"BOLDORE","t":[12],"y":64,"d":525},{"n":"GIGALITH","t":[12],"y":64,"d":526},{"n":"WOOBAT","t":[9,10],"y":53,"d":527},{"n":"SWOOBAT","t":[9,10],"y":53,"d":528},{"n":"DRILBUR","t":[8],"y":14,"d":529},{"n":"EXCADRILL","t":[8,16],"y":23,"d":530},{"n":"AUDINO","t":[0],"y":9,"d":531},{"n":"AUDINO-MEGA","t":[17,0],"y":20,"d":531},{"n":"TIMBURR","t":[6],"y":26,"d":532},{"n":"GURDURR","t":[6],"y":26,"d":533},{"n":"CONKELDURR","t":[6],"y":26,"d":534},{"n":"TYMPOLE","t":[2],"y":4,"d":535},{"n":"PALPITOAD","t":[8,2],"y":66,"d":536},{"n":"SEISMITOAD","t":[8,2],"y":66,"d":537},{"n":"THROH","t":[6],"y":26,"d":538},{"n":"SAWK","t":[6],"y":26,"d":539},{"n":"SEWADDLE","t":[11,3],"y":22,"d":540},{"n":"SWADLOON","t":[11,3],"y":22,"d":541},{"n":"LEAVANNY","t":[11,3],"y":22,"d":542},{"n":"VENIPEDE","t":[11,7],"y":7,"d":543},{"n":"WHIRLIPEDE","t":[11,7],"y":7,"d":544},{"n":"SCOLIPEDE","t":[11,7],"y":7,"d":545},{"n":"COTTONEE","t":[17,3],"y":112,"d":546},{"n":"WHIMSICOTT","t":[17,3],"y":112,"d":547},{"n":"PETILIL","t":[3],"y":45,"d":548},{"n":"LILLIGANT","t":[3],"y":45,"d":549},{"n":"LILLIGANT-HISUI","t":[6,3],"y":83,"d":549},{"n":"BASCULIN","t":[2],"y":4,"d":550},{"n":"BASCULIN-BLUE-STRIPED","t":[2],"y":4,"d":550},{"n":"BASCULIN-WHITE-STRIPED","t":[2],"y":4,"d":550},{"n":"SANDILE","t":[14,8],"y":113,"d":551},{"n":"KROKOROK","t":[14,8],"y":113,"d":552},{"n":"KROOKODILE","t":[14,8],"y":113,"d":553},{"n":"DARUMAKA","t":[1],"y":1,"d":554},{"n":"DARUMAKA-GALAR","t":[5],"y":18,"d":554},{"n":"DARMANITAN","t":[1],"y":1,"d":555},{"n":"DARMANITAN-ZEN","t":[1,10],"y":111,"d":555},{"n":"DARMANITAN-GALAR","t":[5],"y":18,"d":555},{"n":"DARMANITAN-GALAR-ZEN","t":[1,5],"y":114,"d":555},{"n":"MARACTUS","t":[3],"y":45,"d":556},{"n":"DWEBBLE","t":[11,12],"y":71,"d":557},{"n":"CRUSTLE","t":[11,12],"y":71,"d":558},{"n":"SCRAGGY","t":[14,6],"y":115,"d":559},{"n":"SCRAFTY","t":[14,6],"y":115,"d":560},{"n":"SIGILYPH","t":[9,10],"y":53,"d":561},{"n":"YAMASK","t":[13],"y":67,"d":562},{"n":"YAMASK-GALAR","t":[13,8],"y":116,"d":562},{"n":"COFAGRIGUS","t":[13],"y":67,"d":563},{"n":"TIRTOUGA","t":[12,2],"y":50,"d":564},{"n":"CARRACOSTA","t":[12,2],"y":50,"d":565},{"n":"ARCHEN","t":[9,12],"y":51,"d":566},{"n":"ARCHEOPS","t":[9,12],"y":51,"d":567},{"n":"TRUBBISH","t":[7],"y":11,"d":568},{"n":"GARBODOR","t":[7],"y":11,"d":569},{"n":"ZORUA","t":[14],"y":24,"d":570},{"n":"ZORUA-HISUI","t":[13,0],"y":117,"d":570},{"n":"ZOROARK","t":[14],"y":24,"d":571},{"n":"ZOROARK-HISUI","t":[13,0],"y":117,"d":571},{"n":"MINCCINO","t":[0],"y":9,"d":572},{"n":"CINCCINO","t":[0],"y":9,"d":573},{"n":"GOTHITA","t":[10],"y":29,"d":574},{"n":"GOTHORITA","t":[10],"y":29,"d":575},{"n":"GOTHITELLE","t":[10],"y":29,"d":576},{"n":"SOLOSIS","t":[10],"y":29,"d":577},{"n":"DUOSION","t":[10],"y":29,"d":578},{"n":"REUNICLUS","t":[10],"y":29,"d":579},{"n":"DUCKLETT","t":[9,2],"y":48,"d":580},{"n":"SWANNA","t":[9,2],"y":48,"d":581},{"n":"VANILLITE","t":[5],"y":18,"d":582},{"n":"VANILLISH","t":[5],"y":18,"d":583},{"n":"VANILLUXE","t":[5],"y":18,"d":584},{"n":"DEERLING","t":[3,0],"y":118,"d":585},{"n":"SAWSBUCK","t":[3,0],"y":118,"d":586},{"n":"EMOLGA","t":[4,9],"y":54,"d":587},{"n":"KARRABLAST","t":[11],"y":5,"d":588},{"n":"ESCAVALIER","t":[11,16],"y":69,"d":589},{"n":"FOONGUS","t":[3,7],"y":0,"d":590},{"n":"AMOONGUSS","t":[3,7],"y":0,"d":591},{"n":"FRILLISH","t":[13,2],"y":119,"d":592},{"n":"JELLICENT","t":[13,2],"y":119,"d":593},{"n":"ALOMOMOLA","t":[2],"y":4,"d":594},{"n":"JOLTIK","t":[11,4],"y":120,"d":595},{"n":"GALVANTULA","t":[11,4],"y":120,"d":596},{"n":"FERROSEED","t":[3,16],"y":121,"d":597},{"n":"FERROTHORN","t":[3,16],"y":121,"d":598},{"n":"KLINK","t":[16],"y":25,"d":599},{"n":"KLANG","t":[16],"y":25,"d":600},{"n":"KLINKLANG","t":[16],"y":25,"d":601},{"n":"TYNAMO","t":[4],"y":12,"d":602},{"n":"EELEKTRIK","t":[4],"y":12,"d":603},{"n":"EELEKTROSS","t":[4],"y":12,"d":604},{"n":"ELGYEM","t":[10],"y":29,"d":605},{"n":"BEHEEYEM","t":[10],"y":29,"d":606},{"n":"LITWICK","t":[1,13],"y":43,"d":607},{"n":"LAMPENT","t":[1,13],"y":43,"d":608},{"n":"CHANDELURE","t":[1,13],"y":43,"d":609},{"n":"AXEW","t":[15],"y":57,"d":610},{"n":"FRAXURE","t":[15],"y":57,"d":611},{"n":"HAXORUS","t":[15],"y":57,"d":612},{"n":"CUBCHOO","t":[5],"y":18,"d":613},{"n":"BEARTIC","t":[5],"y":18,"d":614},{"n":"CRYOGONAL","t":[5],"y":18,"d":615},{"n":"SHELMET","t":[11],"y":5,"d":616},{"n":"ACCELGOR","t":[11],"y":5,"d":617},{"n":"STUNFISK","t":[4,8],"y":122,"d":618},{"n":"STUNFISK-GALAR","t":[8,16],"y":23,"d":618},{"n":"MIENFOO","t":[6],"y":26,"d":619},{"n":"MIENSHAO","t":[6],"y":26,"d":620},{"n":"DRUDDIGON","t":[15],"y":57,"d":621},{"n":"GOLETT","t":[13,8],"y":116,"d":622},{"n":"GOLURK","t":[13,8],"y":116,"d":623},{"n":"PAWNIARD","t":[14,16],"y":123,"d":624},{"n":"BISHARP","t":[14,16],"y":123,"d":625},{"n":"BOUFFALANT","t":[0],"y":9,"d":626},{"n":"RUFFLET","t":[9,0],"y":8,"d":627},{"n":"BRAVIARY","t":[9,0],"y":8,"d":628},{"n":"BRAVIARY-HISUI","t":[9,10],"y":53,"d":628},{"n":"VULLABY","t":[14,9],"y":56,"d":629},{"n":"MANDIBUZZ","t":[14,9],"y":56,"d":630},{"n":"HEATMOR","t":[1],"y":1,"d":631},{"n":"DURANT","t":[11,16],"y":69,"d":632},{"n":"DEINO","t":[14,15],"y":124,"d":633},{"n":"ZWEILOUS","t":[14,15],"y":124,"d":634},{"n":"HYDREIGON","t":[14,15],"y":124,"d":635},{"n":"LARVESTA","t":[11,1],"y":125,"d":636},{"n":"VOLCARONA","t":[11,1],"y":125,"d":637},{"n":"COBALION","t":[6,16],"y":102,"d":638},{"n":"TERRAKION","t":[6,12],"y":126,"d":639},{"n":"VIRIZION","t":[6,3],"y":83,"d":640},{"n":"TORNADUS","t":[9],"y":127,"d":641},{"n":"TORNADUS-THERIAN","t":[9],"y":127,"d":641},{"n":"THUNDURUS","t":[4,9],"y":54,"d":642},{"n":"THUNDURUS-THERIAN","t":[4,9],"y":54,"d":642},{"n":"RESHIRAM","t":[15,1],"y":3,"d":643},{"n":"ZEKROM","t":[15,4],"y":62,"d":644},{"n":"LANDORUS","t":[9,8],"y":70,"d":645},{"n":"LANDORUS-THERIAN","t":[9,8],"y":70,"d":645},{"n":"KYUREM","t":[15,5],"y":128,"d":646},{"n":"KYUREM-WHITE","t":[15,5],"y":128,"d":646},{"n":"KYUREM-BLACK","t":[15,5],"y":128,"d":646},{"n":"KELDEO","t":[6,2],"y":28,"d":647},{"n":"KELDEO-RESOLUTE","t":[6,2],"y":28,"d":647},{"n":"MELOETTA","t":[0,10],"y":68,"d":648},{"n":"MELOETTA-PIROUETTE","t":[6,0],"y":101,"d":648},{"n":"GENESECT","t":[11,16],"y":69,"d":649},{"n":"CHESPIN","t":[3],"y":45,"d":650},{"n":"QUILLADIN","t":[3],"y":45,"d":651},{"n":"CHESNAUGHT","t":[6,3],"y":83,"d":652},{"n":"FENNEKIN","t":[1],"y":1,"d":653},{"n":"BRAIXEN","t":[1],"y":1,"d":654},{"n":"DELPHOX","t":[1,10],"y":111,"d":655},{"n":"FROAKIE","t":[2],"y":4,"d":656},{"n":"FROGADIER","t":[2],"y":4,"d":657},{"n":"GRENINJA","t":[14,2],"y":49,"d":658},{"n":"GRENINJA-ASH","t":[14,2],"y":49,"d":658},{"n":"BUNNELBY","t":[0],"y":9,"d":659},{"n":"DIGGERSBY","t":[8,0],"y":129,"d":660},{"n":"FLETCHLING","t":[9,0],"y":8,"d":661},{"n":"FLETCHINDER","t":[1,9],"y":2,"d":662},{"n":"TALONFLAME","t":[1,9],"y":2,"d":663},{"n":"SCATTERBUG","t":[11],"y":5,"d":664},{"n":"SPEWPA","t":[11],"y":5,"d":665},{"n":"VIVILLON","t":[11,9],"y":6,"d":666},{"n":"LITLEO","t":[1,0],"y":130,"d":667},{"n":"PYROAR","t":[1,0],"y":130,"d":668},{"n":"FLAB\u00c9B\u00c9","t":[17],"y":17,"d":669},{"n":"FLOETTE","t":[17],"y":17,"d":670},{"n":"FLORGES","t":[17],"y":17,"d":671},{"n":"SKIDDO","t":[3],"y":45,"d":672},{"n":"GOGOAT","t":[3],"y":45,"d":673},{"n":"PANCHAM","t":[6],"y":26,"d":674},{"n":"PANGORO","t":[14,6],"y":115,"d":675},{"n":"FURFROU","t":[0],"y":9,"d":676},{"n":"ESPURR","t":[10],"y":29,"d":677},{"n":"MEOWSTIC-M","t":[10],"y":29,"d":678},{"n":"MEOWSTIC-F","t":[10],"y":29,"d":678},{"n":"HONEDGE","t":[13,16],"y":131,"d":679},{"n":"DOUBLADE","t":[13,16],"y":131,"d":680},{"n":"AEGISLASH","t":[13,16],"y":131,"d":681},{"n":"AEGISLASH-BLADE","t":[13,16],"y":131,"d":681},{"n":"SPRITZEE","t":[17],"y":17,"d":682},{"n":"AROMATISSE","t":[17],"y":17,"d":683},{"n":"SWIRLIX","t":[17],"y":17,"d":684},{"n":"SLURPUFF","t":[17],"y":17,"d":685},{"n":"INKAY","t":[14,10],"y":132,"d":686},{"n":"MALAMAR","t":[14,10],"y":132,"d":687},{"n":"BINACLE","t":[12,2],"y":50,"d":688},{"n":"BARBARACLE","t":[12,2],"y":50,"d":689},{"n":"SKRELP","t":[7,2],"y":30,"d":690},{"n":"DRAGALGE","t":[15,7],"y":133,"d":691},{"n":"CLAUNCHER","t":[2],"y":4,"d":692},{"n":"CLAWITZER","t":[2],"y":4,"d":693},{"n":"HELIOPTILE","t":[4,0],"y":134,"d":694},{"n":"HELIOLISK","t":[4,0],"y":134,"d":695},{"n":"TYRUNT","t":[15,12],"y":135,"d":696},{"n":"TYRANTRUM","t":[15,12],"y":135,"d":697},{"n":"AMAURA","t":[5,12],"y":136,"d":698},{"n":"AURORUS","t":[5,12],"y":136,"d":699},{"n":"SYLVEON","t":[17],"y":17,"d":700},{"n":"HAWLUCHA","t":[6,9],"y":55,"d":701},{"n":"DEDENNE","t":[4,17],"y":137,"d":702},{"n":"CARBINK","t":[17,12],"y":138,"d":703},{"n":"GOOMY","t":[15],"y":57,"d":704},{"n":"SLIGGOO","t":[15],"y":57,"d":705},{"n":"SLIGGOO-HISUI","t":[15,16],"y":108,"d":705},{"n":"GOODRA","t":[15],"y":57,"d":706},{"n":"GOODRA-HISUI","t":[15,16],"y":108,"d":706},{"n":"KLEFKI","t":[17,16],"y":87,"d":707},{"n":"PHANTUMP","t":[13,3],"y":139,"d":708},{"n":"TREVENANT","t":[13,3],"y":139,"d":709},{"n":"PUMPKABOO","t":[13,3],"y":139,"d":710},{"n":"PUMPKABOO-SMALL","t":[13,3],"y":139,"d":710},{"n":"PUMPKABOO-LARGE","t":[13,3],"y":139,"d":710},{"n":"PUMPKABOO-SUPER","t":[13,3],"y":139,"d":710},{"n":"GOURGEIST","t":[13,3],"y":139,"d":711},{"n":"GOURGEIST-SMALL","t":[13,3],"y":139,"d":711},{"n":"GOURGEIST-LARGE","t":[13,3],"y":139,"d":711},{"n":"GOURGEIST-SUPER","t":[13,3],"y":139,"d":711},{"n":"BERGMITE","t":[5],"y":18,"d":712},{"n":"AVALUGG","t":[5],"y":18,"d":713},{"n":"AVALUGG-HISUI","t":[5,12],"y":136,"d":713},{"n":"NOIBAT","t":[15,9],"y":58,"d":714},{"n":"NOIVERN","t":[15,9],"y":58,"d":715},{"n":"XERNEAS","t":[17],"y":17,"d":716},{"n":"YVELTAL","t":[14,9],"y":56,"d":717},{"n":"ZYGARDE","t":[15,8],"y":90,"d":718},{"n":"ZYGARDE-10%","t":[15,8],"y":90,"d":718},{"n":"ZYGARDE-COMPLETE","t":[15,8],"y":90,"d":718},{"n":"DIANCIE","t":[17,12],"y":138,"d":719},{"n":"DIANCIE-MEGA","t":[17,12],"y":138,"d":719},{"n":"HOOPA","t":[13,10],"y":140,"d":720},{"n":"HOOPA-UNBOUND","t":[14,10],"y":132,"d":720},{"n":"VOLCANION","t":[1,2],"y":141,"d":721},{"n":"ROWLET","t":[9,3],"y":65,"d":722},{"n":"DARTRIX","t":[9,3],"y":65,"d":723},{"n":"DECIDUEYE","t":[13,3],"y":139,"d":724},{"n":"DECIDUEYE-HISUI","t":[6,3],"y":83,"d":724},{"n":"LITTEN","t":[1],"y":1,"d":725},{"n":"TORRACAT","t":[1],"y":1,"d":726},{"n":"INCINEROAR","t":[14,1],"y":77,"d":727},{"n":"POPPLIO","t":[2],"y":4,"d":728},{"n":"BRIONNE","t":[2],"y":4,"d":729},{"n":"PRIMARINA","t":[17,2],"y":63,"d":730},{"n":"PIKIPEK","t":[9,0],"y":8,"d":731},{"n":"TRUMBEAK","t":[9,0],"y":8,"d":732},{"n":"TOUCANNON","t":[9,0],"y":8,"d":733},{"n":"YUNGOOS","t":[0],"y":9,"d":734},{"n":"GUMSHOOS","t":[0],"y":9,"d":735},{"n":"GRUBBIN","t":[11],"y":5,"d":736},{"n":"CHARJABUG","t":[11,4],"y":120,"d":737},{"n":"VIKAVOLT","t":[11,4],"y":120,"d":738},{"n":"CRABRAWLER","t":[6],"y":26,"d":739},{"n":"CRABOMINABLE","t":[6,5],"y":142,"d":740},{"n":"ORICORIO","t":[1,9],"y":2,"d":741},{"n":"ORICORIO-POM-POM","t":[4,9],"y":54,"d":741},{"n":"ORICORIO-PA'U","t":[9,10],"y":53,"d":741},{"n":"ORICORIO-SENSU","t":[9,13],"y":100,"d":741},{"n":"CUTIEFLY","t":[11,17],"y":143,"d":742},{"n":"RIBOMBEE","t":[11,17],"y":143,"d":743},{"n":"ROCKRUFF","t":[12],"y":64,"d":744},{"n":"ROCKRUFF-OWN-TEMPO","t":[12],"y":64,"d":744},{"n":"LYCANROC","t":[12],"y":64,"d":745},{"n":"LYCANROC-MIDNIGHT","t":[12],"y":64,"d":745},{"n":"LYCANROC-DUSK","t":[12],"y":64,"d":745},{"n":"WISHIWASHI","t":[2],"y":4,"d":746},{"n":"WISHIWASHI-SCHOOL","t":[2],"y":4,"d":746},{"n":"MAREANIE","t":[7,2],"y":30,"d":747},{"n":"TOXAPEX","t":[7,2],"y":30,"d":748},{"n":"MUDBRAY","t":[8],"y":14,"d":749},{"n":"MUDSDALE","t":[8],"y":14,"d":750},{"n":"DEWPIDER","t":[11,2],"y":82,"d":751},{"n":"ARAQUANID","t":[11,2],"y":82,"d":752},{"n":"FOMANTIS","t":[3],"y":45,"d":753},{"n":"LURANTIS","t":[3],"y":45,"d":754},{"n":"MORELULL","t":[17,3],"y":112,"d":755},{"n":"SHIINOTIC","t":[17,3],"y":112,"d":756},{"n":"SALANDIT","t":[1,7],"y":144,"d":757},{"n":"SALAZZLE","t":[1,7],"y":144,"d":758},{"n":"STUFFUL","t":[6,0],"y":101,"d":759},{"n":"BEWEAR","t":[6,0],"y":101,"d":760},{"n":"BOUNSWEET","t":[3],"y":45,"d":761},{"n":"STEENEE","t":[3],"y":45,"d":762},{"n":"TSAREENA","t":[3],"y":45,"d":763},{"n":"COMFEY","t":[17],"y":17,"d":764},{"n":"ORANGURU","t":[0,10],"y":68,"d":765},{"n":"PASSIMIAN","t":[6],"y":26,"d":766},{"n":"WIMPOD","t":[11,2],"y":82,"d":767},{"n":"GOLISOPOD","t":[11,2],"y":82,"d":768},{"n":"SANDYGAST","t":[13,8],"y":116,"d":769},{"n":"PALOSSAND","t":[13,8],"y":116,"d":770},{"n":"PYUKUMUKU","t":[2],"y":4,"d":771},{"n":"TYPE: NULL","t":[0],"y":9,"d":772},{"n":"SILVALLY","t":[0],"y":9,"d":773},{"n":"MINIOR-METEOR","t":[9,12],"y":51,"d":774},{"n":"MINIOR","t":[9,12],"y":51,"d":774},{"n":"KOMALA","t":[0],"y":9,"d":775},{"n":"TURTONATOR","t":[15,1],"y":3,"d":776},{"n":"TOGEDEMARU","t":[4,16],"y":36,"d":777},{"n":"MIMIKYU","t":[17,13],"y":145,"d":778},{"n":"BRUXISH","t":[10,2],"y":34,"d":779},{"n":"DRAMPA","t":[15,0],"y":146,"d":780},{"n":"DHELMISE","t":[13,3],"y":139,"d":781},{"n":"JANGMO-O","t":[15],"y":57,"d":782},{"n":"HAKAMO-O","t":[15,6],"y":147,"d":783},{"n":"KOMMO-O","t":[15,6],"y":147,"d":784},{"n":"TAPU KOKO","t":[4,17],"y":137,"d":785},{"n":"TAPU LELE","t":[17,10],"y":33,"d":786},{"n":"TAPU BULU","t":[17,3],"y":112,"d":787},{"n":"TAPU FINI","t":[17,2],"y":63,"d":788},{"n":"COSMOG","t":[10],"y":29,"d":789},{"n":"COSMOEM","t":[10],"y":29,"d":790},{"n":"SOLGALEO","t":[10,16],"y":95,"d":791},{"n":"LUNALA","t":[13,10],"y":140,"d":792},{"n":"NIHILEGO","t":[7,12],"y":148,"d":793},{"n":"BUZZWOLE","t":[11,6],"y":72,"d":794},{"n":"PHEROMOSA","t":[11,6],"y":72,"d":795},{"n":"XURKITREE","t":[4],"y":12,"d":796},{"n":"CELESTEELA","t":[9,16],"y":76,"d":797},{"n":"KARTANA","t":[3,16],"y":121,"d":798},{"n":"GUZZLORD","t":[14,15],"y":124,"d":799},{"n":"NECROZMA","t":[10],"y":29,"d":800},{"n":"NECROZMA-DUSK-MANE","t":[10,16],"y":95,"d":800},{"n":"NECROZMA-DAWN-WINGS","t":[13,10],"y":140,"d":800},{"n":"NECROZMA-ULTRA","t":[15,10],"y":96,"d":800},{"n":"MAGEARNA","t":[17,16],"y":87,"d":801},{"n":"MARSHADOW","t":[6,13],"y":149,"d":802},{"n":"POIPOLE","t":[7],"y":11,"d":803},{"n":"NAGANADEL","t":[15,7],"y":133,"d":804},{"n":"STAKATAKA","t":[12,16],"y":88,"d":805},{"n":"BLACEPHALON","t":[1,13],"y":43,"d":806},{"n":"ZERAORA","t":[4],"y":12,"d":807},{"n":"MELTAN","t":[16],"y":25,"d":808},{"n":"MELMETAL","t":[16],"y":25,"d":809},{"n":"GROOKEY","t":[3],"y":45,"d":810},{"n":"THWACKEY","t":[3],"y":45,"d":811},{"n":"RILLABOOM","t":[3],"y":45,"d":812},{"n":"SCORBUNNY","t":[1],"y":1,"d":813},{"n":"RABOOT","t":[1],"y":1,"d":814},{"n":"CINDERACE","t":[1],"y":1,"d":815},{"n":"SOBBLE","t":[2],"y":4,"d":816},{"n":"DRIZZILE","t":[2],"y":4,"d":817},{"n":"INTELEON","t":[2],"y":4,"d":818},{"n":"SKWOVET","t":[0],"y":9,"d":819},{"n":"GREEDENT","t":[0],"y":9,"d":820},{"n":"ROOKIDEE","t":[9],"y":127,"d":821},{"n":"CORVISQUIRE","t":[9],"y":127,"d":822},{"n":"CORVIKNIGHT","t":[9,16],"y":76,"d":823},{"n":"BLIPBUG","t":[11],"y":5,"d":824},{"n":"DOTTLER","t":[11,10],"y":150,"d":825},{"n":"ORBEETLE","t":[11,10],"y":150,"d":826},{"n":"NICKIT","t":[14],"y":24,"d":827},{"n":"THIEVUL","t":[14],"y":24,"d":828},{"n":"GOSSIFLEUR","t":[3],"y":45,"d":829},{"n":"ELDEGOSS","t":[3],"y":45,"d":830},{"n":"WOOLOO","t":[0],"y":9,"d":831},{"n":"DUBWOOL","t":[0],"y":9,"d":832},{"n":"CHEWTLE","t":[2],"y":4,"d":833},{"n":"DREDNAW","t":[12,2],"y":50,"d":834},{"n":"YAMPER","t":[4],"y":12,"d":835},{"n":"BOLTUND","t":[4],"y":12,"d":836},{"n":"ROLYCOLY","t":[12],"y":64,"d":837},{"n":"CARKOL","t":[1,12],"y":27,"d":838},{"n":"COALOSSAL","t":[1,12],"y":27,"d":839},{"n":"APPLIN","t":[15,3],"y":42,"d":840},{"n":"FLAPPLE","t":[15,3],"y":42,"d":841},{"n":"APPLETUN","t":[15,3],"y":42,"d":842},{"n":"SILICOBRA","t":[8],"y":14,"d":843},{"n":"SANDACONDA","t":[8],"y":14,"d":844},{"n":"CRAMORANT","t":[9,2],"y":48,"d":845},{"n":"ARROKUDA","t":[2],"y":4,"d":846},{"n":"BARRASKEWDA","t":[2],"y":4,"d":847},{"n":"TOXEL","t":[4,7],"y":151,"d":848},{"n":"TOXTRICITY","t":[4,7],"y":151,"d":849},{"n":"TOXTRICITY-LOW-KEY","t":[4,7],"y":151,"d":849},{"n":"SIZZLIPEDE","t":[11,1],"y":125,"d":850},{"n":"CENTISKORCH","t":[11,1],"y":125,"d":851},{"n":"CLOBBOPUS","t":[6],"y":26,"d":852},{"n":"GRAPPLOCT","t":[6],"y":26,"d":853},{"n":"SINISTEA","t":[13],"y":67,"d":854},{"n":"POLTEAGEIST","t":[13],"y":67,"d":855},{"n":"HATENNA","t":[10],"y":29,"d":856},{"n":"HATTREM","t":[10],"y":29,"d":857},{"n":"HATTERENE","t":[17,10],"y":33,"d":858},{"n":"IMPIDIMP","t":[14,17],"y":152,"d":859},{"n":"MORGREM","t":[14,17],"y":152,"d":860},{"n":"GRIMMSNARL","t":[14,17],"y":152,"d":861},{"n":"OBSTAGOON","t":[14,0],"y":10,"d":862},{"n":"PERRSERKER","t":[16],"y":25,"d":863},{"n":"CURSOLA","t":[13],"y":67,"d":864},{"n":"SIRFETCH'D","t":[6],"y":26,"d":865},{"n":"MR. RIME","t":[5,10],"y":46,"d":866},{"n":"RUNERIGUS","t":[13,8],"y":116,"d":867},{"n":"MILCERY","t":[17],"y":17,"d":868},{"n":"ALCREMIE","t":[17],"y":17,"d":869},{"n":"FALINKS","t":[6],"y":26,"d":870},{"n":"PINCURCHIN","t":[4],"y":12,"d":871},{"n":"SNOM","t":[11,5],"y":153,"d":872},{"n":"FROSMOTH","t":[11,5],"y":153,"d":873},{"n":"STONJOURNER","t":[12],"y":64,"d":874},{"n":"EISCUE","t":[5],"y":18,"d":875},{"n":"EISCUE-NOICE","t":[5],"y":18,"d":875},{"n":"INDEEDEE-M","t":[0,10],"y":68,"d":876},{"n":"INDEEDEE-F","t":[0,10],"y":68,"d":876},{"n":"MORPEKO","t":[14,4],"y":154,"d":877},{"n":"MORPEKO-HANGRY","t":[14,4],"y":154,"d":877},{"n":"CUFANT","t":[16],"y":25,"d":878},{"n":"COPPERAJAH","t":[16],"y":25,"d":879},{"n":"DRACOZOLT","t":[15,4],"y":62,"d":880},{"n":"ARCTOZOLT","t":[4,5],"y":107,"d":881},{"n":"DRACOVISH","t":[15,2],"y":78,"d":882},{"n":"ARCTOVISH","t":[5,2],"y":37,"d":883},{"n":"DURALUDON","t":[15,16],"y":108,"d":884},{"n":"DREEPY","t":[15,13],"y":110,"d":885},{"n":"DRAKLOAK","t":[15,13],"y":110,"d":886},{"n":"DRAGAPULT","t":[15,13],"y":110,"d":887},{"n":"ZACIAN","t":[17],"y":17,"d":888},{"n":"ZACIAN-CROWNED","t":[17,16],"y":87,"d":888},{"n":"ZAMAZENTA","t":[6],"y":26,"d":889},{"n":"ZAMAZENTA-CROWNED","t":[6,16],"y":102,"d":889},{"n":"ETERNATUS","t":[15,7],"y":133,"d":890},{"n":"ETERNATUS-ETERNAMAX","t":[15,7],"y":133,"d":890},{"n":"KUBFU","t":[6],"y":26,"d":891},{"n":"URSHIFU","t":[14,6],"y":115,"d":892},{"n":"URSHIFU-RAPID-STRIKE","t":[6,2],"y":28,"d":892},{"n":"ZARUDE","t":[14,3],"y":81,"d":893},{"n":"REGIELEKI","t":[4],"y":12,"d":894},{"n":"REGIDRAGO","t":[15],"y":57,"d":895},{"n":"GLASTRIER","t":[5],"y":18,"d":896},{"n":"SPECTRIER","t":[13],"y":67,"d":897},{"n":"CALYREX","t":[3,10],"y":41,"d":898},{"n":"CALYREX-ICE","t":[5,10],"y":46,"d":898},{"n":"CALYREX-SHADOW","t":[13,10],"y":140,"d":898},{"n":"WYRDEER","t":[0,10],"y":68,"d":899},{"n":"KLEAVOR","t":[11,12],"y":71,"d":900},{"n":"URSALUNA","t":[8,0],"y":129,"d":901},{"n":"BASCULEGION-M","t":[13,2],"y":119,"d":902},{"n":"BASCULEGION-F","t":[13,2],"y":119,"d":902},{"n":"SNEASLER","t":[6,7],"y":74,"d":903},{"n":"OVERQWIL","t":[14,7],"y":38,"d":904},{"n":"ENAMORUS","t":[17,9],"y":61,"d":905},{"n":"ENAMORUS-THERIAN","t":[17,9],"y":61,"d":905},{"n":"SPRIGATITO","t":[3],"y":45,"d":906},{"n":"FLORAGATO","t":[3],"y":45,"d":907},{"n":"MEOWSCARADA","t":[14,3],"y":81,"d":908},{"n":"FUECOCO","t":[1],"y":1,"d":909},{"n":"CROCALOR","t":[1],"y":1,"d":910},{"n":"SKELEDIRGE","t":[1,13],"y":43,"d":911},{"n":"QUAXLY","t":[2],"y":4,"d":912},{"n":"QUAXWELL","t":[2],"y":4,"d":913},{"n":"QUAQUAVAL","t":[6,2],"y":28,"d":914},{"n":"LECHONK","t":[0],"y":9,"d":915},{"n":"OINKOLOGNE-M","t":[0],"y":9,"d":916},{"n":"OINKOLOGNE-F","t":[0],"y":9,"d":916},{"n":"TAROUNTULA","t":[11],"y":5,"d":917},{"n":"SPIDOPS","t":[11],"y":5,"d":918},{"n":"NYMBLE","t":[11],"y":5,"d":919},{"n":"LOKIX","t":[11,14],"y":155,"d":920},{"n":"PAWMI","t":[4],"y":12,"d":921},{"n":"PAWMO","t":[4,6],"y":156,"d":922},{"n":"PAWMOT","t":[4,6],"y":156,"d":923},{"n":"TANDEMAUS","t":[0],"y":9,"d":924},{"n":"MAUSHOLD","t":[0],"y":9,"d":925},{"n":"MAUSHOLD-FOUR","t":[0],"y":9,"d":925},{"n":"FIDOUGH","t":[17],"y":17,"d":926},{"n":"DACHSBUN","t":[17],"y":17,"d":927},{"n":"SMOLIV","t":[3,0],"y":118,"d":928},{"n":"DOLLIV","t":[3,0],"y":118,"d":929},{"n":"ARBOLIVA","t":[3,0],"y":118,"d":930},{"n":"SQUAWKABILLY","t":[9,0],"y":8,"d":931},{"n":"SQUAWKABILLY-BLUE","t":[9,0],"y":8,"d":931},{"n":"SQUAWKABILLY-YELLOW","t":[9,0],"y":8,"d":931},{"n":"SQUAWKABILLY-WHITE","t":[9,0],"y":8,"d":931},{"n":"NACLI","t":[12],"y":64,"d":932},{"n":"NACLSTACK","t":[12],"y":64,"d":933},{"n":"GARGANACL","t":[12],"y":64,"d":934},{"n":"CHARCADET","t":[1],"y":1,"d":935},{"n":"ARMAROUGE","t":[1,10],"y":111,"d":936},{"n":"CERULEDGE","t":[1,13],"y":43,"d":937},{"n":"TADBULB","t":[4],"y":12,"d":938},{"n":"BELLIBOLT","t":[4],"y":12,"d":939},{"n":"WATTREL","t":[4,9],"y":54,"d":940},{"n":"KILOWATTREL","t":[4,9],"y":54,"d":941},{"n":"MASCHIFF","t":[14],"y":24,"d":942},{"n":"MABOSSTIFF","t":[14],"y":24,"d":943},{"n":"SHROODLE","t":[0,7],"y":157,"d":944},{"n":"GRAFAIAI","t":[0,7],"y":157,"d":945},{"n":"BRAMBLIN","t":[13,3],"y":139,"d":946},{"n":"BRAMBLEGHAST","t":[13,3],"y":139,"d":947},{"n":"TOEDSCOOL","t":[3,8],"y":97,"d":948},{"n":"TOEDSCRUEL","t":[3,8],"y":97,"d":949},{"n":"KLAWF","t":[12],"y":64,"d":950},{"n":"CAPSAKID","t":[3],"y":45,"d":951},{"n":"SCOVILLAIN","t":[1,3],"y":158,"d":952},{"n":"RELLOR","t":[11],"y":5,"d":953},{"n":"RABSCA","t":[11,10],"y":150,"d":954},{"n":"FLITTLE","t":[10],"y":29,"d":955},{"n":"ESPATHRA","t":[10],"y":29,"d":956},{"n":"TINKATINK","t":[17,16],"y":87,"d":957},{"n":"TINKATUFF","t":[17,16],"y":87,"d":958},{"n":"TINKATON","t":[17,16],"y":87,"d":959},{"n":"WIGLETT","t":[2],"y":4,"d":960},{"n":"WUGTRIO","t":[2],"y":4,"d":961},{"n":"BOMBIRDIER","t":[14,9],"y":56,"d":962},{"n":"FINIZEN","t":[2],"y":4,"d":963},{"n":"PALAFIN","t":[2],"y":4,"d":964},{"n":"PALAFIN-HERO","t":[2],"y":4,"d":964},{"n":"VAROOM","t":[7,16],"y":159,"d":965},{"n":"REVAVROOM","t":[7,16],"y":159,"d":966},{"n":"CYCLIZAR","t":[15,0],"y":146,"d":967},{"n":"ORTHWORM","t":[16],"y":25,"d":968},{"n":"GLIMMET","t":[7,12],"y":148,"d":969},{"n":"GLIMMORA","t":[7,12],"y":148,"d":970},{"n":"GREAVARD","t":[13],"y":67,"d":971},{"n":"HOUNDSTONE","t":[13],"y":67,"d":972},{"n":"FLAMIGO","t":[6,9],"y":55,"d":973},{"n":"CETODDLE","t":[5],"y":18,"d":974},{"n":"CETITAN","t":[5],"y":18,"d":975},{"n":"VELUZA","t":[10,2],"y":34,"d":976},{"n":"DONDOZO","t":[2],"y":4,"d":977},{"n":"TATSUGIRI","t":[15,2],"y":78,"d":978},{"n":"ANNIHILAPE","t":[6,13],"y":149,"d":979},{"n":"CLODSIRE","t":[8,7],"y":16,"d":980},{"n":"FARIGIRAF","t":[0,10],"y":68,"d":981},{"n":"DUDUNSPARCE","t":[0],"y":9,"d":982},{"n":"DUDUNSPARCE-THREE","t":[0],"y":9,"d":982},{"n":"KINGAMBIT","t":[14,16],"y":123,"d":983},{"n":"GREAT TUSK","t":[6,8],"y":160,"d":984},{"n":"SCREAM TAIL","t":[17,10],"y":33,"d":985},{"n":"BRUTE BONNET","t":[14,3],"y":81,"d":986},{"n":"FLUTTER MANE","t":[17,13],"y":145,"d":987},{"n":"SLITHER WING","t":[11,6],"y":72,"d":988},{"n":"SANDY SHOCKS","t":[4,8],"y":122,"d":989},{"n":"IRON TREADS","t":[8,16],"y":23,"d":990},{"n":"IRON BUNDLE","t":[5,2],"y":37,"d":991},{"n":"IRON HANDS","t":[4,6],"y":156,"d":992},{"n":"IRON JUGULIS","t":[14,9],"y":56,"d":993},{"n":"IRON MOTH","t":[1,7],"y":144,"d":994},{"n":"IRON THORNS","t":[4,12],"y":32,"d":995},{"n":"FRIGIBAX","t":[15,5],"y":128,"d":996},{"n":"ARCTIBAX","t":[15,5],"y":128,"d":997},{"n":"BAXCALIBUR","t":[15,5],"y":128,"d":998},{"n":"GIMMIGHOUL","t":[13],"y":67,"d":999},{"n":"GIMMIGHOUL-ROAMING","t":[13],"y":67,"d":999},{"n":"GHOLDENGO","t":[13,16],"y":131,"d":1000},{"n":"WO-CHIEN","t":[14,3],"y":81,"d":1001},{"n":"CHIEN-PAO","t":[14,5],"y":73,"d":1002},{"n":"TING-LU","t":[14,8],"y":113,"d":1003},{"n":"CHI-YU","t":[14,1],"y":77,"d":1004},{"n":"ROARING MOON","t":[14,15],"y":124,"d":1005},{"n":"IRON VALIANT","t":[17,6],"y":161,"d":1006},{"n":"KORAIDON","t":[15,6],"y":147,"d":1007},{"n":"MIRAIDON","t":[15,4],"y":62,"d":1008}];
+const TYPINGS=[[3,7],[1],[1,9],[15,1],[2],[11],[11,9],[11,7],[9,0],[0],[14,0],[7],[4],[4,10],[8],[5,16],[8,7],[17],[5],[17,5],[17,0],[9,7],[11,3],[8,16],[14],[16],[6],[1,12],[6,2],[10],[7,2],[8,12],[4,12],[17,10],[10,2],[7,10],[4,16],[5,2],[14,7],[13,7],[4,3],[3,10],[15,3],[1,13],[17,7],[3],[5,10],[6,1],[9,2],[14,2],[12,2],[9,12],[9,5],[9,10],[4,9],[6,9],[14,9],[15],[15,9],[6,10],[4,2],[17,9],[15,4],[17,2],[12],[9,3],[8,2],[13],[0,10],[11,16],[9,8],[11,12],[11,6],[14,5],[6,7],[8,5],[9,16],[14,1],[15,2],[14,12],[3,2],[14,3],[11,2],[6,3],[11,8],[11,13],[14,13],[17,16],[12,16],[1,8],[15,8],[15,17],[10,12],[8,10],[3,12],[10,16],[15,10],[3,8],[16,2],[0,2],[9,13],[6,0],[6,16],[3,5],[13,5],[4,13],[4,1],[4,5],[15,16],[1,16],[15,13],[1,10],[17,3],[14,8],[1,5],[14,6],[13,8],[13,0],[3,0],[13,2],[11,4],[3,16],[4,8],[14,16],[14,15],[11,1],[6,12],[9],[15,5],[8,0],[1,0],[13,16],[14,10],[15,7],[4,0],[15,12],[5,12],[4,17],[17,12],[13,3],[13,10],[1,2],[6,5],[11,17],[1,7],[17,13],[15,0],[15,6],[7,12],[6,13],[11,10],[4,7],[14,17],[11,5],[14,4],[11,14],[4,6],[0,7],[1,3],[7,16],[6,8],[17,6]];
+const TYPING_MEMBERS=[[0,1,2,3,56,57,58,90,91,92,390,500,501,714,715],[4,5,48,50,76,78,101,103,166,182,207,208,209,279,303,307,320,401,430,484,569,610,626,627,671,673,757,786,787,875,876,974,975,976,1082,1083,1113],[6,8,195,314,796,797,891],[7,771,934],[9,10,11,12,72,73,80,81,116,122,131,132,155,156,157,158,159,173,180,211,212,213,240,285,286,308,324,396,397,419,427,428,431,450,451,452,454,470,471,487,488,516,517,520,557,558,600,601,613,614,615,628,629,649,665,666,667,718,789,790,828,829,878,879,902,903,928,977,978,979,994,1007,1008,1085,1086,1138,1139,1141,1142,1143,1156],[13,14,167,260,334,335,337,388,389,495,496,506,507,508,712,740,741,798,799,886,985,1091,1092,1093,1131],[15,163,168,218,219,247,336,354,361,512,513,514,571,800],[16,17,18,19,61,62,220,221,338,552,657,658,659],[20,21,22,23,28,29,112,114,115,216,217,345,346,410,490,491,492,540,632,633,634,752,753,795,881,882,883,1106,1107,1108,1109],[24,26,67,70,145,151,153,154,169,177,178,179,183,190,214,215,244,262,277,278,296,297,298,304,305,330,332,357,358,359,363,364,365,370,371,404,413,429,433,493,522,525,526,530,531,539,546,565,576,596,605,617,618,619,620,621,644,696,697,751,793,810,884,885,929,930,933,980,981,992,993,1088,1089,1090,1098,1099,1100,1161,1162],[25,27,331,333,1024],[30,31,40,41,43,44,118,120,146,147,391,392,414,690,691,964],[32,33,34,133,135,165,181,225,232,233,234,302,306,383,384,385,386,387,497,498,499,515,568,635,636,726,727,728,954,968,996,997,1033,1063,1095,1116,1117],[35],[36,38,63,65,140,141,294,295,405,472,550,551,642,906,907,1004,1005],[37,39],[42,45,249,1159],[46,47,226,228,266,267,803,804,805,818,819,820,821,836,861,921,1030,1031,1053,1101,1102],[49,432,444,445,446,464,573,672,675,706,707,708,737,738,739,856,857,1037,1038,1065,1153,1154],[51],[52,53,227,368,645],[54,55,222],[59,60,509,654,655,656],[64,66,264,265,643,743,1170],[68,71,252,328,329,441,442,602,622,623,692,694,988,989,1120,1121],[69,379,465,723,724,725,969,970,1025,1043,1044,1147],[74,75,87,88,89,113,143,144,170,299,300,366,367,547,646,647,648,652,653,744,745,808,889,923,1014,1015,1027,1032,1055,1059],[77,79,280,999,1000],[82,172,778,779,1061,1087],[83,84,85,86,102,106,129,130,200,202,203,251,257,258,402,403,440,443,477,478,479,480,532,588,589,590,599,630,631,698,699,700,701,702,703,729,730,811,812,813,947,948,958,1018,1019,1133,1134],[93,94,268,826,904,905],[95,97,99,128,149,150,309,310,566],[96,98,100,1175],[104,161,349,350,351,352,538,944,1020,1165],[105,107,108,160,254,937,1155],[109,255],[110,111,564,935],[117,123,176,447,448,449,1048,1171],[119,121,269,533,534,553,1076],[124,125,126,127],[134,136,587],[137,138,315,1067],[139,319,1001,1002,1003],[142,210,731,732,733,967,1084,1115],[148],[152,204,205,206,236,245,246,316,317,318,342,355,408,481,482,518,519,556,567,572,603,607,608,609,624,625,662,663,677,783,784,806,807,910,911,918,919,920,971,972,973,990,991,1079,1080,1129],[162,164,301,1028,1068],[171,321,322,323,485,486,611,612],[174,288,347,348,559,704,705,1006],[175,393,394,395,420,616,791,792],[184,185,186,187,283,453,686,687,824,825,995],[188,189,688,689,931,932],[191,287],[192,230,231,313,640,641,682,754,893],[193,586,711,769,770,892,1118,1119],[194,837,1152],[196,253,529,755,756,862,1140,1173],[197,198,455,456,734,735,736,746,840,841,843,940,1064],[199,411,457,458,474,475,859,860],[201,380,381,382,577,578],[223,224,584],[229,570,1077,1078],[235,772,1045,1189],[237,238,880,946],[239,369,463,502,503,537,637,638,639,897,898,899,900,901,998,1036,1110,1111,1112,1128],[241,242,243,439,604,871,872],[248,250,325,326,327,417,418,521,650,651],[256,284,434,435,436,437,438,528,580,683,685,1016,1017,1026,1066,1150,1151,1179,1180],[259,780,922,1039,1040,1070,1160],[261,270,271,511,713,758,782],[263,574,773,774],[272,425,426,678,679,1071],[273,274,952,953,1168],[275,563,1183],[276,554,555,1075],[281,282,575],[289,955,984],[290,291,292,877,1185],[293,593,594,1047,1157],[311,312],[339,340,341],[343,344,409,1062,1081,1166,1182],[353,908,909,924,925],[356,664,766,785,874],[360,510],[362],[372,373,541],[374,375,845,962,1054,1135,1136,1137],[376,377,378,504,505,579,966],[398,399,400,473],[406,407,542,543,544,545,863,864,865],[412],[415,416],[421,422],[423,424],[459,460,461,462,476,535,536,949,959],[466,467,468,469,961],[483,1126,1127],[489],[494],[523,524,894],[527,781,916,917],[548,549,764,1056],[560,561,562],[581],[582],[583],[585,1046],[591,592,842,844,1049],[595],[597,598,1050,1051,1052],[606,674,788,1114],[660,661,912,913,945],[668,669,670,1184],[676],[680,681,809,1060],[684,747,748,926,927,1029],[693,695],[709,710,1103,1104,1105],[716,717,1073,1074],[719,720,887,888],[721,722,956],[742,1169],[749,750,1163],[759,760,761,957,1186],[762,763,1012,1013],[765],[767,768,982,983],[775,776,777,1176,1177,1178],[794,1072],[801,802],[814,815,816,817,1181],[822,823,869],[827,965,1057,1058],[830,831],[832,833],[834,835,858],[838,943],[839,866,867],[846,847,848,849,850,851,852,853,854,855,873,939,1124,1125],[868,950,960,1069],[870],[890],[895,896],[914,915,1174],[936,1167],[938,1146],[941,942,1188],[951,1148,1149],[963,1158],[986,987,1132],[1009,1010,1011],[1021,1022,1023],[1034,1035],[1041,1042],[1094],[1096,1097,1172],[1122,1123],[1130],[1144,1145],[1164],[1187]];
+const TYPE_TYPINGS=[[8,9,10,20,68,99,101,117,118,129,130,134,146,157],[1,2,3,27,43,47,77,89,106,109,111,114,125,130,141,144,158],[4,28,30,34,37,48,49,50,60,63,66,78,80,82,98,99,119,141],[0,22,40,41,42,45,65,80,81,83,94,97,103,112,118,121,139,158],[12,13,32,36,40,54,60,62,105,106,107,120,122,134,137,151,154,156],[15,18,19,37,46,52,73,75,103,104,107,114,128,136,142,153],[26,28,47,55,59,72,74,83,101,102,115,126,142,147,149,156,160,161],[0,7,11,16,21,30,35,38,39,44,74,133,144,148,151,157,159],[14,16,23,31,66,70,75,84,89,90,93,97,113,116,122,129,160],[2,6,8,21,48,51,52,53,54,55,56,58,61,65,70,76,100,127],[13,29,33,34,35,41,46,53,59,68,92,93,95,96,111,132,140,150],[5,6,7,22,69,71,72,82,84,85,120,125,143,150,153,155],[27,31,32,50,51,64,71,79,88,92,94,126,135,136,138,148],[39,43,67,85,86,100,104,105,110,116,117,119,131,139,140,145,149],[10,24,38,49,56,73,77,79,81,86,113,115,123,124,132,152,154,155],[3,42,57,58,62,78,90,91,96,108,110,124,128,133,135,146,147],[15,23,25,36,69,76,87,88,95,98,102,108,109,121,123,131,159],[17,19,20,33,44,61,63,87,91,112,137,138,143,145,152,161]];
@@ -4,6 +4,7 @@ from typing import List, Dict, Collection, Set, Tuple, Union, Optional, Iterable
 from enum import Enum
 import random
 import csv
+import sys
 
 from Utilty.DictUtils import add_or_append
 
@@ -57,15 +58,29 @@ class Typing(Hashable, Iterable[PokemonType]):
     def __repr__(self) -> str:
         return str(self)
 
+    @staticmethod
+    def intern(typing: Typing) -> Typing:
+        """
+        Returns the one shared instance of an equal typing, so that datasets loaded separately share their
+        typings instead of each holding copies.
+        """
+        return _TYPINGS.setdefault(typing, typing)
+
+
+_TYPINGS: Dict[Typing, Typing] = dict()
+
 #
 
 
 class Pokemon(Hashable):
 
-    def __init__(self, name: str, typing: Typing, dex_number: int):
-        self.name = name.upper()
+    def __init__(self, name: str, typing: Typing, dex_number: int, weight: float = 1.0):
+        self.name = sys.intern(name.upper())
         self.typing = typing
         self.dex_number = dex_number
+        self.weight = weight
+        if not weight > 0:
+            raise Exception(f"Invalid weight for {self.name}: {weight}")
 
     def has_type(self, t: PokemonType) -> bool:
         return t in self.typing
@@ -87,9 +102,15 @@ class PokemonMap(Iterable[Pokemon]):
         self.typing_map: Dict[Typing, List[Pokemon]] = dict()
         self.type_map: Dict[PokemonType, List[Pokemon]] = dict()
         self.dex_map: Dict[int, List[Pokemon]] = dict()
+        self._rows: Optional[Tuple[Pokemon, ...]] = None
+        self._row_ids: Optional[Dict[Pokemon, int]] = None
+        self._tables: Dict[Hashable, object] = dict()
         self.add(*pokemon)
 
     def add(self, *pokemon: Pokemon) -> None:
+        self._rows = None
+        self._row_ids = None
+        self._tables = dict()
         for p in pokemon:
             self.name_map[p.name] = p
             add_or_append(self.typing_map, p.typing, p)
@@ -103,6 +124,39 @@ class PokemonMap(Iterable[Pokemon]):
     def __len__(self) -> int:
         return len(self.name_map)
 
+    @property
+    def rows(self) -> Tuple[Pokemon, ...]:
+        """
+        Every Pokémon, sorted by name, so that each has a dense, deterministic row id: its position here.
+        """
+        if self._rows is None:
+            self._rows = tuple(sorted(self.name_map.values(), key=lambda p: p.name))
+        return self._rows
+
+    def row_id(self, pokemon: Pokemon) -> int:
+        if self._row_ids is None:
+            self._row_ids = {p: i for i, p in enumerate(self.rows)}
+        return self._row_ids[pokemon]
+
+    def table(self, key: Hashable, build: Callable[[], object]):
+        """
+        Returns the lookup table built from this dataset under the given key, building it on first use.  Tables
+        are held by the dataset itself, so they are built once per dataset and go when it does, without keeping
+        it alive or being dropped along with the tables of other datasets.
+        """
+        table = self._tables.get(key)
+        if table is None:
+            # Concurrent first uses may both build the table, but all of them get the one that was stored
+            table = self._tables.setdefault(key, build())
+        return table
+
+    @property
+    def weighted(self) -> bool:
+        """
+        Whether any Pokémon carries a weight other than the default, i.e. whether choices should be weighted.
+        """
+        return any(p.weight != 1.0 for p in self)
+
     def name(self, name: str) -> Optional[Pokemon]:
         return self.name_map[name] if name in self.name_map else None
 
@@ -113,12 +167,22 @@ class PokemonMap(Iterable[Pokemon]):
         return {x for t in pokemon_type for x in self.type_map[t] if t in self.type_map}
 
     def dex_num(self, *dex: int) -> Collection[Pokemon]:
-        return {x for d in dex for x in self.dex_map[d] if dex in self.dex_map}
+        return {x for d in dex for x in self.dex_map[d] if d in self.dex_map}
 
     @staticmethod
-    def load_from_csv(path: str) -> PokemonMap:
+    def load_from_csv(path: str, weights_path: Optional[str] = None) -> PokemonMap:
+        """
+        Loads the dex from a CSV file.  Weights can be given for any of the Pokémon in a second CSV file, with
+        "Name" and "Weight" columns, to make them more or less likely to be chosen; the rest weigh 1.  Names and
+        typings are interned, so datasets that overlap share them.
+        """
+        weights: Dict[str, float] = dict()
+        if weights_path is not None:
+            with open(weights_path, "r", encoding="utf-8") as f:
+                weights = {row["Name"].upper(): float(row["Weight"]) for row in csv.DictReader(f)}
         with open(path, "r", encoding="utf-8") as f:
             reader = csv.DictReader(f, next(f).strip().split(","))
             return PokemonMap(*(Pokemon(p["Name"],
-                                        Typing(PokemonType[p["Type1"]], PokemonType[p["Type2"]]),
-                                        p["Dex#"]) for p in reader))
+                                        Typing.intern(Typing(PokemonType[p["Type1"]], PokemonType[p["Type2"]])),
+                                        int(p["Dex#"]),
+                                        weights.get(p["Name"].upper(), 1.0)) for p in reader))
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Callable, Tuple, Iterable, FrozenSet
+from collections import OrderedDict
+from threading import RLock
+import os
+import re
+import sys
+
+from Data.Pokemon import PokemonMap
+
+_ID = re.compile(r"^[a-z0-9][a-z0-9_-]{0,63}$")
+
+# The lookup tables built from a dataset (typing graph, link and name indexes, etc.) take several times the
+# memory of the dataset itself; measured on the national dex, with the default tables warm, about this much.
+TABLE_OVERHEAD = 5.0
+
+
+class DatasetRegistry:
+    """
+    Loads datasets on demand by id, and keeps the most recently used of them in memory, within a memory cap.
+    When loading a dataset would go over the cap, the least recently used ones are evicted first.  Datasets
+    are read from CSV files in the same format as dex_clean.csv, each with an optional weights file alongside
+    it (see PokemonMap.load_from_csv).  Names and typings are interned as they are loaded, so datasets that
+    overlap, e.g. regional dexes, share them instead of each holding copies, and their sizes are estimated
+    without them.
+
+    Everything built from an evicted dataset goes with it, since those tables are held by the dataset itself
+    (see PokemonMap.table); the tables of the datasets still loaded are unaffected.
+
+    :param paths: The datasets, as {id: (csv path, weights path or None)}.
+    :param max_bytes: The memory cap for the loaded datasets and their tables, as estimated by estimate_size()
+    and the table overhead.  The most recently used dataset is kept even if it alone goes over the cap.
+    :param on_evict: Optional.  Called with each evicted dataset, e.g. to release anything else built on it.
+    :param overhead: The memory taken by a dataset's tables, relative to the dataset's own.
+    :param pinned: Optional.  The ids of datasets that are never evicted once loaded, e.g. those that other
+    long-lived state is built on.
+    """
+
+    def __init__(self, paths: Dict[str, Tuple[str, Optional[str]]],
+                 max_bytes: int,
+                 on_evict: Optional[Callable[[PokemonMap], None]] = None,
+                 overhead: float = TABLE_OVERHEAD,
+                 pinned: Iterable[str] = ()):
+        self._paths = dict(paths)
+        self.max_bytes = max_bytes
+        self.overhead = overhead
+        self.pinned: FrozenSet[str] = frozenset(pinned)
+        self._on_evict = on_evict
+        self._loaded: OrderedDict = OrderedDict()
+        self._sizes: Dict[str, int] = dict()
+        self._lock = RLock()
+        self.loads = 0
+        self.evictions = 0
+
+    @staticmethod
+    def from_directory(directory: str, max_bytes: int,
+                       extra: Optional[Dict[str, Tuple[str, Optional[str]]]] = None,
+                       **kwargs) -> DatasetRegistry:
+        """
+        Creates a registry of every <id>.csv file in a directory (if it exists), with <id>_weights.csv as its
+        weights file if there is one, plus any extra datasets given.  Other arguments are as for the constructor.
+        """
+        paths: Dict[str, Tuple[str, Optional[str]]] = dict()
+        if os.path.isdir(directory):
+            for filename in sorted(os.listdir(directory)):
+                dataset_id, ext = os.path.splitext(filename)
+                if ext != ".csv" or dataset_id.endswith("_weights") or not _ID.match(dataset_id):
+                    continue
+                weights = os.path.join(directory, f"{dataset_id}_weights.csv")
+                paths[dataset_id] = (os.path.join(directory, filename), weights if os.path.exists(weights) else None)
+        paths.update(extra or dict())
+        return DatasetRegistry(paths, max_bytes, **kwargs)
+
+    def __contains__(self, dataset_id: str) -> bool:
+        return dataset_id in self._paths
+
+    @property
+    def ids(self) -> List[str]:
+        return sorted(self._paths)
+
+    @property
+    def loaded(self) -> List[str]:
+        """
+        The ids of the datasets in memory, least recently used first.
+        """
+        with self._lock:
+            return list(self._loaded)
+
+    @property
+    def size(self) -> int:
+        with self._lock:
+            return sum(self._sizes.values())
+
+    #
+
+    def get(self, dataset_id: str) -> PokemonMap:
+        """
+        Returns the dataset with the given id, loading it if it isn't in memory.  Raises a KeyError for unknown
+        ids.
+        """
+        with self._lock:
+            data = self._loaded.get(dataset_id)
+            if data is not None:
+                self._loaded.move_to_end(dataset_id)
+                return data
+            if dataset_id not in self._paths:
+                raise KeyError(dataset_id)
+
+            path, weights_path = self._paths[dataset_id]
+            data = PokemonMap.load_from_csv(path, weights_path=weights_path)
+            size = int(estimate_size(data) * (1 + self.overhead))
+            self._evict(self.max_bytes - size)
+            self._loaded[dataset_id] = data
+            self._sizes[dataset_id] = size
+            self.loads += 1
+            return data
+
+    def evict(self, dataset_id: str) -> bool:
+        with self._lock:
+            if dataset_id not in self._loaded or dataset_id in self.pinned:
+                return False
+            self._drop(dataset_id)
+            return True
+
+    def _evict(self, budget: int) -> None:
+        evictable = [i for i in self._loaded if i not in self.pinned]
+        for dataset_id in evictable:
+            if sum(self._sizes.values()) <= budget:
+                break
+            self._drop(dataset_id)
+
+    def _drop(self, dataset_id: str) -> None:
+        data = self._loaded.pop(dataset_id)
+        del self._sizes[dataset_id]
+        self.evictions += 1
+        if self._on_evict is not None:
+            self._on_evict(data)
+
+
+def estimate_size(data: PokemonMap) -> int:
+    """
+    An estimate of the memory a dataset holds on to, in bytes: its Pokémon and the maps indexing them.  Typings
+    are interned, and shared between datasets, so they aren't counted; names are, though datasets that overlap
+    share them too, since there is no telling which dataset will be the last to let go of a name.
+    """
+    size = sys.getsizeof(data) + sys.getsizeof(data.__dict__)
+    for index in (data.name_map, data.typing_map, data.type_map, data.dex_map):
+        size += sys.getsizeof(index) + sum(sys.getsizeof(members) for members in index.values()
+                                           if isinstance(members, list))
+    for pokemon in data:
+        size += sys.getsizeof(pokemon) + sys.getsizeof(pokemon.__dict__) + sys.getsizeof(pokemon.name) \
+            + sys.getsizeof(pokemon.weight)
+    return size
@@ -1 +1,2 @@
 from Data.Pokemon import PokemonMap, PokemonType, Pokemon, Typing
+from Data.Registry import DatasetRegistry
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from typing import Tuple, Sequence, Optional, List
+import math
+
+from Data import *
+from Game.Rules import Rules, ChainState
+from Game.TypingGraph import TypingGraph
+
+
+class BranchingTable:
+    """
+    Per-typing branching statistics for a dataset.  For every typing it stores how many Pokémon each
+    adjacent typing contributes, so the number of valid alternatives after any prefix can be counted
+    per adjacent typing instead of per Pokémon.
+
+    The difficulty of a single step is the number of bits needed to pick the right answer out of the
+    valid alternatives, log2(alternatives), placed on a scale where the least-connected typing of the
+    dataset scores 0 and the most-connected one scores 1 (steps cut down further by the constraints are
+    clamped to 0).  The difficulty of a chain is the mean over its links, so it always lies in [0, 1].
+    """
+
+    def __init__(self, graph: TypingGraph):
+        self.graph = graph
+        self.population: Tuple[int, ...] = tuple(len(m) for m in graph.members)
+        self.branching: Tuple[int, ...] = tuple(sum(self.population[j] for j in n) for n in graph.neighbours)
+        self.min_branching = max(min(self.branching), 1) if self.branching else 1
+        self.max_branching = max(self.branching) if self.branching else 1
+        self._offset = math.log2(self.min_branching)
+        self._scale = math.log2(self.max_branching) - self._offset if self.max_branching > self.min_branching else 1.0
+        self._step_bound: Tuple[float, ...] = tuple(self.step_score(b) for b in self.branching)
+        self._walk_bound: List[Tuple[float, ...]] = [tuple(0.0 for _ in self.branching)]
+
+    @staticmethod
+    def of(data: PokemonMap) -> BranchingTable:
+        return data.table(BranchingTable, lambda: BranchingTable(TypingGraph.of(data)))
+
+    #
+
+    def alternatives(self, rules: Rules, state: ChainState) -> int:
+        """
+        Counts the Pokémon that could validly follow a chain in the given state.
+        """
+        if state.last is None:
+            candidates = range(len(self.graph))
+        else:
+            candidates = self.graph.neighbours[self.graph.index[state.last]]
+        typings = self.graph.typings
+        return sum(self.population[j] for j in candidates if rules.allows(typings[j], state))
+
+    def step_score(self, alternatives: int) -> float:
+        if alternatives <= self.min_branching:
+            return 0.0
+        return min((math.log2(alternatives) - self._offset) / self._scale, 1.0)
+
+    def walk_bound(self, typing: Typing, steps: int) -> float:
+        """
+        An upper bound on the total step score of the next `steps` links of a chain currently ending in
+        the given typing.  Constraints only ever remove alternatives, so the best unconstrained walk
+        through the typing graph bounds every constrained one.
+        """
+        while len(self._walk_bound) <= steps:
+            previous = self._walk_bound[-1]
+            self._walk_bound.append(tuple(max((self._step_bound[j] + previous[j] for j in n), default=0.0)
+                                          for n in self.graph.neighbours))
+        return self._walk_bound[steps][self.graph.index[typing]]
+
+    def score(self, rules: Rules, sequence: Sequence[Pokemon]) -> float:
+        """
+        Computes the difficulty of the given chain, in [0, 1].
+        """
+        if len(sequence) <= 1:
+            return 0.0
+        state = rules.start()
+        total = 0.0
+        for pokemon in sequence[:-1]:
+            state = state.push(pokemon.typing)
+            total += self.step_score(self.alternatives(rules, state))
+        return total / (len(sequence) - 1)
+
+
+def parse_band(minimum: Optional[float], maximum: Optional[float]) -> Optional[Tuple[float, float]]:
+    if minimum is None and maximum is None:
+        return None
+    band = (minimum if minimum is not None else 0.0, maximum if maximum is not None else 1.0)
+    if not (0.0 <= band[0] <= band[1] <= 1.0):
+        raise ValueError(f"Invalid difficulty band: [{band[0]}, {band[1]}]")
+    return band
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from typing import Tuple, Optional, List, Iterator, Callable, Sequence, TextIO
+import json
+
+from Data import *
+from Game.Rules import Rules, ChainState
+from Game.TypingGraph import TypingGraph
+from Game.Solver import Solver
+
+
+class Enumerator:
+    """
+    Lazily enumerates every valid chain, in a deterministic order, as a depth-first walk that keeps one
+    candidate list and one ChainState per depth.  Prefixes that the Solver shows cannot be completed are
+    never expanded, so every prefix explored leads to at least one chain.
+
+    Work can be split into shards, partitioned by the first Pokémon of the chain, and any enumeration can
+    be stopped and resumed from its checkpoint: the candidate positions of the last chain it yielded.
+    """
+
+    def __init__(self, data: PokemonMap, rules: Rules,
+                 shard: int = 0,
+                 shards: int = 1,
+                 where: Optional[Callable[[Tuple[Pokemon, ...]], bool]] = None):
+        if not (0 <= shard < shards):
+            raise Exception(f"Invalid shard: {shard}/{shards}")
+        self._graph = TypingGraph.of(data)
+        self._rules = rules
+        self._solver = Solver(data, rules)
+        self._where = where
+        self._roots = [p for i, p in enumerate(sorted(data, key=lambda x: x.name)) if i % shards == shard]
+        self._checkpoint: Optional[List[int]] = None
+
+    @property
+    def checkpoint(self) -> Optional[List[int]]:
+        """
+        The position of the last chain yielded, which can be passed back to chains() to resume after it.
+        """
+        return list(self._checkpoint) if self._checkpoint is not None else None
+
+    #
+
+    def chains(self, limit: Optional[int] = None,
+               resume: Optional[Sequence[int]] = None) -> Iterator[Tuple[Pokemon, ...]]:
+        rules = self._rules
+        count = 0
+
+        # Each frame holds the candidates at one depth and the position of the one currently in the chain.
+        stack: List[List] = [[self._roots, -1]]
+        sequence: List[Pokemon] = []
+        states: List[ChainState] = [rules.start()]
+        if resume:
+            for depth, position in enumerate(resume):
+                stack[-1][1] = position
+                pokemon = stack[-1][0][position]
+                sequence.append(pokemon)
+                states.append(states[-1].push(pokemon.typing))
+                if depth + 1 < len(resume):
+                    stack.append([self._candidates(pokemon, states[-1]), -1])
+            self._checkpoint = list(resume)
+
+        while stack:
+            frame = stack[-1]
+            if len(sequence) == len(stack):
+                sequence.pop()
+                states.pop()
+            frame[1] += 1
+            if frame[1] >= len(frame[0]):
+                stack.pop()
+                continue
+
+            pokemon = frame[0][frame[1]]
+            state = states[-1].push(pokemon.typing)
+            if len(stack) == 1 and not (rules.allows(pokemon.typing, states[-1]) and self._solver.feasible(state)):
+                continue
+            sequence.append(pokemon)
+            states.append(state)
+
+            if len(sequence) < rules.length:
+                stack.append([self._candidates(pokemon, state), -1])
+                continue
+
+            chain = tuple(sequence)
+            if self._where is None or self._where(chain):
+                self._checkpoint = [f[1] for f in stack]
+                yield chain
+                count += 1
+                if limit is not None and count >= limit:
+                    return
+
+    def _candidates(self, pokemon: Pokemon, state: ChainState) -> List[Pokemon]:
+        graph = self._graph
+        candidates = []
+        for j in graph.neighbours[graph.index[pokemon.typing]]:
+            typing = graph.typings[j]
+            if self._rules.allows(typing, state) and self._solver.feasible(state.push(typing)):
+                candidates.extend(graph.members[j])
+        return candidates
+
+
+def write_jsonl(chains: Iterator[Tuple[Pokemon, ...]], f: TextIO,
+                on_written: Optional[Callable[[int], None]] = None) -> int:
+    """
+    Streams chains to the given file as JSON Lines, one {"seq": [...]} object per line, and returns how
+    many were written.  If given, on_written is called with the running count after each line.
+    """
+    count = 0
+    for chain in chains:
+        f.write(json.dumps({"seq": [p.name for p in chain]}, separators=(",", ":")) + "\n")
+        count += 1
+        if on_written is not None:
+            on_written(count)
+    return count
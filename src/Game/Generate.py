@@ -1,50 +1,197 @@
 
-from typing import Tuple, Dict, Optional, List, Iterable, Callable, Collection
+from typing import Tuple, Dict, Optional, List, Iterable, Callable, Sequence
 import random
 
 from Data import *
+from Game.Rules import Rules, ChainState
+from Game.Difficulty import BranchingTable
+from Game.Weights import WeightTables
+from Game.History import ChainHistory
+from Game.TypingGraph import TypingGraph
+from Game.Links import LinkIndex, DEFAULT_LINK_RULE
+from Game.Solver import Solver
+
+REFERENCE_ENGINE = "reference"
+
+
+class NoSequenceError(Exception):
+    """
+    Raised when there is no chain meeting a generator's criteria, or none its engine could find.
+    """
+    pass
 
 
 class Generator:
+    """
+    Generates random chains under the given rules.  The search itself is done by one of several engines (see
+    ENGINES), which all produce chains meeting the same criteria: those of the rules (see Rules.allows), and of
+    the history, if any, as checked together by _meets_criteria.  The engine
+    is picked automatically from the options given, unless one is asked for.  The reference engine is the
+    plain depth-first search every other engine has to agree with.
+    """
 
     def __init__(self, data: PokemonMap,
                  length: int,
                  typing_limit: int,
                  type_limit: int,
                  allow_monotype: bool,
-                 random_seed: Optional[int] = None):
+                 random_seed: Optional[int] = None,
+                 difficulty: Optional[Tuple[float, float]] = None,
+                 difficulty_budget: int = 1000,
+                 history: Optional[ChainHistory] = None,
+                 link_rule: str = DEFAULT_LINK_RULE,
+                 engine: Optional[str] = None):
         self._data = data
         self._length = length
-        self._typing_limit = typing_limit
-        self._type_limit = type_limit
-        self._allow_monotype = allow_monotype
+        self._rules = Rules(length, typing_limit, type_limit, allow_monotype)
         self._rand = random.Random() if random_seed is None else random.Random(random_seed)
+        self._difficulty = difficulty
+        self._difficulty_budget = difficulty_budget
+        self._expansions = 0
+        self._links = LinkIndex.of(data, link_rule)
+        self._history = history
         if self._length <= 0:
             raise Exception("Invalid sequence length")
+        if difficulty is not None and not (0.0 <= difficulty[0] <= difficulty[1] <= 1.0):
+            raise Exception("Invalid difficulty band")
+
+        if engine is None:
+            engine = "targeted" if difficulty is not None else \
+                "weighted" if data.weighted and link_rule == DEFAULT_LINK_RULE else REFERENCE_ENGINE
+        if engine not in ENGINES:
+            raise Exception(f"Unknown engine: {engine}")
+        if (difficulty is not None) != (engine == "targeted"):
+            raise Exception("Difficulty bands are only supported by, and required for, the targeted engine")
+        # The other engines search over typings, so they only apply under the default link rule
+        if engine != REFERENCE_ENGINE and link_rule != DEFAULT_LINK_RULE:
+            raise Exception(f"The {engine} engine only supports the default link rule")
+        if engine == "solver" and history is not None:
+            raise Exception("The solver engine does not support chain history")
+        self.engine = engine
+        self._weights: Optional[WeightTables] = WeightTables.of(data) \
+            if engine == "weighted" or (data.weighted and engine == "targeted") else None
+
+    @property
+    def rules(self) -> Rules:
+        return self._rules
 
     #
 
     def generate(self) -> Tuple[Pokemon, ...]:
-        seq = self._finish_sequence(tuple())
+        seq = ENGINES[self.engine](self)
         if seq is None:
-            raise Exception("Could not generate a valid sequence with the generator's criteria.")
+            raise NoSequenceError("Could not generate a valid sequence with the generator's criteria.")
         return seq
 
+    def meets_criteria(self, sequence: Sequence[Pokemon]) -> bool:
+        """
+        Whether a whole chain meets the generator's criteria, checked as the reference engine would check it
+        one Pokémon at a time, i.e. independently of the engine that produced it.
+        """
+        if len(sequence) != self._length or self._issued(tuple(sequence)):
+            return False
+        state = self._rules.start()
+        for i, pokemon in enumerate(sequence):
+            if i > 0 and not self._links.linked(self._data.row_id(sequence[i - 1]), self._data.row_id(pokemon)):
+                return False
+            if not self._meets_criteria(pokemon, state):
+                return False
+            state = state.push(pokemon.typing)
+        return True
+
     #
 
-    def _finish_sequence(self, sequence: Tuple[Pokemon, ...]) -> Optional[Tuple[Pokemon, ...]]:
+    def _finish_sequence(self, sequence: Tuple[Pokemon, ...], state: ChainState) -> Optional[Tuple[Pokemon, ...]]:
         if len(sequence) >= self._length:
-            return sequence
+            return sequence if not self._issued(sequence) else None
 
+        # Candidates come from the link index in row order, i.e. sorted by name, so that the shuffle under a
+        # given seed is reproducible
+        rows = self._links.rows
         if len(sequence) > 0:
-            pok = sequence[-1]
-            matches = [p for p in self._data.type(*pok.typing) if self._meets_criteria(p, sequence)]
+            candidates = self._links.neighbours(self._data.row_id(sequence[-1]))
+            matches = [rows[j] for j in candidates if self._meets_criteria(rows[j], state)]
         else:
-            matches = [p for p in self._data if self._meets_criteria(p, [])]
+            matches = [p for p in rows if self._meets_criteria(p, state)]
         self._rand.shuffle(matches)
 
         for match in matches:
-            seq = self._finish_sequence(sequence + (match,))
+            seq = self._finish_sequence(sequence + (match,), state.push(match.typing))
+            if seq is not None:
+                return seq
+
+        return None
+
+    def _run_targeted(self) -> Optional[Tuple[Pokemon, ...]]:
+        self._expansions = 0
+        return self._finish_targeted(tuple(), self.rules.start(), 0.0, BranchingTable.of(self._data))
+
+    def _run_solver(self) -> Optional[Tuple[Pokemon, ...]]:
+        # Steps through the typing graph guided by the solver's memoized feasibility, so it never backtracks
+        return Solver(self._data, self.rules, random_seed=self._rand.randrange(2 ** 32)).complete(tuple())
+
+    def _finish_weighted(self, sequence: Tuple[Pokemon, ...], state: ChainState) -> Optional[Tuple[Pokemon, ...]]:
+        # Weighted variant of _finish_sequence: candidates are tried in a weighted random order, drawn lazily
+        # from the precomputed alias table for the last Pokémon's typing, instead of shuffling them all.
+        if len(sequence) >= self._length:
+            return sequence if not self._issued(sequence) else None
+
+        table = self._weights.links[sequence[-1].typing] if len(sequence) > 0 else self._weights.start
+        for match in table.order(self._rand, lambda p: self._meets_criteria(p, state)):
+            seq = self._finish_weighted(sequence + (match,), state.push(match.typing))
+            if seq is not None:
+                return seq
+
+        return None
+
+    def _finish_targeted(self, sequence: Tuple[Pokemon, ...], state: ChainState, score: float,
+                         table: BranchingTable) -> Optional[Tuple[Pokemon, ...]]:
+        # Difficulty-targeted variant of _finish_sequence.  Candidates are grouped by typing, since every
+        # member of a typing contributes the same step score.  Groups that can no longer land the chain's
+        # mean step score inside the band are pruned, and the rest are tried closest-to-target first, so
+        # the search steers into the band instead of generating chains and rejecting them afterwards.
+        links = self._length - 1
+        if len(sequence) >= self._length:
+            return sequence if (links > 0 or self._difficulty[0] <= 0.0) and not self._issued(sequence) else None
+
+        # Bands right at the edge of what the constraints allow can take an exhaustive search to disprove,
+        # so the number of expanded prefixes is capped and the band is reported as unreachable past that.
+        self._expansions += 1
+        if self._expansions > self._difficulty_budget:
+            return None
+
+        rules = self.rules
+        graph = table.graph
+        low, high = self._difficulty[0] * links, self._difficulty[1] * links
+        scoring = len(sequence) + 1 < self._length
+        remaining = self._length - len(sequence) - 2
+        need = ((low + high) / 2 - score) / (remaining + 1) if scoring else 0.0
+        tier = max((high - low) / (2 * links), 0.05) if links > 0 else 1.0
+
+        candidates = range(len(graph)) if state.last is None else graph.neighbours[graph.index[state.last]]
+        groups = []
+        for j in candidates:
+            if not rules.allows(graph.typings[j], state):
+                continue
+            child = state.push(graph.typings[j])
+            step = 0.0
+            if scoring:
+                alternatives = table.alternatives(rules, child)
+                if alternatives == 0:
+                    continue
+                step = table.step_score(alternatives)
+                if score + step > high or score + step + table.walk_bound(child.last, remaining) < low:
+                    continue
+            groups.append((int(abs(step - need) / tier), self._tiebreak(j), j, child, step))
+        groups.sort()
+
+        # Every member of a typing leads to the same child state, so if one of them cannot be completed
+        # then none of them can, and a single randomly chosen member per group is enough.
+        for _, _, j, child, step in groups:
+            match = self._pick_member(graph, j)
+            if match is None:
+                continue
+            seq = self._finish_targeted(sequence + (match,), child, score + step, table)
             if seq is not None:
                 return seq
 
@@ -52,12 +199,34 @@ class Generator:
 
     #
 
-    def _meets_criteria(self, pokemon: Pokemon, sequence: Collection[Pokemon]):
-        if not self._allow_monotype and len(pokemon.typing) == 1:
-            return False
-        if 0 < self._typing_limit <= [x.typing for x in sequence].count(pokemon.typing):
-            return False
-        for pokemon_type in pokemon.typing:
-            if 0 < self._type_limit <= [t for x in sequence for t in x.typing].count(pokemon_type):
-                return False
-        return True
+    def _pick_member(self, graph: TypingGraph, j: int) -> Optional[Pokemon]:
+        # Members of a typing are interchangeable, except for those the history rules out
+        if self._weights is not None:
+            return next(self._weights.members[j].order(self._rand, self._fresh), None)
+        fresh = [p for p in graph.members[j] if self._fresh(p)]
+        return self._rand.choice(fresh) if fresh else None
+
+    def _fresh(self, pokemon: Pokemon) -> bool:
+        return self._history is None or not self._history.recent(pokemon)
+
+    def _issued(self, sequence: Tuple[Pokemon, ...]) -> bool:
+        return self._history is not None and self._history.seen(sequence)
+
+    def _tiebreak(self, j: int) -> float:
+        # With weights, typings of equal closeness are ordered by weighted random keys (heaviest typings
+        # tend to come first), which orders them as a weighted draw without replacement would.
+        if self._weights is None:
+            return self._rand.random()
+        return -self._rand.random() ** (1.0 / self._weights.typing_weight[j])
+
+    def _meets_criteria(self, pokemon: Pokemon, state: ChainState) -> bool:
+        return self._rules.allows(pokemon.typing, state) and self._fresh(pokemon)
+
+
+# The search engines, by name.  Each returns a chain meeting the generator's criteria, or None if there is none.
+ENGINES: Dict[str, Callable[[Generator], Optional[Tuple[Pokemon, ...]]]] = {
+    REFERENCE_ENGINE: lambda g: g._finish_sequence(tuple(), g._rules.start()),
+    "weighted": lambda g: g._finish_weighted(tuple(), g._rules.start()),
+    "targeted": lambda g: g._run_targeted(),
+    "solver": lambda g: g._run_solver(),
+}
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from typing import Tuple, Optional, List, Iterable, Sequence, Set, Deque
+from collections import deque
+import hashlib
+import struct
+
+from Data import *
+
+MAGIC = b"WHI1"
+DEFAULT_WINDOW = 7
+
+_HEADER = struct.Struct(">4sII")
+_HASH = struct.Struct(">Q")
+
+
+class ChainHistory:
+    """
+    A compact index of previously issued chains, for generation to steer clear of.  It holds:
+
+    - a set of 64-bit hashes of every chain ever issued, so that no chain is issued twice.  Chains are hashed
+      by their names, so the index outlives changes to the dataset.
+    - the last `window` chains, and a bitmask over the dataset's row ids of every Pokémon they contain, so
+      that recently used Pokémon can be ruled out in O(1).
+
+    On disk, each past chain costs 8 bytes, so even decades of dailies load in well under a millisecond.
+    """
+
+    def __init__(self, data: PokemonMap, window: int = DEFAULT_WINDOW):
+        self._data = data
+        self.window = window
+        self._hashes: Set[int] = set()
+        self._recent: Deque[Tuple[str, ...]] = deque()
+        self._counts: List[int] = [0] * len(data)
+        self._mask = 0
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    @staticmethod
+    def chain_hash(names: Iterable[str]) -> int:
+        digest = hashlib.blake2b("|".join(names).encode("utf-8"), digest_size=_HASH.size).digest()
+        return _HASH.unpack(digest)[0]
+
+    #
+
+    def add(self, chain: Sequence[Pokemon]) -> None:
+        self._hashes.add(ChainHistory.chain_hash(p.name for p in chain))
+        self._push_recent(tuple(p.name for p in chain))
+
+    def seen(self, chain: Sequence[Pokemon]) -> bool:
+        return ChainHistory.chain_hash(p.name for p in chain) in self._hashes
+
+    def recent(self, pokemon: Pokemon) -> bool:
+        return (self._mask >> self._data.row_id(pokemon)) & 1 == 1
+
+    def _push_recent(self, names: Tuple[str, ...]) -> None:
+        if self.window <= 0:
+            return
+        self._recent.append(names)
+        self._update_mask(names, 1)
+        while len(self._recent) > self.window:
+            self._update_mask(self._recent.popleft(), -1)
+
+    def _update_mask(self, names: Tuple[str, ...], delta: int) -> None:
+        for name in names:
+            pokemon = self._data.name(name)
+            if pokemon is None:
+                continue
+            row = self._data.row_id(pokemon)
+            self._counts[row] += delta
+            if self._counts[row] > 0:
+                self._mask |= 1 << row
+            else:
+                self._mask &= ~(1 << row)
+
+    #
+
+    def save(self, path: str) -> None:
+        recent = "\n".join(",".join(names) for names in self._recent).encode("utf-8")
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, self.window, len(self._hashes)))
+            f.write(b"".join(_HASH.pack(h) for h in sorted(self._hashes)))
+            f.write(recent)
+
+    @staticmethod
+    def load(data: PokemonMap, path: str, window: Optional[int] = None) -> ChainHistory:
+        """
+        Loads an index written by save().  The recent window can be overridden, in which case only as many of
+        the stored recent chains as are still available are used.
+        """
+        with open(path, "rb") as f:
+            content = f.read()
+        magic, stored_window, count = _HEADER.unpack_from(content)
+        if magic != MAGIC:
+            raise Exception(f"Not a chain history file: {path}")
+        history = ChainHistory(data, window=stored_window if window is None else window)
+        start = _HEADER.size
+        history._hashes = {h for (h,) in _HASH.iter_unpack(content[start:start + count * _HASH.size])}
+        recent = content[start + count * _HASH.size:].decode("utf-8")
+        for line in recent.splitlines():
+            if line:
+                history._push_recent(tuple(line.split(",")))
+        return history
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from typing import Tuple, Dict, List, Iterable, Hashable
+from bisect import bisect_left
+from array import array
+from abc import ABC, abstractmethod
+import unicodedata
+
+from Data import *
+from Game.Rules import Rules
+
+# The last national dex number of each generation
+GENERATION_ENDS = (151, 251, 386, 493, 649, 721, 809, 905, 1025)
+
+
+class LinkRule(ABC):
+    """
+    A rule for which Pokémon may follow which in a chain.  Rules are defined by keys: a Pokémon may follow
+    another if any of the keys it can be reached by is among the keys the other links out by.  Defining rules
+    this way lets LinkIndex compile them by bucketing Pokémon on their keys, instead of testing every pair.
+    """
+
+    name = ""
+    description = ""
+
+    @abstractmethod
+    def sources(self, pokemon: Pokemon) -> Iterable[Hashable]:
+        """
+        The keys a Pokémon links out by.
+        """
+        ...
+
+    def targets(self, pokemon: Pokemon) -> Iterable[Hashable]:
+        """
+        The keys a Pokémon can be reached by.  The same as its sources, for symmetric rules.
+        """
+        return self.sources(pokemon)
+
+    def linked(self, a: Pokemon, b: Pokemon) -> bool:
+        return not set(self.sources(a)).isdisjoint(self.targets(b))
+
+    def check(self, rules: Rules) -> None:
+        """
+        Raises a ValueError if no chain linked by this rule can meet the given rules, whatever the dataset.
+        """
+        pass
+
+
+class SharedType(LinkRule):
+    name = "type"
+    description = "Shares at least one type with the previous Pokémon."
+
+    def sources(self, pokemon: Pokemon) -> Iterable[Hashable]:
+        return pokemon.typing
+
+
+class SharedTyping(LinkRule):
+    name = "typing"
+    description = "Shares both types with the previous Pokémon."
+
+    def sources(self, pokemon: Pokemon) -> Iterable[Hashable]:
+        return pokemon.typing,
+
+    def check(self, rules: Rules) -> None:
+        # Every Pokémon in the chain has the same typing, so the typing and its types appear once per Pokémon
+        if 0 < rules.typing_limit < rules.length or 0 < rules.type_limit < rules.length:
+            raise ValueError(f"The {self.name} link rule repeats one typing throughout the chain, so the typing "
+                             f"and type limits must be at least the chain's length ({rules.length}), or 0.")
+
+
+class ConsecutiveDex(LinkRule):
+    name = "dex"
+    description = "Comes right before or after the previous Pokémon in the national dex."
+
+    def sources(self, pokemon: Pokemon) -> Iterable[Hashable]:
+        return pokemon.dex_number - 1, pokemon.dex_number + 1
+
+    def targets(self, pokemon: Pokemon) -> Iterable[Hashable]:
+        return pokemon.dex_number,
+
+
+class SameGeneration(LinkRule):
+    name = "generation"
+    description = "Was introduced in the same generation as the previous Pokémon."
+
+    def sources(self, pokemon: Pokemon) -> Iterable[Hashable]:
+        return generation(pokemon.dex_number),
+
+
+class LastLetter(LinkRule):
+    name = "letter"
+    description = "Starts with the letter the previous Pokémon's name ends with."
+
+    def sources(self, pokemon: Pokemon) -> Iterable[Hashable]:
+        return _letters(pokemon.name)[-1:]
+
+    def targets(self, pokemon: Pokemon) -> Iterable[Hashable]:
+        return _letters(pokemon.name)[:1]
+
+
+LINK_RULES: Dict[str, LinkRule] = {rule.name: rule for rule in (SharedType(), SharedTyping(), ConsecutiveDex(),
+                                                                 SameGeneration(), LastLetter())}
+DEFAULT_LINK_RULE = SharedType.name
+
+
+def link_rule(name: str) -> LinkRule:
+    """
+    Looks a link rule up by name, raising a ValueError if there is no such rule.
+    """
+    if name not in LINK_RULES:
+        raise ValueError(f"Unknown link rule: {name} (expected one of {', '.join(LINK_RULES)})")
+    return LINK_RULES[name]
+
+
+def generation(dex_number: int) -> int:
+    return bisect_left(GENERATION_ENDS, dex_number) + 1
+
+
+def _letters(name: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", name)
+    return "".join(c for c in decomposed if c.isalpha() and not unicodedata.combining(c)).upper()
+
+
+#
+
+
+class LinkIndex:
+    """
+    A link rule compiled against a dataset: the Pokémon that may follow each Pokémon, as compressed sparse
+    row arrays over the dataset's row ids.  The ids that may follow row i are targets[offsets[i]:offsets[i + 1]],
+    in ascending order, i.e. sorted by name.  Walking the index costs the same whatever the rule, since all of
+    a rule's work is done when it is compiled.
+    """
+
+    def __init__(self, data: PokemonMap, rule: LinkRule):
+        self.rule = rule
+        self.rows: Tuple[Pokemon, ...] = data.rows
+        buckets: Dict[Hashable, List[int]] = dict()
+        for i, pokemon in enumerate(self.rows):
+            for key in set(rule.targets(pokemon)):
+                buckets.setdefault(key, []).append(i)
+
+        self.offsets = array("I", [0])
+        self.targets = array("I")
+        for pokemon in self.rows:
+            keys = set(rule.sources(pokemon))
+            if len(keys) == 1:
+                self.targets.extend(buckets.get(next(iter(keys)), ()))
+            else:
+                self.targets.extend(sorted({j for key in keys for j in buckets.get(key, ())}))
+            self.offsets.append(len(self.targets))
+
+    @staticmethod
+    def of(data: PokemonMap, rule: str) -> LinkIndex:
+        """
+        Returns the (cached) index of the named link rule for the given dataset, so each rule is only compiled
+        once per container.
+        """
+        return data.table((LinkIndex, rule), lambda: LinkIndex(data, link_rule(rule)))
+
+    def __len__(self) -> int:
+        return len(self.targets)
+
+    #
+
+    def neighbours(self, i: int) -> array:
+        return self.targets[self.offsets[i]:self.offsets[i + 1]]
+
+    def linked(self, i: int, j: int) -> bool:
+        start, end = self.offsets[i], self.offsets[i + 1]
+        k = bisect_left(self.targets, j, start, end)
+        return k < end and self.targets[k] == j
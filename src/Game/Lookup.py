@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+from typing import Tuple, Dict, List, Optional, FrozenSet, Iterable
+from bisect import bisect_left
+import unicodedata
+
+from Data import *
+from Game.TypingGraph import TypingGraph
+
+_SYMBOLS = {"♀": "F", "♂": "M"}
+
+
+def normalize(name: str) -> str:
+    """
+    Reduces a name to the letters and digits that identify it, upper-cased and without accents, so that e.g.
+    "Mr Mime", "mr. mime" and "MR. MIME" are all "MRMIME", and "farfetchd" matches "FARFETCH'D".
+    """
+    name = "".join(_SYMBOLS.get(c, c) for c in name)
+    decomposed = unicodedata.normalize("NFKD", name)
+    return "".join(c for c in decomposed if c.isalnum() and not unicodedata.combining(c)).upper()
+
+
+class NameIndex:
+    """
+    Looks Pokémon up by normalized name, for resolving player input and for autocomplete.
+
+    - Prefix search runs over the normalized names in sorted order, where every prefix covers one contiguous
+      range, found by binary search; this is a trie flattened into an array, without the per-node overhead.
+    - Typo-tolerant search uses an inverted index of the names' character bigrams.  An edit changes at most
+      three bigrams (two for an insertion, deletion or substitution, three for a transposition), so only names
+      sharing enough bigrams with the query can be within the allowed distance, and only those few are compared
+      in full.
+
+    Either search can be restricted to the legal next moves after a given Pokémon, i.e. to the typings that
+    share a type with its own, which is checked per candidate with a set lookup.
+    """
+
+    def __init__(self, data: PokemonMap):
+        self._graph = TypingGraph.of(data)
+        by_key: Dict[str, List[Pokemon]] = dict()
+        for pokemon in sorted(data, key=lambda p: p.name):
+            by_key.setdefault(normalize(pokemon.name), []).append(pokemon)
+        self.keys: Tuple[str, ...] = tuple(sorted(by_key))
+        self._pokemon: Tuple[Tuple[Pokemon, ...], ...] = tuple(tuple(by_key[k]) for k in self.keys)
+        self._ids: Dict[str, int] = {k: i for i, k in enumerate(self.keys)}
+        self._typings: Tuple[FrozenSet[int], ...] = tuple(frozenset(self._graph.index[p.typing] for p in members)
+                                                          for members in self._pokemon)
+        self._bigrams: Dict[str, List[int]] = dict()
+        for i, key in enumerate(self.keys):
+            for gram in _bigrams(key):
+                self._bigrams.setdefault(gram, []).append(i)
+
+    @staticmethod
+    def of(data: PokemonMap) -> NameIndex:
+        return data.table(NameIndex, lambda: NameIndex(data))
+
+    #
+
+    def exact(self, name: str) -> Optional[Pokemon]:
+        """
+        Resolves a name that only differs from a Pokémon's in case, spacing, punctuation or accents.  Names that
+        normalize to more than one Pokémon are ambiguous, and resolve to nothing.
+        """
+        i = self._ids.get(normalize(name))
+        if i is None or len(self._pokemon[i]) != 1:
+            return None
+        return self._pokemon[i][0]
+
+    def complete(self, text: str, limit: int = 10,
+                 after: Optional[Pokemon] = None,
+                 max_distance: Optional[int] = None) -> List[Pokemon]:
+        """
+        Suggests Pokémon for partially typed input: names starting with it first (shortest first), then, to
+        fill up to the limit, names within a small edit distance of it (closest first).
+
+        :param text: The input so far.
+        :param limit: The maximum number of suggestions.
+        :param after: Optional.  Only suggest legal next moves after this Pokémon.
+        :param max_distance: Optional.  The largest edit distance to suggest names at.  By default, 1 for short
+        inputs and 2 for longer ones.
+        """
+        query = normalize(text)
+        allowed = self._graph.adjacency[self._graph.index[after.typing]] if after is not None else None
+        ids = self._prefixed(query, limit, allowed)
+        if len(ids) < limit and query:
+            seen = set(ids)
+            for i in self._similar(query, _default_distance(query) if max_distance is None else max_distance,
+                                   allowed):
+                if i not in seen:
+                    ids.append(i)
+                    if len(ids) >= limit:
+                        break
+        suggestions = [p for i in ids for p in self._pokemon[i] if allowed is None or self._graph.index[p.typing] in allowed]
+        return suggestions[:limit]
+
+    def search(self, text: str,
+               after: Optional[Pokemon] = None,
+               max_distance: Optional[int] = None) -> List[Pokemon]:
+        """
+        Finds the Pokémon whose names are closest to the given text, within the maximum edit distance: all of
+        those at the smallest distance found.
+        """
+        query = normalize(text)
+        allowed = self._graph.adjacency[self._graph.index[after.typing]] if after is not None else None
+        distance = _default_distance(query) if max_distance is None else max_distance
+        best: List[int] = []
+        best_distance = distance + 1
+        for i, d in self._similar_with_distance(query, distance, allowed):
+            if d < best_distance:
+                best, best_distance = [i], d
+            elif d == best_distance:
+                best.append(i)
+        return [p for i in best for p in self._pokemon[i] if allowed is None or self._graph.index[p.typing] in allowed]
+
+    #
+
+    def _prefixed(self, prefix: str, limit: int, allowed: Optional[FrozenSet[int]]) -> List[int]:
+        start = bisect_left(self.keys, prefix)
+        end = bisect_left(self.keys, prefix + "￿", lo=start)
+        if allowed is None and end - start <= limit:
+            ids = list(range(start, end))
+        else:
+            ids = [i for i in range(start, end) if allowed is None or not self._typings[i].isdisjoint(allowed)]
+        ids.sort(key=lambda i: (len(self.keys[i]), self.keys[i]))
+        return ids[:limit]
+
+    def _similar(self, query: str, distance: int, allowed: Optional[FrozenSet[int]]) -> List[int]:
+        matches = sorted(self._similar_with_distance(query, distance, allowed), key=lambda x: (x[1], self.keys[x[0]]))
+        return [i for i, _ in matches]
+
+    def _similar_with_distance(self, query: str, distance: int,
+                               allowed: Optional[FrozenSet[int]]) -> List[Tuple[int, int]]:
+        grams = _bigrams(query)
+        counts: Dict[int, int] = dict()
+        for gram in grams:
+            for i in self._bigrams.get(gram, ()):
+                counts[i] = counts.get(i, 0) + 1
+        needed = len(grams) - 3 * distance
+        if needed > 0:
+            candidates: Iterable[int] = [i for i, c in counts.items() if c >= needed]
+        else:
+            # Queries this short share too few bigrams to filter on, so every name is a candidate
+            candidates = range(len(self.keys))
+
+        results = []
+        for i in candidates:
+            if abs(len(self.keys[i]) - len(query)) > distance:
+                continue
+            if allowed is not None and self._typings[i].isdisjoint(allowed):
+                continue
+            d = edit_distance(query, self.keys[i], distance)
+            if d <= distance:
+                results.append((i, d))
+        return results
+
+
+def edit_distance(a: str, b: str, bound: int) -> int:
+    """
+    The optimal string alignment distance between two strings (insertions, deletions, substitutions and
+    transpositions of adjacent characters), or bound + 1 if it exceeds the bound.
+    """
+    if abs(len(a) - len(b)) > bound:
+        return bound + 1
+    previous2: List[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > bound:
+            return bound + 1
+        previous2, previous = previous, current
+    return previous[len(b)] if previous[len(b)] <= bound else bound + 1
+
+
+def _bigrams(key: str) -> List[str]:
+    padded = "^" + key + "$"
+    return [padded[i:i + 2] for i in range(len(padded) - 1)]
+
+
+def _default_distance(query: str) -> int:
+    return 1 if len(query) <= 5 else 2
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+from typing import Tuple, Optional, List, Dict, Hashable, FrozenSet
+import random
+
+from Data import *
+from Game.Rules import Rules, ChainState
+from Game.TypingGraph import TypingGraph
+
+# The search restarts in a new random order after this many expanded states, doubling each time, since how
+# long a search takes depends heavily on the order it happens to try typings in
+RESTART_EXPANSIONS = 500
+# The total number of expanded states a search may take before giving up
+DEFAULT_BUDGET = 20000
+
+
+class _OutOfExpansions(Exception):
+    pass
+
+
+class PathFinder:
+    """
+    Finds chains that start and end at given Pokémon, under the usual typing/type limits.
+
+    The search is a meet-in-the-middle over the typing graph.  Layers are grown backwards from the end
+    typing, recording which typings can reach it in exactly k links, and the forward search from the start
+    only ever steps onto typings in the layer matching the links it has left, so it never wanders
+    somewhere the end can't be reached from in time.  The end Pokémon is counted into the constraint state
+    up front, so every partial chain already leaves room for it.  States without enough type uses left for
+    the links remaining (see Rules.link_capacity) are cut off, and dead states are memoized.  Pokémon are
+    only assigned to the typings once a typing path has been found.
+
+    Long chains can still take an exhaustive search to find or disprove, so the number of expanded states is
+    capped by a budget, and the search is restarted in a new random order every so often within it.  If the
+    budget runs out, no chain is returned, and exhausted is set.
+    """
+
+    def __init__(self, data: PokemonMap,
+                 typing_limit: int,
+                 type_limit: int,
+                 allow_monotype: bool,
+                 random_seed: Optional[int] = None,
+                 budget: int = DEFAULT_BUDGET):
+        self._graph = TypingGraph.of(data)
+        self._typing_limit = typing_limit
+        self._type_limit = type_limit
+        self._allow_monotype = allow_monotype
+        self._rand = random.Random() if random_seed is None else random.Random(random_seed)
+        self._budget = budget
+        self._limit = 0
+        self._expansions = 0
+        self.exhausted = False
+
+    def rules(self, steps: int) -> Rules:
+        return Rules(steps + 1, self._typing_limit, self._type_limit, self._allow_monotype)
+
+    #
+
+    def find(self, start: Pokemon, end: Pokemon, steps: int) -> Optional[Tuple[Pokemon, ...]]:
+        """
+        Returns a chain from start to end with exactly the given number of links, or None if there is none, or
+        none was found within the budget.
+        """
+        self.exhausted = False
+        self._expansions = 0
+        return self._find(start, end, steps)
+
+    def find_shortest(self, start: Pokemon, end: Pokemon, max_steps: int) -> Optional[Tuple[Pokemon, ...]]:
+        """
+        Returns a chain from start to end with as few links as possible (up to max_steps), or None if there
+        is none within that many links, or none was found within the budget, which is shared by every number
+        of links tried.
+        """
+        self.exhausted = False
+        self._expansions = 0
+        distance = self.distance(start.typing, end.typing)
+        if distance is None:
+            return None
+        for steps in range(distance if start != end else 0, max_steps + 1):
+            path = self._find(start, end, steps)
+            if path is not None or self.exhausted:
+                return path
+        return None
+
+    def distance(self, a: Typing, b: Typing) -> Optional[int]:
+        """
+        The least number of links between two typings, ignoring the typing/type limits.
+        """
+        graph = self._graph
+        target = graph.index[b]
+        frontier = {graph.index[a]}
+        seen = set(frontier)
+        distance = 0
+        while frontier:
+            if target in frontier:
+                return distance
+            frontier = {j for i in frontier for j in graph.neighbours[i] if j not in seen}
+            seen |= frontier
+            distance += 1
+        return None
+
+    #
+
+    def _find(self, start: Pokemon, end: Pokemon, steps: int) -> Optional[Tuple[Pokemon, ...]]:
+        if steps < 0:
+            return None
+        if steps == 0:
+            return (start,) if start == end and self._endpoints_allowed(start, end, steps) else None
+        if not self._endpoints_allowed(start, end, steps):
+            return None
+
+        graph = self._graph
+        layers = self._layers(end.typing, steps)
+        if graph.index[start.typing] not in layers[steps]:
+            return None
+
+        state = ChainState.of((end, start))
+        state = ChainState(1, start.typing, state.typing_counts, state.type_counts)
+        path = self._restarting_search(state, steps, end.typing, self.rules(steps), layers)
+        if path is None:
+            return None
+        return self._assign(start, end, path)
+
+    def _endpoints_allowed(self, start: Pokemon, end: Pokemon, steps: int) -> bool:
+        rules = self.rules(steps)
+        state = rules.start()
+        for pokemon in ((start, end) if steps > 0 else (start,)):
+            if not rules.allows(pokemon.typing, state):
+                return False
+            state = state.push(pokemon.typing)
+        return True
+
+    def _layers(self, end: Typing, steps: int) -> List[FrozenSet[int]]:
+        # layers[k] holds the typings that can reach the end typing in exactly k links.
+        graph = self._graph
+        layers = [frozenset((graph.index[end],))]
+        for _ in range(steps):
+            layers.append(frozenset(j for i in layers[-1] for j in graph.neighbours[i]))
+        return layers
+
+    def _restarting_search(self, state: ChainState, links: int, end: Typing, rules: Rules,
+                           layers: List[FrozenSet[int]]) -> Optional[List[int]]:
+        # Dead states are only recorded once fully explored, so they stay valid across restarts
+        dead: Dict[Hashable, bool] = dict()
+        restart = RESTART_EXPANSIONS
+        while True:
+            self._limit = min(self._expansions + restart, self._budget)
+            try:
+                return self._search(state, links, end, rules, layers, dead)
+            except _OutOfExpansions:
+                if self._expansions >= self._budget:
+                    self.exhausted = True
+                    return None
+                restart *= 2
+
+    def _search(self, state: ChainState, links: int, end: Typing, rules: Rules,
+                layers: List[FrozenSet[int]], dead: Dict[Hashable, bool]) -> Optional[List[int]]:
+        graph = self._graph
+        if links == 1:
+            return [] if graph.linked(state.last, end) else None
+
+        key = (graph.index[state.last], links,
+               frozenset(state.typing_counts.items()), frozenset(state.type_counts.items()))
+        if key in dead:
+            return None
+        self._expansions += 1
+        if self._expansions > self._limit:
+            raise _OutOfExpansions()
+        # Every link but the last, into the end Pokémon already counted, needs a type use still left
+        capacity = rules.link_capacity(state)
+        if capacity is not None and capacity < links - 1:
+            dead[key] = True
+            return None
+
+        layer = layers[links - 1]
+        candidates = [j for j in graph.neighbours[graph.index[state.last]]
+                      if j in layer and rules.allows(graph.typings[j], state)]
+        self._rand.shuffle(candidates)
+        for j in candidates:
+            path = self._search(state.push(graph.typings[j]), links - 1, end, rules, layers, dead)
+            if path is not None:
+                return [j] + path
+
+        dead[key] = True
+        return None
+
+    def _assign(self, start: Pokemon, end: Pokemon, path: List[int]) -> Tuple[Pokemon, ...]:
+        # Prefer Pokémon that aren't in the chain yet, so chains only repeat when the limits force them to.
+        used = {start, end}
+        middle = []
+        for j in path:
+            members = self._graph.members[j]
+            fresh = [p for p in members if p not in used]
+            pokemon = self._rand.choice(fresh if fresh else members)
+            used.add(pokemon)
+            middle.append(pokemon)
+        return (start,) + tuple(middle) + (end,)
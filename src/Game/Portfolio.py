@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from typing import Tuple, Optional, List, Callable
+from multiprocessing.connection import Connection, wait
+import multiprocessing
+import threading
+import os
+import time
+import random
+
+from Data import *
+from Game.Generate import Generator, NoSequenceError
+
+# Forked workers inherit the loaded dataset and every table built from it, instead of rebuilding them.  Forking
+# is only safe while no other thread can be holding a lock the child needs, so race() only forks while the
+# process is single-threaded.
+_CONTEXT = multiprocessing.get_context("fork")
+
+
+class RaceAbandoned(Exception):
+    """
+    Raised when a race is given up on before any worker found a chain, either because the process could not
+    safely fork, or because it timed out.  The caller should generate in-process instead.
+    """
+    pass
+
+
+class PortfolioResult:
+
+    def __init__(self, sequence: Tuple[Pokemon, ...], winner: int, seed: int, workers: int, elapsed: float):
+        self.sequence = sequence
+        self.winner = winner
+        self.seed = seed
+        self.workers = workers
+        self.elapsed = elapsed
+
+    def to_json(self) -> dict:
+        return {"winner": self.winner,
+                "seed": self.seed,
+                "workers": self.workers,
+                "elapsed_ms": round(self.elapsed * 1000, 2)}
+
+
+def default_workers() -> int:
+    return max(1, min(4, os.cpu_count() or 1))
+
+
+def race(data: PokemonMap,
+         make_generator: Callable[[int], Generator],
+         workers: int,
+         random_seed: Optional[int] = None,
+         timeout: Optional[float] = None) -> PortfolioResult:
+    """
+    Runs the same generation in several worker processes at once, each with its own seed, and returns the
+    first sequence found.  The other workers are then terminated.  How long a depth-first generation takes
+    depends heavily on the order it happens to try candidates in, so for strict parameters the fastest of
+    several seeds is far faster than a typical one.
+
+    Workers are plain processes reporting back through pipes, since Lambda provides neither /dev/shm nor
+    the semaphores that multiprocessing pools and queues rely on.  They are forked, so a race is abandoned
+    (see RaceAbandoned) if any other thread is running, e.g. a reservoir's that has not been paused.  If every
+    worker finds that there is no chain, a NoSequenceError is raised.
+
+    :param data: The dataset the generators use, to resolve the names the workers send back.
+    :param make_generator: Builds the generator for a worker, given its seed.
+    :param workers: The number of worker processes.
+    :param random_seed: Optional.  Derives the workers' seeds, so that a race is repeatable up to which worker
+    wins it.
+    :param timeout: Optional.  The number of seconds to wait for a result before abandoning the race.
+    """
+    if threading.active_count() > 1:
+        raise RaceAbandoned(f"Cannot fork workers while other threads are running ({threading.active_count() - 1}).")
+
+    seeder = random.Random(random_seed) if random_seed is not None else random.SystemRandom()
+    seeds = [seeder.randrange(2 ** 32) for _ in range(workers)]
+
+    start = time.perf_counter()
+    processes: List[multiprocessing.Process] = []
+    connections: List[Connection] = []
+    try:
+        for seed in seeds:
+            receiver, sender = _CONTEXT.Pipe(duplex=False)
+            process = _CONTEXT.Process(target=_work, args=(make_generator, seed, sender), daemon=True)
+            process.start()
+            sender.close()
+            processes.append(process)
+            connections.append(receiver)
+
+        pending = list(connections)
+        errors: List[str] = []
+        no_sequence: List[str] = []
+        while pending:
+            remaining = None if timeout is None else timeout - (time.perf_counter() - start)
+            if remaining is not None and remaining <= 0:
+                break
+            ready = wait(pending, timeout=remaining)
+            if not ready:
+                break
+            for connection in ready:
+                pending.remove(connection)
+                try:
+                    names, error, found_none = connection.recv()
+                except EOFError:
+                    errors.append("Worker exited without a result.")
+                    continue
+                if error is not None:
+                    (no_sequence if found_none else errors).append(error)
+                    continue
+                winner = connections.index(connection)
+                return PortfolioResult(tuple(data.name(name) for name in names), winner, seeds[winner], workers,
+                                       time.perf_counter() - start)
+
+        if pending:
+            raise RaceAbandoned(f"Timed out after {timeout:g}s before any worker generated a sequence.")
+        if errors:
+            raise Exception(errors[0])
+        raise NoSequenceError(no_sequence[0])
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        for process in processes:
+            process.join()
+        for connection in connections:
+            connection.close()
+
+
+def _work(make_generator: Callable[[int], Generator], seed: int, sender: Connection):
+    try:
+        sequence = make_generator(seed).generate()
+        sender.send(([p.name for p in sequence], None, False))
+    except NoSequenceError as e:
+        sender.send((None, str(e), True))
+    except Exception as e:
+        sender.send((None, str(e), False))
+    finally:
+        sender.close()
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+from typing import Tuple, Optional, List, Dict, FrozenSet
+import random
+
+from Data import *
+from Game.Rules import Rules, ChainState
+from Game.Solver import FeasibilityCache
+from Game.TypingGraph import TypingGraph
+
+# Counting stops here: all a puzzle needs to know is whether it has none, one or several solutions
+CAP = 2
+
+
+class SolutionCounter:
+    """
+    Counts the ways to fill in the middle of a chain between fixed endpoints, up to CAP.  Solutions are
+    counted at the level of typings: any Pokémon of the right typing fills a slot, so two solutions only
+    differ if their typings do.
+
+    As in PathFinder, the endpoints are counted into the constraint state up front, and the search only
+    steps onto typings that can still reach the end in the links left.  Counts are memoized, capped, under
+    a canonical form of the state that includes the end typing, in a cache shared by every counter over the
+    same typing graph, so sub-results carry over between the candidate puzzles a generator tries.
+    """
+
+    def __init__(self, data: PokemonMap, rules: Rules, cache: Optional[FeasibilityCache] = None):
+        self._graph = TypingGraph.of(data)
+        self._rules = rules
+        self._cache = cache if cache is not None else SolutionCounter.cache_of(self._graph)
+        self._layers: Dict[int, List[FrozenSet[int]]] = dict()
+
+    @staticmethod
+    def cache_of(graph: TypingGraph) -> FeasibilityCache:
+        # Holds capped counts rather than feasibility, so it is kept apart from the solvers' cache
+        return graph.data.table(SolutionCounter, FeasibilityCache)
+
+    @property
+    def links(self) -> int:
+        return self._rules.length - 1
+
+    #
+
+    def count(self, start: Typing, end: Typing) -> int:
+        """
+        The number of ways to fill in the middle of a chain of the rules' length from start to end, up to CAP.
+        """
+        state = self._start(start, end)
+        if state is None:
+            return 0
+        return self._count(state, self.links, self._graph.index[end])
+
+    def solution(self, start: Typing, end: Typing) -> Optional[Tuple[Typing, ...]]:
+        """
+        The typings of the middle of the only chain from start to end, or None unless there is exactly one.
+        """
+        if self.count(start, end) != 1:
+            return None
+        graph = self._graph
+        end_index = graph.index[end]
+        state = self._start(start, end)
+        middle = []
+        for links in range(self.links, 1, -1):
+            # The only candidate with a solution below it is the next typing of the solution
+            for j in self._candidates(state, links, end_index):
+                child = state.push(graph.typings[j])
+                if self._count(child, links - 1, end_index) > 0:
+                    middle.append(graph.typings[j])
+                    state = child
+                    break
+        return tuple(middle)
+
+    #
+
+    def _start(self, start: Typing, end: Typing) -> Optional[ChainState]:
+        state = self._rules.start()
+        for typing in (start, end):
+            if not self._rules.allows(typing, state):
+                return None
+            state = state.push(typing)
+        return ChainState(1, start, state.typing_counts, state.type_counts)
+
+    def _count(self, state: ChainState, links: int, end: int) -> int:
+        graph = self._graph
+        if links == 1:
+            return 1 if end in graph.adjacency[graph.index[state.last]] else 0
+
+        key = self._key(state, links, end)
+        known = self._cache.get(key)
+        if known is not None:
+            return known
+        total = 0
+        for j in self._candidates(state, links, end):
+            total += self._count(state.push(graph.typings[j]), links - 1, end)
+            if total >= CAP:
+                total = CAP
+                break
+        self._cache.put(key, total)
+        return total
+
+    def _candidates(self, state: ChainState, links: int, end: int) -> List[int]:
+        graph = self._graph
+        layer = self._layer(end, links - 1)
+        return [j for j in graph.neighbours[graph.index[state.last]]
+                if j in layer and self._rules.allows(graph.typings[j], state)]
+
+    def _layer(self, end: int, links: int) -> FrozenSet[int]:
+        # layers[k] holds the typings that can reach the end typing in exactly k links.
+        layers = self._layers.setdefault(end, [frozenset((end,))])
+        while len(layers) <= links:
+            layers.append(frozenset(j for i in layers[-1] for j in self._graph.neighbours[i]))
+        return layers[links]
+
+    def _key(self, state: ChainState, links: int, end: int):
+        rules = self._rules
+        graph = self._graph
+        return (graph.index[state.last], links, end,
+                (rules.typing_limit, rules.type_limit, rules.allow_monotype),
+                frozenset((graph.index[t], c) for t, c in state.typing_counts.items())
+                if rules.typing_limit > 0 else frozenset(),
+                frozenset(state.type_counts.items()) if rules.type_limit > 0 else frozenset())
+
+
+class Puzzle:
+    """
+    A "fill in the middle" puzzle: the first and last Pokémon of a chain are shown, and the player has to
+    find the rest.  Any Pokémon of the typing in each hidden slot is a correct answer.
+    """
+
+    def __init__(self, sequence: Tuple[Pokemon, ...], middle: Tuple[Typing, ...], attempts: int):
+        self.sequence = sequence
+        self.middle = middle
+        self.attempts = attempts
+
+    @property
+    def start(self) -> Pokemon:
+        return self.sequence[0]
+
+    @property
+    def end(self) -> Pokemon:
+        return self.sequence[-1]
+
+
+class PuzzleGenerator:
+    """
+    Generates puzzles with exactly one solution, by drawing random pairs of endpoint typings until the
+    SolutionCounter finds a pair with a single way to fill in the middle.
+
+    The typing graph is dense, so unique solutions are common with one hidden Pokémon, but become rare, or
+    don't exist at all, with more: with the default limits, no pair of typings has a unique 2-Pokémon middle.
+    The budget bounds how many pairs are tried before giving up.
+    """
+
+    def __init__(self, data: PokemonMap, rules: Rules,
+                 random_seed: Optional[int] = None,
+                 budget: Optional[int] = None):
+        if rules.length < 3:
+            raise Exception("Invalid puzzle length")
+        self._graph = TypingGraph.of(data)
+        self._counter = SolutionCounter(data, rules)
+        self._rand = random.Random() if random_seed is None else random.Random(random_seed)
+        self._budget = budget if budget is not None else len(self._graph) ** 2
+
+    def generate(self) -> Optional[Puzzle]:
+        """
+        Returns a puzzle with a unique solution, or None if none was found within the budget of attempts.
+        """
+        graph = self._graph
+        for attempt in range(1, self._budget + 1):
+            start, end = self._rand.choice(graph.typings), self._rand.choice(graph.typings)
+            middle = self._counter.solution(start, end)
+            if middle is not None:
+                return Puzzle(self._assign(start, middle, end), middle, attempt)
+        return None
+
+    def _assign(self, start: Typing, middle: Tuple[Typing, ...], end: Typing) -> Tuple[Pokemon, ...]:
+        # Prefer Pokémon that aren't in the chain yet, as PathFinder does
+        used = set()
+        sequence = []
+        for typing in (start,) + middle + (end,):
+            members = self._graph.members[self._graph.index[typing]]
+            fresh = [p for p in members if p not in used]
+            pokemon = self._rand.choice(fresh if fresh else members)
+            used.add(pokemon)
+            sequence.append(pokemon)
+        return tuple(sequence)
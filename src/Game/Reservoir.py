@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+from typing import Tuple, Dict, List, Optional, Iterable, Iterator, Deque
+from collections import deque
+from contextlib import contextmanager
+import threading
+import weakref
+import random
+import time
+import json
+
+from Data import *
+from Game.Generate import Generator, NoSequenceError
+from Game.Rules import Rules
+
+DEFAULT_CAPACITY = 64
+# Rules whose generation failed unexpectedly are retried after this many seconds, doubling with every
+# consecutive failure up to the maximum
+RETRY_DELAY = 1.0
+MAX_RETRY_DELAY = 300.0
+# Seconds to wait, when pausing reservoirs, for a background thread to finish the chain it is generating
+STOP_TIMEOUT = 1.0
+
+# Reservoirs whose background thread is meant to be running, so that they can all be paused at once
+_running: weakref.WeakSet[ChainReservoir] = weakref.WeakSet()
+
+
+class ChainReservoir:
+    """
+    Keeps a queue of ready-made chains for each of a set of popular rules, so that requests for a chain
+    under them, without a seed or any other criteria, are served by popping from a queue instead of running a
+    search.  The queues are topped back up to capacity by a background thread.
+
+    On Lambda, the container is frozen between invocations, so the thread only runs while it is thawed:
+    during the invocation that took a chain, and for whatever time is left after the response is sent.  It
+    never blocks a request, which is served from a queue if it has a chain, and generated directly otherwise.
+
+    A reservoir can be saved to, and seeded from, a pool file, so that new containers start with full queues.
+    """
+
+    def __init__(self, data: PokemonMap, rules: Iterable[Rules], capacity: int = DEFAULT_CAPACITY):
+        self._data = data
+        self.capacity = capacity
+        self._queues: Dict[Rules, Deque[Tuple[Pokemon, ...]]] = {r: deque() for r in rules}
+        # Rules found to have no valid chains at all, which are no longer topped up
+        self._exhausted: Dict[Rules, str] = dict()
+        # Rules whose last generation failed for any other reason, with their failure count and when to retry
+        self._failures: Dict[Rules, Tuple[int, float]] = dict()
+        self._lock = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+    def __contains__(self, rules: Rules) -> bool:
+        return rules in self._queues
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(q) for q in self._queues.values())
+
+    def sizes(self) -> Dict[Rules, int]:
+        with self._lock:
+            return {r: len(q) for r, q in self._queues.items()}
+
+    #
+
+    def take(self, rules: Rules) -> Optional[Tuple[Pokemon, ...]]:
+        """
+        Pops a ready-made chain for the given rules, or returns None if the rules aren't reserved or their queue
+        is empty.  Either way, the background thread is woken to top the queue back up.
+        """
+        with self._lock:
+            queue = self._queues.get(rules)
+            if queue is None:
+                return None
+            chain = queue.popleft() if queue else None
+            self._lock.notify()
+            return chain
+
+    def fill(self, rules: Optional[Rules] = None) -> int:
+        """
+        Tops up the queue of the given rules, or of all of them, to capacity, in the calling thread.
+
+        :return: The number of chains generated.
+        """
+        added = 0
+        for r in ([rules] if rules is not None else list(self._queues)):
+            while r not in self._exhausted and self.sizes()[r] < self.capacity:
+                # Failures are left to the background thread to retry
+                if not self._top_up(r):
+                    break
+                added += 1
+        return added
+
+    def start(self) -> None:
+        """
+        Starts the background thread that keeps the queues topped up, if it isn't already running.
+        """
+        with self._lock:
+            _running.add(self)
+            # A thread that was stopped, but is still finishing a chain, just carries on
+            self._stopped = False
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, name="chain-reservoir", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        with self._lock:
+            _running.discard(self)
+            self._stopped = True
+            self._lock.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    @staticmethod
+    @contextmanager
+    def paused(timeout: float = STOP_TIMEOUT) -> Iterator[None]:
+        """
+        Stops the background thread of every running reservoir for the duration of the block, and restarts them
+        afterwards, e.g. so that the process can fork without a thread that might be holding a lock the child
+        needs.  A thread still generating a chain once the timeout has run out is left to finish it.
+        """
+        reservoirs = list(_running)
+        for reservoir in reservoirs:
+            reservoir.stop(timeout)
+        try:
+            yield
+        finally:
+            for reservoir in reservoirs:
+                reservoir.start()
+
+    #
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                rules, wait = self._wanted()
+                while rules is None and not self._stopped:
+                    self._lock.wait(wait)
+                    rules, wait = self._wanted()
+                if self._stopped:
+                    return
+            self._top_up(rules)
+
+    def _wanted(self) -> Tuple[Optional[Rules], Optional[float]]:
+        # The emptiest queue is topped up first, since it is the likeliest to run out.  Rules waiting out a
+        # retry delay are skipped, and if nothing else is wanted, the time until the earliest retry is returned.
+        now = time.monotonic()
+        wanted = []
+        retries = []
+        for i, (r, q) in enumerate(self._queues.items()):
+            if len(q) >= self.capacity or r in self._exhausted:
+                continue
+            retry_at = self._failures[r][1] if r in self._failures else now
+            if retry_at > now:
+                retries.append(retry_at - now)
+            else:
+                wanted.append((len(q), i, r))
+        if wanted:
+            return min(wanted)[2], None
+        return None, min(retries) if retries else None
+
+    def _top_up(self, rules: Rules) -> bool:
+        # Generation runs outside the lock, so that requests can keep taking chains in the meantime
+        try:
+            chain = Generator(self._data,
+                              length=rules.length,
+                              typing_limit=rules.typing_limit,
+                              type_limit=rules.type_limit,
+                              allow_monotype=rules.allow_monotype).generate()
+        except NoSequenceError as e:
+            # Unseeded generation searches exhaustively, so the rules have no valid chains at all
+            with self._lock:
+                self._exhausted[rules] = str(e)
+                self._failures.pop(rules, None)
+            return False
+        except Exception as e:
+            with self._lock:
+                failures = self._failures[rules][0] + 1 if rules in self._failures else 1
+                delay = min(RETRY_DELAY * 2 ** (failures - 1), MAX_RETRY_DELAY)
+                self._failures[rules] = (failures, time.monotonic() + delay)
+            print(f"RESERVOIR: Failed to generate a chain for {rules}, retrying in {delay:g}s: {e!r}")
+            return False
+        with self._lock:
+            self._queues[rules].append(chain)
+            self._failures.pop(rules, None)
+        return True
+
+    #
+
+    def save(self, path: str) -> None:
+        """
+        Writes the queued chains to a pool file, as JSON Lines of {"rules": [...], "seq": [...]} objects.
+        """
+        with self._lock:
+            lines = [json.dumps({"rules": list(r.key()), "seq": [p.name for p in chain]})
+                     for r, q in self._queues.items() for chain in q]
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("".join(line + "\n" for line in lines))
+
+    @staticmethod
+    def load(data: PokemonMap, path: str, rules: Iterable[Rules],
+             capacity: int = DEFAULT_CAPACITY) -> ChainReservoir:
+        """
+        Creates a reservoir for the given rules, seeded with the chains in a pool file.  Chains for other rules,
+        or naming Pokémon that are no longer in the dataset, are skipped.  Every container loads the same file,
+        so the chains are shuffled, lest they all serve them in the same order.
+        """
+        reservoir = ChainReservoir(data, rules, capacity=capacity)
+        loaded: Dict[Rules, List[Tuple[Pokemon, ...]]] = {r: [] for r in reservoir._queues}
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                item = json.loads(line)
+                key = Rules(*item["rules"])
+                chain = tuple(data.name(name) for name in item["seq"])
+                if key in loaded and all(p is not None for p in chain):
+                    loaded[key].append(chain)
+        shuffler = random.SystemRandom()
+        for r, chains in loaded.items():
+            shuffler.shuffle(chains)
+            reservoir._queues[r].extend(chains)
+        return reservoir
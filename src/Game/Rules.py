@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from typing import Dict, Optional, Iterable, Tuple
+
+from Data import *
+
+TOO_LONG = "TOO_LONG"
+MONOTYPE = "MONOTYPE_NOT_ALLOWED"
+TYPING_LIMIT = "TYPING_LIMIT"
+TYPE_LIMIT = "TYPE_LIMIT"
+
+
+class Rules:
+    """
+    The constraints a chain must satisfy.  Every constraint depends only on the typing of the candidate
+    and the typings already in the chain, so a rule check can be answered from a ChainState without
+    looking at the chain itself.  The constraints are defined once, in _limit_violation, which backs both
+    violation() and allows(), and through them every generator, solver and validator.
+    """
+
+    def __init__(self, length: int, typing_limit: int, type_limit: int, allow_monotype: bool):
+        self.length = length
+        self.typing_limit = typing_limit
+        self.type_limit = type_limit
+        self.allow_monotype = allow_monotype
+
+    def key(self) -> Tuple[int, int, int, bool]:
+        return self.length, self.typing_limit, self.type_limit, self.allow_monotype
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Rules) and self.key() == other.key()
+
+    def __hash__(self) -> int:
+        return hash(self.key())
+
+    def __repr__(self) -> str:
+        return f"Rules(length={self.length}, typing_limit={self.typing_limit}, " \
+               f"type_limit={self.type_limit}, allow_monotype={self.allow_monotype})"
+
+    #
+
+    def start(self) -> ChainState:
+        return ChainState()
+
+    def violation(self, typing: Typing, state: ChainState) -> Optional[str]:
+        """
+        Returns the name of the first constraint that a Pokémon of the given typing would break if appended
+        to a chain in the given state, or None if it may be appended.  Link validity is not checked here.
+        """
+        if state.length >= self.length:
+            return TOO_LONG
+        return self._limit_violation(typing, state)
+
+    def link_capacity(self, state: ChainState) -> Optional[int]:
+        """
+        An upper bound on how many more links a chain in the given state can gain, or None if the rules
+        don't bound it.  Every link needs a type shared by two consecutive Pokémon, and a type that may
+        appear k times can only be shared by k - 1 consecutive pairs, so the remaining type uses bound
+        the remaining links.
+        """
+        if self.type_limit <= 0:
+            return None
+        capacity = 0
+        for pokemon_type in PokemonType:
+            left = self.type_limit - state.type_counts.get(pokemon_type, 0)
+            if state.last is None or pokemon_type not in state.last:
+                left -= 1
+            capacity += max(left, 0)
+        return capacity
+
+    def allows(self, typing: Typing, state: ChainState) -> bool:
+        """
+        Whether a Pokémon of the given typing may be appended to a chain in the given state, as far as the
+        typing/type limits go.  Unlike violation(), the chain's length is left to the caller.
+        """
+        return self._limit_violation(typing, state) is None
+
+    def _limit_violation(self, typing: Typing, state: ChainState) -> Optional[str]:
+        if not self.allow_monotype and len(typing) == 1:
+            return MONOTYPE
+        if 0 < self.typing_limit <= state.typing_counts.get(typing, 0):
+            return TYPING_LIMIT
+        if self.type_limit > 0:
+            for pokemon_type in typing:
+                if state.type_counts.get(pokemon_type, 0) >= self.type_limit:
+                    return TYPE_LIMIT
+        return None
+
+
+class ChainState:
+    """
+    The incremental constraint state of a partial chain: its length, the typing of its last member,
+    and how many times each typing and type has been used so far.  States are immutable; push()
+    returns a new state, so they can be shared freely between branches of a search.
+    """
+
+    __slots__ = ("length", "last", "typing_counts", "type_counts")
+
+    def __init__(self, length: int = 0,
+                 last: Optional[Typing] = None,
+                 typing_counts: Optional[Dict[Typing, int]] = None,
+                 type_counts: Optional[Dict[PokemonType, int]] = None):
+        self.length = length
+        self.last = last
+        self.typing_counts: Dict[Typing, int] = typing_counts if typing_counts is not None else dict()
+        self.type_counts: Dict[PokemonType, int] = type_counts if type_counts is not None else dict()
+
+    def push(self, typing: Typing) -> ChainState:
+        typing_counts = dict(self.typing_counts)
+        typing_counts[typing] = typing_counts.get(typing, 0) + 1
+        type_counts = dict(self.type_counts)
+        for t in typing:
+            type_counts[t] = type_counts.get(t, 0) + 1
+        return ChainState(self.length + 1, typing, typing_counts, type_counts)
+
+    @staticmethod
+    def of(sequence: Iterable[Pokemon]) -> ChainState:
+        state = ChainState()
+        for pokemon in sequence:
+            state = state.push(pokemon.typing)
+        return state
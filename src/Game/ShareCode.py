@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from typing import Tuple, Dict, List, Sequence, Iterable
+import hashlib
+
+from Data import *
+
+# URL-safe base64 digits; two of them encode any row id below 4096
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+VERSION = "A"
+ID_WIDTH = 2
+# Four digits (24 bits), so that only about 1 in 16.7 million codes made for another dataset still decodes
+CHECKSUM_WIDTH = 4
+HEADER_WIDTH = 1 + CHECKSUM_WIDTH  # version, then dataset checksum
+
+_CAPACITY = len(ALPHABET) ** ID_WIDTH
+
+
+class ShareCodec:
+    """
+    Encodes chains as compact, URL-safe share codes, and back.  A code is a version digit, four digits of
+    checksum of the dataset, then two digits per Pokémon for its row id in the dataset.  For example, a
+    5-Pokémon chain takes 15 characters.  Codes only decode against the dataset they were made with, so a
+    code made before the dataset changed is rejected rather than decoded into different Pokémon, barring a
+    24-bit checksum collision.
+
+    Every row id's digits are precomputed, as is the reverse mapping, so encoding and decoding a chain are
+    a table lookup per Pokémon.
+    """
+
+    def __init__(self, data: PokemonMap):
+        rows = data.rows
+        if len(rows) > _CAPACITY:
+            raise Exception(f"Too many Pokémon to encode in {ID_WIDTH} digits: {len(rows)}")
+        self.checksum = ShareCodec.dataset_checksum(rows)
+        self._header = VERSION + self.checksum
+        self._digits: Dict[Pokemon, str] = {p: _digits(i) for i, p in enumerate(rows)}
+        self._pokemon: Dict[str, Pokemon] = {d: p for p, d in self._digits.items()}
+
+    @staticmethod
+    def dataset_checksum(rows: Sequence[Pokemon]) -> str:
+        digest = hashlib.sha256("\n".join(p.name for p in rows).encode("utf-8")).digest()
+        return _digits(int.from_bytes(digest[:4], "big") % len(ALPHABET) ** CHECKSUM_WIDTH, CHECKSUM_WIDTH)
+
+    @staticmethod
+    def of(data: PokemonMap) -> ShareCodec:
+        return data.table(ShareCodec, lambda: ShareCodec(data))
+
+    #
+
+    def encode(self, chain: Iterable[Pokemon]) -> str:
+        digits = self._digits
+        return self._header + "".join([digits[p] for p in chain])
+
+    def decode(self, code: str) -> Tuple[Pokemon, ...]:
+        """
+        Decodes a share code, raising a ValueError if it is malformed or was made for a different dataset.
+        """
+        code = code.strip()
+        if len(code) < HEADER_WIDTH or (len(code) - HEADER_WIDTH) % ID_WIDTH != 0:
+            raise ValueError("Malformed share code.")
+        if code[0] != VERSION:
+            raise ValueError(f"Unsupported share code version: {code[0]}")
+        if code[1:HEADER_WIDTH] != self.checksum:
+            raise ValueError("Share code was made for a different dataset.")
+        pokemon = self._pokemon
+        try:
+            return tuple([pokemon[code[i:i + ID_WIDTH]] for i in range(HEADER_WIDTH, len(code), ID_WIDTH)])
+        except KeyError:
+            raise ValueError("Share code names an unknown Pokémon.")
+
+    def encode_many(self, chains: Iterable[Iterable[Pokemon]]) -> List[str]:
+        header, digits = self._header, self._digits
+        return [header + "".join([digits[p] for p in chain]) for chain in chains]
+
+    def decode_many(self, codes: Iterable[str]) -> List[Tuple[Pokemon, ...]]:
+        """
+        Decodes a batch of share codes, raising a ValueError on the first one that is invalid (see decode).
+        """
+        return [self.decode(code) for code in codes]
+
+
+def _digits(value: int, width: int = ID_WIDTH) -> str:
+    digits = []
+    for _ in range(width):
+        value, digit = divmod(value, len(ALPHABET))
+        digits.append(ALPHABET[digit])
+    return "".join(reversed(digits))
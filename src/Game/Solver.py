@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from typing import Tuple, Optional, Sequence, Hashable, FrozenSet, List
+from collections import OrderedDict
+from threading import Lock
+import random
+
+from Data import *
+from Game.Rules import Rules, ChainState
+from Game.TypingGraph import TypingGraph
+
+CACHE_SIZE = 200000
+
+
+class FeasibilityCache:
+    """
+    A bounded, thread-safe LRU map from canonical chain states to whether they can be completed.
+    """
+
+    def __init__(self, maxsize: int = CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[bool]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: bool) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    @staticmethod
+    def of(graph: TypingGraph) -> FeasibilityCache:
+        """
+        Returns the cache shared by every solver over the given typing graph.  It lives as long as the
+        graph's dataset does, so states that are popular across requests are answered from memory.
+        """
+        return graph.data.table(FeasibilityCache, FeasibilityCache)
+
+
+class Solver:
+    """
+    Answers whether a partial chain can still be completed to the rules' length, and produces one such
+    completion.  The search runs over typings rather than Pokémon, since the constraints only depend on
+    typings, and its results are memoized in a FeasibilityCache under a canonical form of the chain
+    state: the last typing, the remaining length and the typing/type counts, with counts the rules do
+    not limit left out.
+    """
+
+    def __init__(self, data: PokemonMap, rules: Rules,
+                 random_seed: Optional[int] = None,
+                 cache: Optional[FeasibilityCache] = None):
+        self._graph = TypingGraph.of(data)
+        self._rules = rules
+        self._rand = random.Random() if random_seed is None else random.Random(random_seed)
+        self._cache = cache if cache is not None else FeasibilityCache.of(self._graph)
+
+    @property
+    def cache(self) -> FeasibilityCache:
+        return self._cache
+
+    #
+
+    def can_complete(self, prefix: Sequence[Pokemon]) -> bool:
+        state = ChainState.of(prefix)
+        return state.length <= self._rules.length and self.feasible(state)
+
+    def complete(self, prefix: Sequence[Pokemon]) -> Optional[Tuple[Pokemon, ...]]:
+        """
+        Returns a random valid completion of the given (valid) prefix, including the prefix itself, or
+        None if it cannot be completed.
+        """
+        if not self.can_complete(prefix):
+            return None
+        state = ChainState.of(prefix)
+        sequence = tuple(prefix)
+        while state.length < self._rules.length:
+            candidates = self._candidates(state)
+            self._rand.shuffle(candidates)
+            for j in candidates:
+                child = state.push(self._graph.typings[j])
+                if self.feasible(child):
+                    state = child
+                    sequence += (self._rand.choice(self._graph.members[j]),)
+                    break
+            else:
+                return None
+        return sequence
+
+    #
+
+    def key(self, state: ChainState) -> Tuple[Optional[int], int, Tuple[int, int, bool],
+                                              FrozenSet[Tuple[int, int]], FrozenSet[Tuple[PokemonType, int]]]:
+        rules = self._rules
+        return (self._graph.index[state.last] if state.last is not None else None,
+                rules.length - state.length,
+                (rules.typing_limit, rules.type_limit, rules.allow_monotype),
+                frozenset((self._graph.index[t], c) for t, c in state.typing_counts.items())
+                if rules.typing_limit > 0 else frozenset(),
+                frozenset(state.type_counts.items()) if rules.type_limit > 0 else frozenset())
+
+    def feasible(self, state: ChainState) -> bool:
+        """
+        Whether a chain in the given state can be extended to the rules' length.
+        """
+        if state.length >= self._rules.length:
+            return True
+        if not self._has_capacity(state):
+            return False
+        key = self.key(state)
+        known = self._cache.get(key)
+        if known is not None:
+            return known
+        feasible = any(self.feasible(state.push(self._graph.typings[j])) for j in self._candidates(state))
+        self._cache.put(key, feasible)
+        return feasible
+
+    def _has_capacity(self, state: ChainState) -> bool:
+        capacity = self._rules.link_capacity(state)
+        return capacity is None or self._rules.length - max(state.length, 1) <= capacity
+
+    def _candidates(self, state: ChainState) -> List[int]:
+        graph = self._graph
+        candidates = range(len(graph)) if state.last is None else graph.neighbours[graph.index[state.last]]
+        return [j for j in candidates if self._rules.allows(graph.typings[j], state)]
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from typing import Tuple, Dict, FrozenSet
+
+from Data import *
+
+
+class TypingGraph:
+    """
+    A view of a PokemonMap at the level of typings.  Two typings are adjacent when they share at
+    least one type, which is the link rule of the game, and every Pokémon of a typing is
+    interchangeable as far as the chain constraints are concerned.  Typings are given dense,
+    deterministic indices (sorted by type names), and members are sorted by name.
+    """
+
+    def __init__(self, data: PokemonMap):
+        self.data = data
+        self.typings: Tuple[Typing, ...] = tuple(sorted(data.typing_map.keys(),
+                                                        key=lambda t: tuple(x.name for x in t)))
+        self.index: Dict[Typing, int] = {t: i for i, t in enumerate(self.typings)}
+        self.members: Tuple[Tuple[Pokemon, ...], ...] = tuple(tuple(sorted(data.typing_map[t], key=lambda p: p.name))
+                                                              for t in self.typings)
+        self.neighbours: Tuple[Tuple[int, ...], ...] = tuple(
+            tuple(j for j, other in enumerate(self.typings) if any(x in other for x in typing))
+            for typing in self.typings
+        )
+        self.adjacency: Tuple[FrozenSet[int], ...] = tuple(frozenset(n) for n in self.neighbours)
+
+    def __len__(self) -> int:
+        return len(self.typings)
+
+    def linked(self, a: Typing, b: Typing) -> bool:
+        return self.index[b] in self.adjacency[self.index[a]]
+
+    @staticmethod
+    def of(data: PokemonMap) -> TypingGraph:
+        """
+        Returns the (cached) typing graph for the given dataset, so it is only built once per container.
+        """
+        return data.table(TypingGraph, lambda: TypingGraph(data))
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from typing import List, Optional, Sequence
+
+from Data import *
+from Interfaces import JSONable
+from Game.Rules import Rules, ChainState
+from Game.TypingGraph import TypingGraph
+from Game.Difficulty import BranchingTable
+from Game.Lookup import NameIndex
+
+UNKNOWN_NAME = "UNKNOWN_NAME"
+NO_SHARED_TYPE = "NO_SHARED_TYPE"
+
+
+class ValidationResult(JSONable):
+
+    def __init__(self, chain: List[Pokemon],
+                 state: ChainState,
+                 error_index: Optional[int] = None,
+                 reason: Optional[str] = None,
+                 move_count: Optional[int] = None,
+                 moves: Optional[List[Pokemon]] = None):
+        self.chain = chain
+        self.state = state
+        self.error_index = error_index
+        self.reason = reason
+        self.move_count = move_count
+        self.moves = moves
+
+    @property
+    def valid(self) -> bool:
+        return self.reason is None
+
+    def to_json(self) -> dict:
+        result = {"valid": self.valid,
+                  "seq": [p.name for p in self.chain]}
+        if not self.valid:
+            result["error_index"] = self.error_index
+            result["reason"] = self.reason
+        if self.move_count is not None:
+            result["move_count"] = self.move_count
+        if self.moves is not None:
+            result["moves"] = [p.name for p in self.moves]
+        return result
+
+
+def validate(data: PokemonMap, rules: Rules, names: Sequence[str],
+             count_moves: bool = True,
+             list_moves: bool = False) -> ValidationResult:
+    """
+    Checks a partial chain against the rules in a single pass, carrying a ChainState forward so each link
+    is checked in constant time.  Names are resolved through PokemonMap.name_map, ignoring case and
+    surrounding whitespace.  The returned result records the valid prefix, and for a valid chain, the
+    number (and optionally the list) of legal next moves.
+
+    :param data: The dataset to resolve names against.
+    :param rules: The constraints the chain must satisfy.
+    :param names: The names of the Pokémon in the chain, in order.
+    :param count_moves: Whether to count the legal next moves of a valid chain.
+    :param list_moves: Whether to list the legal next moves of a valid chain.
+    :return: The result of the validation.
+    """
+    graph = TypingGraph.of(data)
+    index = NameIndex.of(data)
+    state = rules.start()
+    chain: List[Pokemon] = []
+
+    for i, name in enumerate(names):
+        # Names are matched exactly first, then leniently, ignoring spacing, punctuation and accents
+        pokemon = data.name_map.get(name.strip().upper()) or index.exact(name)
+        if pokemon is None:
+            return ValidationResult(chain, state, i, UNKNOWN_NAME)
+        if state.last is not None and not graph.linked(state.last, pokemon.typing):
+            return ValidationResult(chain, state, i, NO_SHARED_TYPE)
+        reason = rules.violation(pokemon.typing, state)
+        if reason is not None:
+            return ValidationResult(chain, state, i, reason)
+        chain.append(pokemon)
+        state = state.push(pokemon.typing)
+
+    result = ValidationResult(chain, state)
+    if list_moves:
+        result.moves = legal_moves(graph, rules, state)
+        result.move_count = len(result.moves)
+    elif count_moves:
+        result.move_count = 0 if state.length >= rules.length else BranchingTable.of(data).alternatives(rules, state)
+    return result
+
+
+def legal_moves(graph: TypingGraph, rules: Rules, state: ChainState) -> List[Pokemon]:
+    if state.length >= rules.length:
+        return []
+    candidates = range(len(graph)) if state.last is None else graph.neighbours[graph.index[state.last]]
+    return [p for j in candidates if rules.allows(graph.typings[j], state) for p in graph.members[j]]
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from typing import Tuple, Dict, List, Sequence, Iterator, Callable, Generic, TypeVar
+import random
+
+from Data import *
+from Game.TypingGraph import TypingGraph
+
+T = TypeVar('T')
+
+# Repeated or rejected draws an alias table takes before ordering the rest of its items in one go
+MAX_MISSES = 8
+
+
+class AliasTable(Generic[T]):
+    """
+    A Vose alias table over weighted items, from which an item can be drawn in O(1): pick a column uniformly,
+    then either its own item or its alias, by the column's probability.  Built in O(n).  All randomness comes
+    from the Random passed in, so draws are reproducible under a fixed seed, given the items in a fixed order.
+    """
+
+    def __init__(self, items: Sequence[T], weights: Sequence[float]):
+        n = len(items)
+        if n == 0 or n != len(weights):
+            raise Exception("An alias table needs one weight per item, and at least one item.")
+        self.items: Tuple[T, ...] = tuple(items)
+        self.weights: Tuple[float, ...] = tuple(weights)
+        self._probability: List[float] = [1.0] * n
+        self._alias: List[int] = list(range(n))
+
+        total = sum(weights)
+        scaled = [w * n / total for w in weights]
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self._probability[s] = scaled[s]
+            self._alias[s] = l
+            scaled[l] = scaled[l] + scaled[s] - 1.0
+            (small if scaled[l] < 1.0 else large).append(l)
+        # Whatever is left over only differs from 1 by rounding error, and keeps its own column.
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def draw(self, rand: random.Random) -> int:
+        """
+        Draws the index of an item, with probability proportional to its weight.
+        """
+        x = rand.random() * len(self.items)
+        column = int(x)
+        return column if x - column < self._probability[column] else self._alias[column]
+
+    def order(self, rand: random.Random, accept: Callable[[T], bool]) -> Iterator[T]:
+        """
+        Lazily yields the accepted items in a weighted random order, as if drawing without replacement.  Items
+        are drawn from the table and redrawn when already seen, which is O(1) per item for as long as most
+        draws are fresh and accepted.  A search usually stops after the first few items, so it rarely pays
+        for more.  Once the draws stop paying off, i.e. after a few repeats or rejections, the rest are
+        filtered in one pass, and only the accepted ones are ordered by weighted random keys, so that
+        exhausting a table of mostly rejected items costs little more than filtering it.
+        """
+        seen = set()
+        misses = 0
+        limit = min(MAX_MISSES, len(self.items))
+        while misses < limit:
+            i = self.draw(rand)
+            if i in seen:
+                misses += 1
+                continue
+            seen.add(i)
+            if accept(self.items[i]):
+                yield self.items[i]
+            else:
+                misses += 1
+
+        rest = [i for i in range(len(self.items)) if i not in seen and accept(self.items[i])]
+        keys = {i: rand.random() ** (1.0 / self.weights[i]) for i in rest}
+        for i in sorted(rest, key=lambda i: keys[i], reverse=True):
+            yield self.items[i]
+
+
+class WeightTables:
+    """
+    Alias tables for every choice a generator makes: one over all Pokémon, for the start of a chain, one per
+    typing over the Pokémon that can follow it, and one per typing over its own members.  Members are taken
+    in name order, so that seeded draws don't depend on set iteration order.
+    """
+
+    def __init__(self, graph: TypingGraph):
+        self.graph = graph
+        everyone = sorted(graph.data, key=lambda p: p.name)
+        self.start: AliasTable[Pokemon] = AliasTable(everyone, [p.weight for p in everyone])
+        self.members: Tuple[AliasTable[Pokemon], ...] = tuple(AliasTable(m, [p.weight for p in m])
+                                                              for m in graph.members)
+        self.links: Dict[Typing, AliasTable[Pokemon]] = dict()
+        for i, typing in enumerate(graph.typings):
+            following = sorted((p for j in graph.neighbours[i] for p in graph.members[j]), key=lambda p: p.name)
+            self.links[typing] = AliasTable(following, [p.weight for p in following])
+        self.typing_weight: Tuple[float, ...] = tuple(sum(table.weights) for table in self.members)
+
+    @staticmethod
+    def of(data: PokemonMap) -> WeightTables:
+        return data.table(WeightTables, lambda: WeightTables(TypingGraph.of(data)))
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from typing import Optional, Tuple, List, Any, Iterable
+from functools import lru_cache
+import os
+import json
+import zlib
+import base64
+
+# Bodies smaller than this are sent as they are, since compressing them saves less than it costs.
+COMPRESSION_THRESHOLD = 1024
+COMPRESSION_LEVEL = 6
+
+# zlib window bits that select the container format of each content coding
+_WBITS = {"gzip": 16 + zlib.MAX_WBITS, "deflate": zlib.MAX_WBITS}
+_PLACEHOLDER = "\0fragment:%s:%d\0"
+
+
+class Fragment:
+    """
+    A piece of already serialized JSON, which dumps() splices into its output as-is.  Splicing has a fixed
+    cost of its own, so this only pays off for large values, e.g. lists of several dozen names or more.
+    """
+
+    __slots__ = ["text"]
+
+    def __init__(self, text: str):
+        self.text = text
+
+
+@lru_cache(maxsize=4096)
+def names_fragment(names: Tuple[str, ...]) -> Fragment:
+    """
+    The serialized JSON array of the given names, kept for reuse, since the same lists (e.g. autocomplete
+    suggestions for popular prefixes) are sent over and over.
+    """
+    return Fragment("[" + ", ".join(_string(name) for name in names) + "]")
+
+
+@lru_cache(maxsize=8192)
+def _string(value: str) -> str:
+    return json.dumps(value)
+
+
+def dumps(obj: Any) -> str:
+    """
+    Serializes the object as json.dumps() would, except that Fragments are copied into the output verbatim
+    instead of being serialized again.  The rest is left to the C encoder: each Fragment is swapped for a
+    placeholder string, unique to the call, which is replaced by the fragment's text afterwards.  Objects
+    without Fragments are tried with plain json.dumps() first, which reuses its default encoder, so they
+    cost no more than with json.dumps() itself.
+    """
+    try:
+        return json.dumps(obj)
+    except TypeError:
+        pass
+
+    fragments: List[str] = []
+    token = os.urandom(8).hex()
+
+    def default(o: Any) -> Any:
+        if isinstance(o, Fragment):
+            fragments.append(o.text)
+            return _PLACEHOLDER % (token, len(fragments) - 1)
+        raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+    text = json.dumps(obj, default=default)
+    for i, fragment in enumerate(fragments):
+        text = text.replace(json.dumps(_PLACEHOLDER % (token, i)), fragment, 1)
+    return text
+
+
+#
+
+
+def negotiate(accept_encoding: Optional[str], supported: Iterable[str] = ("gzip", "deflate")) -> Optional[str]:
+    """
+    Picks the content coding to respond with, from an Accept-Encoding header: the supported coding with the
+    highest quality value, preferring them in the given order on ties, or None if the client accepts none.
+    """
+    if not accept_encoding:
+        return None
+    qualities = dict()
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.strip().lower()] = quality
+
+    best, best_quality = None, 0.0
+    for coding in supported:
+        quality = qualities.get(coding, qualities.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+def encode_body(body: str, coding: Optional[str],
+                threshold: int = COMPRESSION_THRESHOLD) -> Tuple[str, Optional[str]]:
+    """
+    Compresses a response body with the given content coding, if it is large enough to be worth it, and
+    base64-encodes the result, as API Gateway expects binary bodies to be.
+
+    :return: The body, and the content coding applied to it (None if it was left as it is).
+    """
+    data = body.encode("utf-8")
+    if coding not in _WBITS or len(data) < threshold:
+        return body, None
+    compressor = zlib.compressobj(COMPRESSION_LEVEL, zlib.DEFLATED, _WBITS[coding])
+    compressed = compressor.compress(data) + compressor.flush()
+    return base64.b64encode(compressed).decode("ascii"), coding
@@ -1,29 +1,83 @@
 from __future__ import annotations
 
 from Interfaces import JSONable
+from Lambda import Encoding
 from Errors import APIError, AWSError, ExecutionError
 from Utilty import DictUtils, TimeUtils
 
 import json
-from typing import Optional, Union, Dict, Any, Type, List
+from typing import Optional, Union, Dict, Any, Type, List, Callable
 from datetime import datetime
 
 _QueryValue = Union[str, int, float, bool, datetime, dict]
 QueryValue = Union[_QueryValue, Type[_QueryValue]]
 
+WARM_UP_KEY = "warmup"
 
-class Wrapper:
 
-    def __init__(self, event: dict, context: dict, verbose: bool = False):
+class _WarmUp(Exception):
+    pass
+
+
+class Wrapper:
+    """
+    Wraps the handling of a single invocation, parsing its arguments and turning its result or error into
+    a response.
+
+    Warm-up events (see is_warm_up()) are recognized before any arguments are parsed.  For those, the given
+    warm_up function is run to initialize the container, and the handler body is cut short the moment it
+    reads its arguments, with a response that only acknowledges the warm-up.  If the warm-up fails, its error
+    is turned into the response instead, as the handler's own errors are.
+    """
+
+    def __init__(self, event: dict, context: dict, verbose: bool = False,
+                 warm_up: Optional[Callable[[], None]] = None,
+                 compression_threshold: int = Encoding.COMPRESSION_THRESHOLD):
         self._result: Optional[dict] = None
         self._status_code: Optional[int] = None
-        self.args: LambdaArguments = LambdaArguments.parse_event(event)
+        self.warming_up = Wrapper.is_warm_up(event)
+        self._args: Optional[LambdaArguments] = None if self.warming_up else LambdaArguments.parse_event(event)
         self._verbose = verbose
-        self.response_headers = {"Content-Type": "application/json"}
-        if verbose:
+        # Any response may be compressed depending on the client's Accept-Encoding, so caches have to key on it
+        self.response_headers = {"Content-Type": "application/json", "Vary": "Accept-Encoding"}
+        self._content_coding = Encoding.negotiate(Wrapper._header(event, "Accept-Encoding"))
+        self._compression_threshold = compression_threshold
+        self._warm_up_error: Optional[Exception] = None
+        if self.warming_up:
+            if warm_up is not None:
+                # Raising here would escape the with statement, so the error is kept for __exit__ to report
+                try:
+                    warm_up()
+                except Exception as e:
+                    self._warm_up_error = e
+        elif verbose:
             print("EVENT = " + json.dumps(event))
             print(str(self.args))
 
+    @staticmethod
+    def is_warm_up(event: Any) -> bool:
+        """
+        Whether the event is a keep-warm ping: either {"warmup": true} or an EventBridge scheduled event.
+        """
+        if not isinstance(event, dict):
+            return False
+        return bool(event.get(WARM_UP_KEY)) or \
+            (event.get("source") == "aws.events" and event.get("detail-type") == "Scheduled Event")
+
+    @staticmethod
+    def _header(event: Any, name: str) -> Optional[str]:
+        headers = event.get("headers") if isinstance(event, dict) else None
+        if not headers:
+            return None
+        name = name.lower()
+        return next((v for k, v in headers.items() if k.lower() == name), None)
+
+    @property
+    def args(self) -> LambdaArguments:
+        if self._args is None:
+            raise _WarmUp()
+        return self._args
+
     @property
     def result(self) -> dict:
         return self._result
@@ -32,7 +86,7 @@ class Wrapper:
         self._result = result.to_json() if isinstance(result, JSONable) else result
         self._status_code = status_code
         if self._verbose:
-            print(f"Set result ({self._status_code}): {json.dumps(self._result)}")
+            print(f"Set result ({self._status_code}): {Encoding.dumps(self._result)}")
 
     def add_cors_header(self):
         self.response_headers["Access-Control-Allow-Origin"] = "*"
@@ -41,37 +95,41 @@ class Wrapper:
         return self
 
     def __exit__(self, exc_type, exc_value, tb):
+        if self.warming_up and (exc_type is None or exc_type == _WarmUp):
+            if self._warm_up_error is None:
+                self._result = self._response(200, json.dumps({WARM_UP_KEY: True}))
+                return True
+            exc_type, exc_value = type(self._warm_up_error), self._warm_up_error
         if exc_type == ExecutionError:
-            self._result = {
-                "statusCode": exc_value.http_status_code,
-                "headers": self.response_headers,
-                "body": json.dumps(exc_value.to_json())
-            }
+            self._result = self._response(exc_value.http_status_code, json.dumps(exc_value.to_json()))
             print(f"ERROR: {json.dumps(exc_value.to_json())}")
         elif exc_type is not None:
             e = ExecutionError.wrap(exc_value)
-            self._result = {
-                "statusCode": e.http_status_code,
-                "headers": self.response_headers,
-                "body": json.dumps(e.to_json())
-            }
+            self._result = self._response(e.http_status_code, json.dumps(e.to_json()))
             print(f"ERROR: {json.dumps(e.to_json())}")
         elif self._result is not None:
-            self._result = {
-                "statusCode": self._status_code if self._status_code is not None else 200,
-                "headers": self.response_headers,
-                "body": json.dumps(self._result)
-            }
+            self._result = self._response(self._status_code if self._status_code is not None else 200,
+                                          Encoding.dumps(self._result))
         else:
-            self._result = {
-                "statusCode": 204,
-                "headers": self.response_headers,
-                "body": "{}"
-            }
+            self._result = self._response(204, "{}")
         if self._verbose:
             print(f"Result = {json.dumps(self._result)}")
         return True
 
+    def _response(self, status_code: int, body: str) -> dict:
+        # Bodies are compressed when the client accepts it and they are large enough, in which case they are
+        # sent base64-encoded, as API Gateway requires of binary bodies.
+        body, coding = Encoding.encode_body(body, self._content_coding, threshold=self._compression_threshold)
+        response = {
+            "statusCode": status_code,
+            "headers": self.response_headers,
+            "body": body
+        }
+        if coding is not None:
+            response["headers"] = {**self.response_headers, "Content-Encoding": coding}
+            response["isBase64Encoded"] = True
+        return response
+
 
 class LambdaArguments:
 
@@ -177,7 +235,7 @@ class LambdaArguments:
         elif val_type == bool:
             if v.lower() in ["t", "true", "tru", "yes", "y", "1"]:
                 return True
-            elif v.lower in ["f", "false", "fal", "no", "n", "0"]:
+            elif v.lower() in ["f", "false", "fal", "no", "n", "0"]:
                 return False
             return None
         elif val_type == datetime:
@@ -1,52 +1,379 @@
 
 from Data import *
-from Game.Generate import Generator
+from Game.Generate import Generator, NoSequenceError
+from Game.Difficulty import BranchingTable, parse_band
+from Game.Rules import Rules
+from Game import Validate
+from Game.Solver import Solver
+from Game.TypingGraph import TypingGraph
+from Game.PathFind import PathFinder
+from Game import Portfolio
+from Game.History import ChainHistory
+from Game.ShareCode import ShareCodec
+from Game.Lookup import NameIndex
+from Game.Reservoir import ChainReservoir
+from Game.Puzzle import PuzzleGenerator
+from Game.Links import LinkIndex, DEFAULT_LINK_RULE, link_rule
 from Lambda.Wrapper import Wrapper
+from Lambda import Encoding
+from Errors import ExecutionError, ErrorType
 
+import os
 import json
-from typing import Tuple, Collection, Optional
+from functools import lru_cache
+from typing import Tuple, Collection, Optional, List, Sequence
 
 
 INPUT = "./dex_clean.csv"
+WEIGHTS = "./dex_weights.csv"
+# Other datasets, as <id>.csv files (with optional <id>_weights.csv files), which requests pick with "dex"
+DATASETS = "./dexes"
+DEFAULT_DEX = "national"
+DATASET_MEMORY_CAP = 64 * 1024 * 1024
+HISTORY = "./history.bin"
+POOL = "./reservoir.jsonl"
+DEFAULT_RULES = Rules(length=5, typing_limit=1, type_limit=3, allow_monotype=True)
+# Rules popular enough to keep ready-made chains for
+RESERVED_RULES = (DEFAULT_RULES,)
+# Puzzles hide every Pokémon but the first and last, and with more than one hidden, unique answers are rare
+PUZZLE_LENGTH = 3
+PUZZLE_BUDGET = 500
+# Path-finding gets hard, and with the default limits impossible, for much longer chains than this
+MAX_STEPS = 24
+# Seeds raced at once, at most, when a request opts into racing
+MAX_WORKERS = 4
+# Seconds a race may take before it is abandoned for an in-process generation, so that a worker that hangs
+# can't hold the invocation until the function times out
+RACE_TIMEOUT = 10.0
 
 
 def main(event, context):
-    with Wrapper(event, context) as w:
+    with Wrapper(event, context, warm_up=warm_up) as w:
         w.add_cors_header()
 
-        length: int = w.args.get_query("length", val_type=int, default=5)
-        typing_limit: int = w.args.get_query("typing_limit", val_type=int, default=1)
-        type_limit: int = w.args.get_query("type_limit", val_type=int, default=3)
-        allow_monotype: bool = w.args.get_query("allow_monotype", val_type=bool, default=True)
+        rules = parse_rules(w)
         set_as_daily: bool = w.args.get_query("set_as_daily", val_type=bool, default=False)
+        avoid_history: bool = w.args.get_query("avoid_history", val_type=bool, default=set_as_daily)
         random_seed: Optional[int] = w.args.get_query("random_seed", val_type=int, default=None)
+        min_difficulty: Optional[float] = w.args.get_query("min_difficulty", val_type=float, default=None)
+        max_difficulty: Optional[float] = w.args.get_query("max_difficulty", val_type=float, default=None)
+        # Racing seeds costs more in forking than it saves for typical rules, so it is only done when asked for
+        workers: int = w.args.get_query("workers", val_type=int, default=1)
+        links: str = w.args.get_query("links", default=DEFAULT_LINK_RULE)
+        dex = parse_dex(w)
+        output_format = parse_format(w)
 
-        print(f"LENGTH = {length}, TYPING_LIMIT = {typing_limit}, TYPE_LIMIT = {type_limit}, "
-              f"ALLOW_MONOTYPE = {'True' if allow_monotype else 'False'}, "
+        try:
+            difficulty = parse_band(min_difficulty, max_difficulty)
+            link_rule(links).check(rules)
+        except ValueError as e:
+            raise ExecutionError(ErrorType.BAD_REQUEST, str(e))
+        if difficulty is not None and links != DEFAULT_LINK_RULE:
+            raise ExecutionError(ErrorType.BAD_REQUEST, "Difficulty targeting only supports the default link rule.")
+        if not 1 <= workers <= MAX_WORKERS:
+            raise ExecutionError(ErrorType.BAD_REQUEST, f"Invalid number of workers: {workers} (expected 1 to {MAX_WORKERS})")
+        if dex != DEFAULT_DEX and (set_as_daily or avoid_history):
+            raise ExecutionError(ErrorType.BAD_REQUEST, f"Dailies and chain history only exist for the {DEFAULT_DEX} dex.")
+
+        print(f"LENGTH = {rules.length}, TYPING_LIMIT = {rules.typing_limit}, TYPE_LIMIT = {rules.type_limit}, "
+              f"ALLOW_MONOTYPE = {'True' if rules.allow_monotype else 'False'}, "
               f"SET_AS_DAILY = {'True' if set_as_daily else 'False'}, "
-              f"RANDOM_SEED = {random_seed}")
+              f"RANDOM_SEED = {random_seed}, DIFFICULTY = {difficulty}, LINKS = {links}, DEX = {dex}")
+
+        data = load_data(dex)
+        history = load_history(data) if avoid_history else None
 
-        generator = Generator(PokemonMap.load_from_csv(INPUT),
-                              length=length,
-                              typing_limit=typing_limit,
-                              type_limit=type_limit,
-                              allow_monotype=allow_monotype,
-                              random_seed=random_seed)
+        def make_generator(seed: Optional[int]) -> Generator:
+            return Generator(data,
+                             length=rules.length,
+                             typing_limit=rules.typing_limit,
+                             type_limit=rules.type_limit,
+                             allow_monotype=rules.allow_monotype,
+                             random_seed=seed,
+                             difficulty=difficulty,
+                             history=history,
+                             link_rule=links)
 
         print("GENERATING SEQUENCE")
 
-        seq = generator.generate()
+        # Without a fixed seed or other criteria, a ready-made chain will do, if there is one
+        reservoir = load_reservoir(data) \
+            if random_seed is None and difficulty is None and history is None and links == DEFAULT_LINK_RULE \
+            and dex == DEFAULT_DEX else None
+        seq = reservoir.take(rules) if reservoir is not None else None
+
+        # Otherwise, without a fixed seed, any seed will do, so several are raced and the first to finish is used
+        portfolio = None
+        try:
+            if seq is not None:
+                print("SERVED FROM RESERVOIR")
+            elif random_seed is None and workers > 1:
+                try:
+                    # Workers are forked, which is only safe with no reservoir thread running
+                    with ChainReservoir.paused():
+                        portfolio = Portfolio.race(data, make_generator, workers, timeout=RACE_TIMEOUT)
+                    seq = portfolio.sequence
+                    print(f"WORKER {portfolio.winner} WON IN {portfolio.elapsed * 1000:.1f}ms "
+                          f"(SEED = {portfolio.seed})")
+                except Portfolio.RaceAbandoned as e:
+                    print(f"RACE ABANDONED, GENERATING IN-PROCESS: {e}")
+                    seq = make_generator(None).generate()
+            else:
+                seq = make_generator(random_seed).generate()
+        except NoSequenceError as e:
+            raise ExecutionError(ErrorType.NO_PATH_FOUND, str(e))
 
         print(f"SEQUENCE:  {' -> '.join(p.name for p in seq)}")
 
         if set_as_daily:
             upload_sequence_as_daily(seq)
+            load_history(data).add(seq)
+
+        result = format_chain(data, seq, output_format)
+        # Difficulty is scored over the typing graph, so it means nothing for chains linked by other rules
+        if links == DEFAULT_LINK_RULE:
+            result["difficulty"] = round(BranchingTable.of(data).score(rules, seq), 4)
+        else:
+            result["links"] = links
+        if portfolio is not None:
+            result["portfolio"] = portfolio.to_json()
+        w.set_result(result)
+
+    return w.result
+
+
+def validate(event, context):
+    with Wrapper(event, context, warm_up=warm_up) as w:
+        w.add_cors_header()
+
+        rules = parse_rules(w)
+        moves: str = w.args.get_query("moves", default="count")
 
-        w.set_result({"seq": [p.name for p in seq]})
+        if moves not in ("none", "count", "list"):
+            raise ExecutionError(ErrorType.BAD_REQUEST, f"Invalid moves option: {moves}")
+
+        data = load_data(parse_dex(w))
+        result = Validate.validate(data, rules, parse_chain(w, data),
+                                   count_moves=moves != "none",
+                                   list_moves=moves == "list")
+
+        w.set_result(result)
 
     return w.result
 
 
+def solve(event, context):
+    with Wrapper(event, context, warm_up=warm_up) as w:
+        w.add_cors_header()
+
+        rules = parse_rules(w)
+        random_seed: Optional[int] = w.args.get_query("random_seed", val_type=int, default=None)
+        output_format = parse_format(w)
+
+        data = load_data(parse_dex(w))
+        validation = Validate.validate(data, rules, parse_chain(w, data), count_moves=False)
+        if not validation.valid:
+            raise ExecutionError(ErrorType.BAD_REQUEST, "Invalid chain.", details=validation.to_json())
+
+        completion = Solver(data, rules, random_seed=random_seed).complete(validation.chain)
+
+        w.set_result({**format_chain(data, validation.chain, output_format),
+                      "completable": completion is not None,
+                      "completion": format_chain(data, completion, output_format)[output_format]
+                      if completion is not None else None})
+
+    return w.result
+
+
+def path(event, context):
+    with Wrapper(event, context, warm_up=warm_up) as w:
+        w.add_cors_header()
+
+        start: Optional[str] = w.args.get_query("start", default=None)
+        end: Optional[str] = w.args.get_query("end", default=None)
+        steps: Optional[int] = w.args.get_query("steps", val_type=int, default=None)
+        max_steps: int = w.args.get_query("max_steps", val_type=int, default=8)
+        random_seed: Optional[int] = w.args.get_query("random_seed", val_type=int, default=None)
+        output_format = parse_format(w)
+        rules = parse_rules(w)
+
+        data = load_data(parse_dex(w))
+        endpoints = [resolve_name(data, name) if name else None for name in (start, end)]
+        if any(p is None for p in endpoints):
+            raise ExecutionError(ErrorType.BAD_REQUEST, "Both 'start' and 'end' must name known Pokémon.")
+        if not 0 <= (steps if steps is not None else max_steps) <= MAX_STEPS:
+            raise ExecutionError(ErrorType.BAD_REQUEST, f"Steps must be between 0 and {MAX_STEPS}.")
+
+        finder = PathFinder(data,
+                            typing_limit=rules.typing_limit,
+                            type_limit=rules.type_limit,
+                            allow_monotype=rules.allow_monotype,
+                            random_seed=random_seed)
+        if steps is not None:
+            seq = finder.find(endpoints[0], endpoints[1], steps)
+        else:
+            seq = finder.find_shortest(endpoints[0], endpoints[1], max_steps)
+
+        if seq is None:
+            raise ExecutionError(ErrorType.NO_PATH_FOUND,
+                                 f"No chain {'found ' if finder.exhausted else ''}"
+                                 f"from {endpoints[0].name} to {endpoints[1].name} "
+                                 f"{f'in {steps}' if steps is not None else f'within {max_steps}'} steps.")
+
+        w.set_result({**format_chain(data, seq, output_format),
+                      "steps": len(seq) - 1})
+
+    return w.result
+
+
+def puzzle(event, context):
+    with Wrapper(event, context, warm_up=warm_up) as w:
+        w.add_cors_header()
+
+        defaults = parse_rules(w)
+        rules = Rules(length=w.args.get_query("length", val_type=int, default=PUZZLE_LENGTH),
+                      typing_limit=defaults.typing_limit,
+                      type_limit=defaults.type_limit,
+                      allow_monotype=defaults.allow_monotype)
+        random_seed: Optional[int] = w.args.get_query("random_seed", val_type=int, default=None)
+        output_format = parse_format(w)
+
+        if rules.length < 3:
+            raise ExecutionError(ErrorType.BAD_REQUEST, f"Invalid puzzle length: {rules.length}")
+
+        data = load_data(parse_dex(w))
+        result = PuzzleGenerator(data, rules, random_seed=random_seed, budget=PUZZLE_BUDGET).generate()
+        if result is None:
+            raise ExecutionError(ErrorType.NO_PATH_FOUND,
+                                 f"No puzzle of length {rules.length} with a unique solution was found.")
+
+        w.set_result({"start": result.start.name,
+                      "end": result.end.name,
+                      "slots": [[t.name for t in typing] for typing in result.middle],
+                      **format_chain(data, result.sequence, output_format),
+                      "attempts": result.attempts})
+
+    return w.result
+
+
+def autocomplete(event, context):
+    with Wrapper(event, context, warm_up=warm_up) as w:
+        w.add_cors_header()
+
+        query: str = w.args.get_query("q", default="")
+        after: Optional[str] = w.args.get_query("after", default=None)
+        limit: int = w.args.get_query("limit", val_type=int, default=10)
+
+        if limit < 1 or limit > 50:
+            raise ExecutionError(ErrorType.BAD_REQUEST, f"Invalid limit: {limit}")
+
+        data = load_data(parse_dex(w))
+        previous = resolve_name(data, after) if after else None
+        if after and previous is None:
+            raise ExecutionError(ErrorType.BAD_REQUEST, f"Unknown Pokémon: {after}")
+
+        matches = NameIndex.of(data).complete(query, limit=limit, after=previous)
+        w.set_result({"matches": Encoding.names_fragment(tuple(p.name for p in matches))})
+
+    return w.result
+
+
+#
+
+
+def parse_rules(w: Wrapper) -> Rules:
+    return Rules(length=w.args.get_query("length", val_type=int, default=DEFAULT_RULES.length),
+                 typing_limit=w.args.get_query("typing_limit", val_type=int, default=DEFAULT_RULES.typing_limit),
+                 type_limit=w.args.get_query("type_limit", val_type=int, default=DEFAULT_RULES.type_limit),
+                 allow_monotype=w.args.get_query("allow_monotype", val_type=bool,
+                                                 default=DEFAULT_RULES.allow_monotype))
+
+
+def warm_up():
+    """
+    Builds everything the handlers would otherwise build on their first request: the dataset, the typing
+    graph, the branching table with its bounds for the default length, the shared feasibility cache, the
+    name index, the default link index and the chain history.  The chain reservoir is filled up too.
+    """
+    data = load_data()
+    graph = TypingGraph.of(data)
+    table = BranchingTable.of(data)
+    table.walk_bound(graph.typings[0], DEFAULT_RULES.length)
+    Solver(data, DEFAULT_RULES).feasible(DEFAULT_RULES.start())
+    NameIndex.of(data)
+    LinkIndex.of(data, DEFAULT_LINK_RULE)
+    load_history(data)
+    load_reservoir(data).fill()
+
+
+def parse_dex(w: Wrapper) -> str:
+    dex: str = w.args.get_query("dex", default=DEFAULT_DEX)
+    if dex not in registry():
+        raise ExecutionError(ErrorType.BAD_REQUEST, f"Unknown dex: {dex}")
+    return dex
+
+
+def parse_format(w: Wrapper) -> str:
+    output_format: str = w.args.get_query("format", default="seq")
+    if output_format not in ("seq", "code"):
+        raise ExecutionError(ErrorType.BAD_REQUEST, f"Invalid format: {output_format}")
+    return output_format
+
+
+def format_chain(data: PokemonMap, chain: Sequence[Pokemon], output_format: str) -> dict:
+    if output_format == "code":
+        return {"code": ShareCodec.of(data).encode(chain)}
+    return {"seq": [p.name for p in chain]}
+
+
+def parse_chain(w: Wrapper, data: PokemonMap) -> List[str]:
+    """
+    Reads a chain given either as a list of names ("chain") or as a share code ("code").
+    """
+    code: Optional[str] = w.args.get_query_or_body_parameter("code", default=None)
+    if code:
+        try:
+            return [p.name for p in ShareCodec.of(data).decode(code)]
+        except ValueError as e:
+            raise ExecutionError(ErrorType.BAD_REQUEST, str(e))
+    chain: List[str] = w.args.get_query_or_body_parameter("chain", delimiter=",", default=[])
+    return [name for name in chain if name.strip()]
+
+
+def resolve_name(data: PokemonMap, name: str) -> Optional[Pokemon]:
+    return data.name(name.strip().upper()) or NameIndex.of(data).exact(name)
+
+
+def load_data(dex: str = DEFAULT_DEX) -> PokemonMap:
+    return registry().get(dex)
+
+
+@lru_cache(maxsize=1)
+def registry() -> DatasetRegistry:
+    # Kept for the lifetime of the container, so warm invocations reuse the datasets and every table that is
+    # cached on them.  The default dex is pinned, since the history and reservoir are built on it.  Choices
+    # are weighted only if a weights file is deployed.
+    return DatasetRegistry.from_directory(DATASETS, DATASET_MEMORY_CAP,
+                                          extra={DEFAULT_DEX: (INPUT, WEIGHTS if os.path.exists(WEIGHTS) else None)},
+                                          pinned=(DEFAULT_DEX,))
+
+
+@lru_cache(maxsize=1)
+def load_history(data: PokemonMap) -> ChainHistory:
+    # The deployed history file is read-only, so dailies issued since are only remembered in memory, for the
+    # lifetime of the container.
+    return ChainHistory.load(data, HISTORY) if os.path.exists(HISTORY) else ChainHistory(data)
+
+
+@lru_cache(maxsize=1)
+def load_reservoir(data: PokemonMap) -> ChainReservoir:
+    # Seeded from the deployed pool file if there is one, and kept topped up in the background from then on
+    reservoir = ChainReservoir.load(data, POOL, RESERVED_RULES) if os.path.exists(POOL) \
+        else ChainReservoir(data, RESERVED_RULES)
+    reservoir.start()
+    return reservoir
+
+
 #
 
 
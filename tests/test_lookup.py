@@ -0,0 +1,55 @@
+import os
+import sys
+import random
+import unittest
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+sys.path.insert(0, SRC)
+
+from Data import PokemonMap
+from Game.Lookup import NameIndex, edit_distance, normalize
+
+
+class TestTypoSearch(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.index = NameIndex(PokemonMap.load_from_csv(os.path.join(SRC, "dex_clean.csv")))
+
+    def brute_force(self, query: str, distance: int):
+        found = [(k, edit_distance(query, k, distance)) for k in self.index.keys]
+        found = [(k, d) for k, d in found if d <= distance]
+        if not found:
+            return set()
+        best = min(d for _, d in found)
+        return {k for k, d in found if d == best}
+
+    def check(self, query: str, distance: int):
+        found = {normalize(p.name) for p in self.index.search(query, max_distance=distance)}
+        self.assertEqual(found, self.brute_force(query, distance), query)
+
+    def test_common_typos(self):
+        for query, name in (("ABAR", "ABRA"), ("MWE", "MEW"), ("ONXI", "ONIX"), ("EKNAS", "EKANS"),
+                            ("GOELM", "GOLEM"), ("PIKACHUU", "PIKACHU"), ("PKACHU", "PIKACHU")):
+            self.assertIn(name, {p.name for p in self.index.search(query)}, query)
+            self.assertIn(name, {p.name for p in self.index.complete(query)}, query)
+
+    def test_matches_brute_force(self):
+        rand = random.Random(0)
+        keys = [k for k in self.index.keys if len(k) >= 3]
+        for _ in range(300):
+            key = list(rand.choice(keys))
+            i = rand.randrange(len(key) - 1)
+            edit = rand.choice(("transpose", "insert", "delete"))
+            if edit == "transpose":
+                key[i], key[i + 1] = key[i + 1], key[i]
+            elif edit == "insert":
+                key.insert(i, rand.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ"))
+            else:
+                del key[i]
+            for distance in (1, 2):
+                self.check("".join(key), distance)
+
+
+if __name__ == "__main__":
+    unittest.main()
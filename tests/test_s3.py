@@ -0,0 +1,117 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+import boto3
+from botocore.stub import Stubber, ANY
+
+from AWS import S3
+from AWS.Package import file_digest
+from Errors.AWSError import AWSError
+
+BUCKET = "bucket"
+KEY = "package.zip"
+
+
+class TestUpload(unittest.TestCase):
+
+    def setUp(self):
+        self.s3 = boto3.client("s3", region_name="us-east-1",
+                               aws_access_key_id="testing", aws_secret_access_key="testing")
+        self.stubber = Stubber(self.s3)
+        self.stubber.activate()
+        patcher = mock.patch.object(S3.Clients, "client", return_value=self.s3)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.stubber.deactivate)
+
+        fd, self.filename = tempfile.mkstemp()
+        with os.fdopen(fd, "wb") as f:
+            f.write(b"0123456789")
+        self.addCleanup(os.remove, self.filename)
+        self.digest = file_digest(self.filename)
+
+    def upload(self, **kwargs) -> dict:
+        # One worker, so that parts are uploaded in the order the stubbed responses are queued
+        return S3.upload(self.filename, BUCKET, KEY, max_workers=1, **kwargs)
+
+    def expect_head(self, digest: str):
+        self.stubber.add_response("head_object", {"Metadata": {S3.DIGEST_METADATA_KEY: digest}},
+                                  {"Bucket": BUCKET, "Key": KEY})
+
+    def expect_put(self):
+        self.stubber.add_response("put_object", {"ETag": '"etag"'},
+                                  {"Bucket": BUCKET, "Key": KEY, "Body": ANY,
+                                   "Metadata": {S3.DIGEST_METADATA_KEY: self.digest}})
+
+    def expect_multipart(self, failing_part: int = 0):
+        target = {"Bucket": BUCKET, "Key": KEY, "UploadId": "upload"}
+        self.stubber.add_response("create_multipart_upload", {"UploadId": "upload"},
+                                  {"Bucket": BUCKET, "Key": KEY, "Metadata": {S3.DIGEST_METADATA_KEY: self.digest}})
+        for number, body in enumerate((b"0123", b"4567", b"89"), start=1):
+            if number == failing_part:
+                self.stubber.add_client_error("upload_part", service_error_code="InternalError",
+                                              http_status_code=500)
+                self.stubber.add_response("abort_multipart_upload", {}, target)
+                return
+            self.stubber.add_response("upload_part", {"ETag": f'"part{number}"'},
+                                      {"PartNumber": number, "Body": body, **target})
+        self.stubber.add_response("complete_multipart_upload", {"ETag": '"whole"'},
+                                  {"MultipartUpload": {"Parts": [{"PartNumber": n, "ETag": f'"part{n}"'}
+                                                                 for n in (1, 2, 3)]},
+                                   **target})
+
+    #
+
+    def test_skips_unchanged(self):
+        self.expect_head(self.digest)
+        self.assertTrue(self.upload().get("Skipped"))
+        self.stubber.assert_no_pending_responses()
+
+    def test_uploads_changed(self):
+        self.expect_head("stale")
+        self.expect_put()
+        self.assertEqual(self.upload()["ETag"], '"etag"')
+        self.stubber.assert_no_pending_responses()
+
+    def test_uploads_missing(self):
+        for code in ("404", "NoSuchKey", "NotFound"):
+            self.stubber.add_client_error("head_object", service_error_code=code, http_status_code=404)
+            self.expect_put()
+            self.assertFalse(self.upload().get("Skipped"), code)
+        self.stubber.assert_no_pending_responses()
+
+    def test_uploads_unchanged_when_forced(self):
+        self.expect_put()
+        self.assertFalse(self.upload(skip_unchanged=False).get("Skipped"))
+        self.stubber.assert_no_pending_responses()
+
+    def test_fails_on_other_errors(self):
+        # Only a missing object means there is nothing to compare against
+        self.stubber.add_client_error("head_object", service_error_code="403", http_status_code=403)
+        with self.assertRaises(AWSError):
+            self.upload()
+        self.stubber.assert_no_pending_responses()
+
+    def test_multipart(self):
+        self.expect_head("stale")
+        self.expect_multipart()
+        self.assertEqual(self.upload(multipart_threshold=10, part_size=4)["ETag"], '"whole"')
+        self.stubber.assert_no_pending_responses()
+
+    def test_multipart_aborts_on_failure(self):
+        self.expect_head("stale")
+        self.expect_multipart(failing_part=3)
+        with self.assertRaises(AWSError):
+            self.upload(multipart_threshold=10, part_size=4)
+        self.stubber.assert_no_pending_responses()
+
+
+if __name__ == "__main__":
+    unittest.main()